@@ -7,14 +7,17 @@ from .base import (
 )
 from .gemini import GeminiProvider
 from .openrouter import AsyncOpenRouterProvider, OpenRouterProvider
+from .sessions import ChatSessionPool, SessionPoolMetrics
 
 __all__ = [
     "AsyncOpenRouterProvider",
     "BaseAIProvider",
     "ChatRequest",
+    "ChatSessionPool",
     "CompletionRequest",
     "GeminiProvider",
     "GenerationConfig",
     "ModelResponse",
     "OpenRouterProvider",
+    "SessionPoolMetrics",
 ]
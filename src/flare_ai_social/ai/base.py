@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any, Protocol, TypedDict, runtime_checkable
 
@@ -73,6 +74,53 @@ class BaseAIProvider(ABC):
             ModelResponse containing the response text and metadata
         """
 
+    @abstractmethod
+    async def agenerate_content(
+        self,
+        prompt: str,
+        response_mime_type: str | None = None,
+        response_schema: Any | None = None,
+    ) -> ModelResponse:
+        """Asynchronously generate a response without conversation context
+
+        Awaitable counterpart of `generate_content` for use inside an event loop,
+        so a slow completion does not block other coroutines.
+
+        Args:
+            prompt: Input text prompt
+            response_mime_type: Expected response format
+                (e.g., "text/plain", "application/json")
+            response_schema: Expected response structure schema
+
+        Returns:
+            ModelResponse containing the generated text and metadata
+        """
+
+    @abstractmethod
+    async def asend_message(self, msg: str) -> ModelResponse:
+        """Asynchronously send a message in a conversational context
+
+        Args:
+            msg: Input message text
+
+        Returns:
+            ModelResponse containing the response text and metadata
+        """
+
+    @abstractmethod
+    def astream_content(self, prompt: str) -> AsyncIterator[str]:
+        """Stream a response without conversation context
+
+        Yields text as the model produces it, so callers can show the start of
+        the answer before generation has finished.
+
+        Args:
+            prompt: Input text prompt
+
+        Returns:
+            Async iterator over successive chunks of the response text
+        """
+
 
 class Message(TypedDict):
     role: str
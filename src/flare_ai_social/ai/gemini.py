@@ -6,10 +6,15 @@ with Google's Generative AI service. It handles chat sessions, content generatio
 and message management while maintaining a consistent AI personality.
 """
 
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any, override
 
 import google.generativeai as genai
 import structlog
+from google.generativeai.types import (
+    AsyncGenerateContentResponse,
+    GenerateContentResponse,
+)
 
 from flare_ai_social.ai.base import BaseAIProvider, ModelResponse
 
@@ -100,14 +105,53 @@ class GeminiProvider(BaseAIProvider):
                 response_mime_type=response_mime_type, response_schema=response_schema
             ),
         )
-        return ModelResponse(
-            text=response.text,
-            raw_response=response,
-            metadata={
-                "candidate_count": len(response.candidates),
-                "prompt_feedback": response.prompt_feedback,
-            },
+        return self._to_model_response(response)
+
+    @override
+    async def agenerate_content(
+        self,
+        prompt: str,
+        response_mime_type: str | None = None,
+        response_schema: Any | None = None,
+    ) -> ModelResponse:
+        """
+        Generate content using the Gemini model without blocking the event loop.
+
+        Uses the native async transport of the Gemini client, so other coroutines
+        keep running while the completion is in flight.
+
+        Args:
+            prompt (str): Input prompt for content generation
+            response_mime_type (str | None): Expected MIME type for the response
+            response_schema (Any | None): Schema defining the response structure
+
+        Returns:
+            ModelResponse: Generated content with metadata, see `generate_content`
+        """
+        response = await self.model.generate_content_async(
+            prompt,
+            generation_config=genai.GenerationConfig(
+                response_mime_type=response_mime_type, response_schema=response_schema
+            ),
         )
+        return self._to_model_response(response)
+
+    @override
+    async def astream_content(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream content from the Gemini model as it is generated.
+
+        Args:
+            prompt (str): Input prompt for content generation
+
+        Yields:
+            str: Successive chunks of the generated text
+        """
+        response = await self.model.generate_content_async(prompt, stream=True)
+        async for chunk in response:
+            # Chunks without parts, e.g. a final safety-rating update, carry no text
+            if chunk.parts:
+                yield chunk.text
 
     @override
     def send_message(
@@ -134,6 +178,95 @@ class GeminiProvider(BaseAIProvider):
             self.chat = self.model.start_chat(history=self.chat_history)
         response = self.chat.send_message(msg)
         self.logger.debug("send_message", msg=msg, response_text=response.text)
+        return self._to_model_response(response)
+
+    @override
+    async def asend_message(
+        self,
+        msg: str,
+    ) -> ModelResponse:
+        """
+        Send a message in a chat session without blocking the event loop.
+
+        Initializes a new chat session if none exists, using the current chat history.
+
+        Args:
+            msg (str): Message to send to the chat session
+
+        Returns:
+            ModelResponse: Response from the chat session, see `send_message`
+        """
+        if not self.chat:
+            self.chat = self.start_session(self.chat_history)
+        return await self.asend_session_message(self.chat, msg)
+
+    def start_session(
+        self, history: "list[ContentDict] | None" = None
+    ) -> genai.ChatSession:
+        """
+        Start a chat session independent of the provider's own session.
+
+        Sessions share the configured model, so many conversations can be held
+        at once, e.g. one per Telegram chat.
+
+        Args:
+            history (list[ContentDict] | None): Earlier turns to resume from
+
+        Returns:
+            genai.ChatSession: New session on this provider's model
+        """
+        return self.model.start_chat(history=history or [])
+
+    async def asend_session_message(
+        self, chat: genai.ChatSession, msg: str
+    ) -> ModelResponse:
+        """
+        Send a message in a given chat session without blocking the event loop.
+
+        Args:
+            chat (genai.ChatSession): Session from `start_session`
+            msg (str): Message to send to the chat session
+
+        Returns:
+            ModelResponse: Response from the chat session, see `send_message`
+        """
+        response = await chat.send_message_async(msg)
+        self.logger.debug("asend_message", msg=msg, response_text=response.text)
+        return self._to_model_response(response)
+
+    async def astream_session_message(
+        self, chat: genai.ChatSession, msg: str
+    ) -> AsyncIterator[str]:
+        """
+        Stream a reply in a given chat session as it is generated.
+
+        The turn is added to the session's history once the stream is exhausted.
+
+        Args:
+            chat (genai.ChatSession): Session from `start_session`
+            msg (str): Message to send to the chat session
+
+        Yields:
+            str: Successive chunks of the generated text
+        """
+        response = await chat.send_message_async(msg, stream=True)
+        async for chunk in response:
+            if chunk.parts:
+                yield chunk.text
+
+    def _to_model_response(
+        self,
+        response: GenerateContentResponse | AsyncGenerateContentResponse,
+    ) -> ModelResponse:
+        """
+        Wrap a Gemini response in the provider-agnostic ModelResponse.
+
+        Args:
+            response: Sync or async Gemini response object
+
+        Returns:
+            ModelResponse: Response text, raw response and candidate metadata
+        """
         return ModelResponse(
             text=response.text,
             raw_response=response,
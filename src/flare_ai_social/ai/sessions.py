@@ -0,0 +1,219 @@
+"""
+Chat Session Pool Module
+
+This module keeps one Gemini chat session per conversation, e.g. per Telegram
+chat, so follow-up questions are answered with the earlier turns as context.
+Memory stays bounded however many conversations there are: the pool holds at
+most a fixed number of live sessions in least-recently-used order, drops
+sessions that have been idle too long, and caps each session's history to its
+most recent turns. With a state store attached, evicted sessions are spilled to
+disk and resumed transparently when the conversation continues.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+
+import google.generativeai as genai
+import structlog
+from google.generativeai.types import BrokenResponseError, IncompleteIterationError
+
+from flare_ai_social.ai.base import ModelResponse
+from flare_ai_social.ai.gemini import GeminiProvider
+from flare_ai_social.storage import StateStore
+
+logger = structlog.get_logger(__name__)
+
+SESSIONS_NAMESPACE = "chat_sessions"
+
+
+@dataclass(frozen=True)
+class SessionPoolMetrics:
+    """Occupancy and churn of a session pool"""
+
+    active: int
+    hits: int  # Messages sent in a live session
+    restored: int  # Sessions resumed from the state store
+    created: int  # Sessions started without history
+    evicted: int  # Sessions dropped for size or idleness
+
+
+@dataclass
+class _Session:
+    chat: genai.ChatSession
+    last_used: float
+    discarded: bool = False  # Reset while a reply was in flight
+
+
+class ChatSessionPool:
+    """
+    Bounded LRU pool of per-conversation chat sessions.
+
+    Attributes:
+        provider (GeminiProvider): Provider whose model the sessions run on
+        max_sessions (int): Live sessions kept in memory
+        idle_timeout (float): Seconds of inactivity before a session is evicted
+        max_history (int): Messages (user and model turns) kept per session
+        store (StateStore | None): Where evicted sessions are spilled, if anywhere
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        provider: GeminiProvider,
+        *,
+        max_sessions: int = 256,
+        idle_timeout: float = 1800.0,
+        max_history: int = 20,
+        store: StateStore | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.provider = provider
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        # Whole exchanges only, so a trimmed history still starts with a user turn
+        self.max_history = max_history - max_history % 2
+        self.store = store
+        self._clock = clock
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self._hits = 0
+        self._restored = 0
+        self._created = 0
+        self._evicted = 0
+
+    async def send(self, key: str | int, msg: str) -> ModelResponse:
+        """
+        Send a message in a conversation's session.
+
+        Args:
+            key: Conversation identifier, e.g. a chat ID
+            msg: Message text
+
+        Returns:
+            ModelResponse from the session
+        """
+        key = str(key)
+        session = await self._checkout(key)
+        try:
+            return await self.provider.asend_session_message(session.chat, msg)
+        finally:
+            self._checkin(key, session)
+
+    async def stream(self, key: str | int, msg: str) -> AsyncIterator[str]:
+        """
+        Stream a reply in a conversation's session.
+
+        Args:
+            key: Conversation identifier, e.g. a chat ID
+            msg: Message text
+
+        Yields:
+            Successive chunks of the reply
+        """
+        key = str(key)
+        session = await self._checkout(key)
+        try:
+            async for chunk in self.provider.astream_session_message(session.chat, msg):
+                yield chunk
+        finally:
+            self._checkin(key, session)
+
+    def reset(self, key: str | int) -> None:
+        """Forget a conversation, in memory and in the state store."""
+        key = str(key)
+        if session := self._sessions.pop(key, None):
+            session.discarded = True
+        if self.store:
+            self.store.delete(SESSIONS_NAMESPACE, key)
+
+    def close(self) -> None:
+        """Spill every live session, e.g. before the state store is closed."""
+        for key, session in self._sessions.items():
+            self._spill(key, session)
+        self._sessions.clear()
+
+    def metrics(self) -> SessionPoolMetrics:
+        """Return pool occupancy and churn counters."""
+        return SessionPoolMetrics(
+            active=len(self._sessions),
+            hits=self._hits,
+            restored=self._restored,
+            created=self._created,
+            evicted=self._evicted,
+        )
+
+    async def _checkout(self, key: str) -> _Session:
+        """Return the live session for a key, resuming or starting it if needed."""
+        now = self._clock()
+        self._evict_idle(now)
+        if session := self._sessions.get(key):
+            self._sessions.move_to_end(key)
+            session.last_used = now
+            self._hits += 1
+            return session
+
+        history = None
+        if self.store:
+            history = await self.store.get(SESSIONS_NAMESPACE, key)
+            # Another message for the same key may have resumed it meanwhile
+            if session := self._sessions.get(key):
+                self._hits += 1
+                return session
+        if history:
+            self._restored += 1
+        else:
+            self._created += 1
+        session = _Session(self.provider.start_session(history), now)
+        self._sessions[key] = session
+        while len(self._sessions) > self.max_sessions:
+            self._evict(next(iter(self._sessions)))
+        return session
+
+    def _checkin(self, key: str, session: _Session) -> None:
+        """Trim a session's history after a turn and mark it recently used."""
+        chat = session.chat
+        try:
+            history = chat.history
+        except (BrokenResponseError, IncompleteIterationError):
+            # Blocked or abandoned reply: drop the turn, keep the conversation
+            chat.rewind()
+            history = chat.history
+        if len(history) > self.max_history:
+            chat.history = history[len(history) - self.max_history :]
+        session.last_used = self._clock()
+        if self._sessions.get(key) is session:
+            self._sessions.move_to_end(key)
+        elif not session.discarded:
+            # Evicted while the reply was generated, so the spilled copy is stale
+            self._spill(key, session)
+
+    def _evict_idle(self, now: float) -> None:
+        """Evict sessions idle for longer than idle_timeout, oldest first."""
+        idle = []
+        for key, session in self._sessions.items():
+            if now - session.last_used < self.idle_timeout:
+                break
+            idle.append(key)
+        for key in idle:
+            self._evict(key)
+
+    def _evict(self, key: str) -> None:
+        """Drop a live session, spilling it to the state store."""
+        self._spill(key, self._sessions.pop(key))
+        self._evicted += 1
+        logger.debug("Chat session evicted", key=key)
+
+    def _spill(self, key: str, session: _Session) -> None:
+        """Buffer a session's history in the state store, if one is attached."""
+        if not self.store:
+            return
+        try:
+            contents = session.chat.history
+        except IncompleteIterationError:
+            # Still streaming a reply; the session is spilled when it completes
+            return
+        history = [
+            {"role": content.role, "parts": [part.text for part in content.parts]}
+            for content in contents
+        ]
+        self.store.set(SESSIONS_NAMESPACE, key, history)
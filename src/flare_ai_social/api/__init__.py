@@ -1,3 +1,4 @@
 from .routes.chat import ChatMessage, ChatRouter, router
+from .routes.telegram import TelegramWebhookRouter
 
-__all__ = ["ChatMessage", "ChatRouter", "router"]
+__all__ = ["ChatMessage", "ChatRouter", "TelegramWebhookRouter", "router"]
@@ -11,11 +11,14 @@ The module provides a ChatRouter class that integrates various services:
 - Prompt management through PromptService
 """
 
+import math
+
 import structlog
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, status
 from pydantic import BaseModel, Field
 
 from flare_ai_social.ai import GeminiProvider
+from flare_ai_social.quota import SOURCE_API, QuotaExceededError, QuotaManager
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
@@ -42,20 +45,25 @@ class ChatRouter:
 
     Attributes:
         ai (GenerativeModel): Provider for AI capabilities
+        quota (QuotaManager | None): LLM request quotas shared with the bots
     """
 
     def __init__(
         self,
         ai: GeminiProvider,
+        quota: QuotaManager | None = None,
     ) -> None:
         """
         Initialize the ChatRouter with required service providers.
 
         Args:
             ai: Provider for AI capabilities
+            quota: LLM request quotas, charged per client address. Unlimited
+                   if omitted.
         """
         self._router = APIRouter()
         self.ai = ai
+        self.quota = quota
         self.logger = logger.bind(router="chat")
         self._setup_routes()
 
@@ -66,26 +74,37 @@ class ChatRouter:
         """
 
         @self._router.post("/")
-        async def chat(message: ChatMessage) -> dict[str, str]:  # pyright: ignore [reportUnusedFunction]
+        async def chat(message: ChatMessage, request: Request) -> dict[str, str]:  # pyright: ignore [reportUnusedFunction]
             """
             Process incoming chat messages and route them to appropriate handlers.
 
             Args:
                 message: Validated chat message
+                request: Incoming request, whose client address is charged quota
 
             Returns:
                 dict[str, str]: Response containing handled message result
 
             Raises:
-                HTTPException: If message handling fails
+                HTTPException: 429 if the client is over its LLM quota, 500 if
+                    message handling fails
             """
             try:
                 self.logger.debug("received_message", message=message.message)
 
                 if message.message.startswith("/"):
                     return await self.handle_command(message.message)
+                if self.quota:
+                    client = request.client.host if request.client else None
+                    self.quota.check(SOURCE_API, user=client)
                 return await self.handle_conversation(message.message)
 
+            except QuotaExceededError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail=str(e),
+                    headers={"Retry-After": str(math.ceil(e.retry_after))},
+                ) from e
             except Exception as e:
                 self.logger.exception("message_handling_failed", error=str(e))
                 raise HTTPException(status_code=500, detail=str(e)) from e
@@ -130,5 +149,5 @@ class ChatRouter:
         Returns:
             dict[str, str]: Response from AI provider
         """
-        response = self.ai.send_message(message)
+        response = await self.ai.asend_message(message)
         return {"response": response.text}
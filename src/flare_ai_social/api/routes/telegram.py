@@ -0,0 +1,81 @@
+"""
+Telegram Webhook Router Module
+
+This module receives Telegram updates pushed to the API in webhook mode. Each
+request is authenticated with the secret token registered alongside the webhook,
+decoded into an Update and put on the Application's update queue, where the
+running Application dispatches it to the bot's handlers exactly as it would a
+polled update. The request returns as soon as the update is queued.
+"""
+
+import hmac
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+from fastapi import APIRouter, Body, Header, HTTPException, status
+from telegram import Update
+from telegram.ext import Application
+
+logger = structlog.get_logger(__name__)
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+ERR_WEBHOOK_SECRET_MISSING = "A webhook secret token is required."
+
+
+class TelegramWebhookRouter:
+    """
+    Router accepting webhook updates for a Telegram Application.
+
+    Attributes:
+        secret (str): Secret token Telegram sends with every update
+    """
+
+    def __init__(
+        self, get_application: Callable[[], Application | None], secret: str
+    ) -> None:
+        """
+        Initialize the router.
+
+        Args:
+            get_application: Returns the running Application, or None while the
+                             bot is starting or restarting
+            secret: Secret token the webhook was registered with
+        """
+        if not secret:
+            raise ValueError(ERR_WEBHOOK_SECRET_MISSING)
+        self._router = APIRouter()
+        self._get_application = get_application
+        self.secret = secret
+        self.logger = logger.bind(router="telegram")
+        self._setup_routes()
+
+    def _setup_routes(self) -> None:
+        """Set up the webhook endpoint."""
+
+        @self._router.post("/webhook")
+        async def webhook(  # pyright: ignore [reportUnusedFunction]
+            payload: dict[str, Any] = Body(...),  # noqa: B008
+            secret_token: str = Header("", alias=SECRET_TOKEN_HEADER),
+        ) -> dict[str, str]:
+            """
+            Queue a Telegram update for processing.
+
+            Raises:
+                HTTPException: If the secret token does not match, or the bot
+                               is not running
+            """
+            if not hmac.compare_digest(secret_token, self.secret):
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+            application = self._get_application()
+            if application is None or not application.running:
+                # Telegram retries failed deliveries, so nothing is lost
+                raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+            update = Update.de_json(payload, application.bot)
+            await application.update_queue.put(update)
+            return {"status": "ok"}
+
+    @property
+    def router(self) -> APIRouter:
+        """Get the FastAPI router with registered routes."""
+        return self._router
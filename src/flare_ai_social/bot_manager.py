@@ -7,10 +7,34 @@ import structlog
 from anyio import Event
 from google.api_core.exceptions import InvalidArgument, NotFound
 
-from flare_ai_social.ai import BaseAIProvider, GeminiProvider
+from flare_ai_social.ai import BaseAIProvider, ChatSessionPool, GeminiProvider
+from flare_ai_social.ftso import (
+    FeedReader,
+    FeedRegistry,
+    FeedValueCache,
+    FtsoClient,
+)
+from flare_ai_social.market import MarketDataCache
 from flare_ai_social.prompts import FEW_SHOT_PROMPT
+from flare_ai_social.quota import (
+    SOURCE_API,
+    SOURCE_TELEGRAM,
+    SOURCE_TWITTER,
+    Limit,
+    QuotaManager,
+)
 from flare_ai_social.settings import settings
-from flare_ai_social.telegram import TelegramBot
+from flare_ai_social.storage import StateStore
+from flare_ai_social.telegram import (
+    DATA_LANE,
+    GENERATIVE_LANE,
+    ChatUpdateProcessor,
+    MessageCoalescer,
+    StreamingReplier,
+    SummaryService,
+    TelegramBot,
+    UpdateDebugger,
+)
 from flare_ai_social.twitter import TwitterBot, TwitterConfig
 
 logger = structlog.get_logger(__name__)
@@ -19,11 +43,36 @@ logger = structlog.get_logger(__name__)
 ERR_AI_PROVIDER_NOT_INITIALIZED = "AI provider must be initialized"
 
 
+def create_quota_manager() -> QuotaManager:
+    """Create the LLM quota manager configured in settings."""
+    return QuotaManager(
+        Limit.per_minute(settings.quota_global_per_minute, settings.quota_global_burst),
+        user_limit=Limit.per_minute(
+            settings.quota_user_per_minute, settings.quota_user_burst
+        ),
+        chat_limit=Limit.per_minute(
+            settings.quota_chat_per_minute, settings.quota_chat_burst
+        ),
+        weights={
+            SOURCE_TELEGRAM: settings.quota_telegram_weight,
+            SOURCE_TWITTER: settings.quota_twitter_weight,
+            SOURCE_API: settings.quota_api_weight,
+        },
+    )
+
+
 class BotManager:
     """Manager class for handling multiple social media bots."""
 
-    def __init__(self) -> None:
-        """Initialize the BotManager."""
+    def __init__(self, quota: QuotaManager | None = None) -> None:
+        """
+        Initialize the BotManager.
+
+        Args:
+            quota: LLM quotas shared with the rest of the process, e.g. the API.
+                   A manager configured from settings is created if omitted.
+        """
+        self.quota = quota or create_quota_manager()
         self.ai_provider: BaseAIProvider | None = None
         self.telegram_bot: TelegramBot | None = None
         self.twitter_thread: threading.Thread | None = None
@@ -80,6 +129,23 @@ class BotManager:
             raise RuntimeError(ERR_AI_PROVIDER_NOT_INITIALIZED)
         return self.ai_provider
 
+    def _create_session_pool(
+        self, ai_provider: BaseAIProvider, state_store: StateStore
+    ) -> ChatSessionPool | None:
+        """Create the Telegram chat session pool, if sessions are enabled."""
+        if not settings.telegram_chat_sessions:
+            return None
+        if not isinstance(ai_provider, GeminiProvider):
+            logger.warning("Chat sessions need a Gemini provider, sessions disabled")
+            return None
+        return ChatSessionPool(
+            ai_provider,
+            max_sessions=settings.telegram_max_sessions,
+            idle_timeout=settings.telegram_session_idle_timeout,
+            max_history=settings.telegram_session_max_history,
+            store=state_store if settings.telegram_session_spill else None,
+        )
+
     def start_twitter_bot(self) -> bool:
         """Initialize and start the Twitter bot in a separate thread."""
         if not settings.enable_twitter:
@@ -111,13 +177,29 @@ class BotManager:
                 access_secret=settings.x_access_token_secret,
                 rapidapi_key=settings.rapidapi_key or "",
                 rapidapi_host=settings.rapidapi_host,
+                rapidapi_max_concurrency=settings.rapidapi_max_concurrency,
+                rapidapi_max_query_length=settings.rapidapi_max_query_length,
                 accounts_to_monitor=settings.accounts_to_monitor,
                 polling_interval=settings.twitter_polling_interval,
+                http_pool_size=settings.twitter_http_pool_size,
+                http_pool_size_per_host=settings.twitter_http_pool_size_per_host,
+                http_keepalive=settings.twitter_http_keepalive,
+                http_timeout=settings.twitter_http_timeout,
+                generate_workers=settings.twitter_generate_workers,
+                post_workers=settings.twitter_post_workers,
+                pipeline_queue_size=settings.twitter_pipeline_queue_size,
+                max_seen_ids=settings.twitter_max_seen_ids,
             )
 
             twitter_bot = TwitterBot(
                 ai_provider=ai_provider,
                 config=config,
+                quota=self.quota,
+                # Its own connection, as the store is bound to the bot's loop
+                state_store=StateStore(
+                    settings.state_db_path,
+                    flush_interval=settings.state_flush_interval,
+                ),
             )
 
             self.twitter_thread = threading.Thread(
@@ -150,17 +232,77 @@ class BotManager:
             allowed_users = self._parse_allowed_users()
             ai_provider = self._check_ai_provider_initialized()
 
+            state_store = StateStore(
+                settings.state_db_path, flush_interval=settings.state_flush_interval
+            )
+            ftso = FtsoClient(
+                rpc_url=settings.flare_rpc_url,
+                address=settings.ftsov2_address,
+                pool_size=settings.flare_rpc_pool_size,
+            )
             self.telegram_bot = TelegramBot(
                 ai_provider=ai_provider,
                 api_token=settings.telegram_api_token,
                 allowed_user_ids=allowed_users,
                 polling_interval=settings.telegram_polling_interval,
+                summary_service=SummaryService(
+                    max_workers=settings.telegram_summary_workers,
+                    max_batch_size=settings.telegram_summary_batch_size,
+                    batch_window=settings.telegram_summary_batch_window_ms / 1000,
+                ),
+                market_data=MarketDataCache(
+                    ttl=settings.market_data_ttl,
+                    cache_path=settings.market_data_cache_path,
+                ),
+                feed_reader=FeedReader(
+                    ftso,
+                    batch_window=settings.ftso_batch_window_ms / 1000,
+                    cache=FeedValueCache(horizon=settings.ftso_cache_horizon),
+                ),
+                feed_registry=FeedRegistry(
+                    ftso,
+                    symbols=settings.feed_symbols,
+                    refresh_interval=settings.ftso_registry_refresh_interval,
+                ),
+                update_processor=ChatUpdateProcessor(
+                    lanes={
+                        DATA_LANE: settings.telegram_data_lane_concurrency,
+                        GENERATIVE_LANE: settings.telegram_generative_lane_concurrency,
+                    },
+                    max_chat_queue=settings.telegram_chat_queue_size,
+                    drop_policy=settings.telegram_chat_drop_policy,
+                ),
+                debugger=UpdateDebugger(
+                    sample_rate=settings.telegram_debug_sample_rate,
+                    chat_ids=settings.debug_chat_ids,
+                    record_path=settings.telegram_debug_record_path,
+                ),
+                state_store=state_store,
+                streamer=StreamingReplier(
+                    private_edit_interval=settings.telegram_stream_private_edit_interval,
+                    group_edit_interval=settings.telegram_stream_group_edit_interval,
+                )
+                if settings.telegram_stream_replies
+                else None,
+                sessions=self._create_session_pool(ai_provider, state_store),
+                coalescer=MessageCoalescer(
+                    window=settings.telegram_coalesce_window_ms / 1000,
+                    max_wait=settings.telegram_coalesce_max_wait_ms / 1000,
+                )
+                if settings.telegram_coalesce_window_ms > 0
+                else None,
+                quota=self.quota,
             )
 
             await self.telegram_bot.initialize()
-            self._telegram_polling_task = asyncio.create_task(
-                self.telegram_bot.start_polling()
-            )
+            if settings.telegram_webhook_url:
+                await self.telegram_bot.start_webhook(
+                    settings.telegram_webhook_url, settings.telegram_webhook_secret
+                )
+            else:
+                self._telegram_polling_task = asyncio.create_task(
+                    self.telegram_bot.start_polling()
+                )
             self.active_bots.append("Telegram")
 
         except Exception:
@@ -187,12 +329,7 @@ class BotManager:
 
     async def _check_telegram_status(self) -> None:
         """Check and handle Telegram bot status."""
-        if not (
-            self.telegram_bot
-            and self.telegram_bot.application
-            and self.telegram_bot.application.updater
-            and self.telegram_bot.application.updater.running
-        ):
+        if not (self.telegram_bot and self.telegram_bot.running):
             logger.error("Telegram bot stopped responding")
             try:
                 # Store telegram_bot in a local variable to help type checker
@@ -267,7 +404,11 @@ async def async_start() -> None:
             return
 
         bot_manager.start_twitter_bot()
-        await bot_manager.start_telegram_bot()
+        if settings.telegram_webhook_url:
+            # Webhook updates are POSTed to the API, which hosts the bot itself
+            logger.info("Telegram bot runs in the API process in webhook mode")
+        else:
+            await bot_manager.start_telegram_bot()
 
         if bot_manager.active_bots:
             logger.info("Active bots: %s", ", ".join(bot_manager.active_bots))
@@ -0,0 +1,19 @@
+from .cache import FeedCacheMetrics, FeedValueCache
+from .client import FTSOV2_ADDRESS, RPC_URL, FeedValue, FtsoClient
+from .reader import FeedReader, FeedReaderMetrics
+from .registry import DEFAULT_FEED_SYMBOLS, FeedInfo, FeedRegistry, encode_feed_id
+
+__all__ = [
+    "DEFAULT_FEED_SYMBOLS",
+    "FTSOV2_ADDRESS",
+    "RPC_URL",
+    "FeedCacheMetrics",
+    "FeedInfo",
+    "FeedReader",
+    "FeedReaderMetrics",
+    "FeedRegistry",
+    "FeedValue",
+    "FeedValueCache",
+    "FtsoClient",
+    "encode_feed_id",
+]
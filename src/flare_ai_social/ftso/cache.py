@@ -0,0 +1,72 @@
+"""
+Feed Value Cache Module
+
+This module caches FTSO feed values between on-chain updates. An entry stays
+valid until its reported timestamp plus a block-time horizon has passed, so
+popular feeds requested by many users within the same few seconds are served
+from memory instead of triggering another eth_call.
+"""
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from flare_ai_social.ftso.client import FeedValue
+
+
+@dataclass(frozen=True)
+class FeedCacheMetrics:
+    """Hit and miss counters of the feed value cache"""
+
+    hits: int
+    misses: int
+    size: int
+
+
+class FeedValueCache:
+    """
+    Feed values keyed by feed ID, expiring relative to their on-chain timestamp.
+
+    Attributes:
+        horizon (float): Seconds after a value's timestamp during which it is served
+    """
+
+    def __init__(
+        self, horizon: float = 2.0, clock: Callable[[], float] = time.time
+    ) -> None:
+        self.horizon = horizon
+        self._clock = clock
+        self._values: dict[bytes, FeedValue] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, feed_id: bytes) -> FeedValue | None:
+        """
+        Return the cached value of a feed if it is still within the horizon.
+
+        Args:
+            feed_id: bytes21 feed identifier
+
+        Returns:
+            The cached FeedValue, or None on a miss
+        """
+        value = self._values.get(feed_id)
+        if value is not None and self._clock() < value.timestamp + self.horizon:
+            self._hits += 1
+            return value
+        if value is not None:
+            del self._values[feed_id]
+        self._misses += 1
+        return None
+
+    def put(self, value: FeedValue) -> None:
+        """Store a feed value unless a newer one is already cached."""
+        current = self._values.get(value.feed_id)
+        if current is None or current.timestamp <= value.timestamp:
+            self._values[value.feed_id] = value
+
+    def metrics(self) -> FeedCacheMetrics:
+        """Return hit, miss and size counters."""
+        return FeedCacheMetrics(
+            hits=self._hits, misses=self._misses, size=len(self._values)
+        )
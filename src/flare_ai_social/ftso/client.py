@@ -0,0 +1,145 @@
+"""
+FTSO Client Module
+
+This module provides a long-lived client for the FtsoV2 contract on Flare. The
+Web3 provider shares one pooled aiohttp session, and the contract object is built
+once from the pre-parsed ABI, so feed lookups reuse open connections instead of
+re-parsing the ABI and paying a TLS handshake per request.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import aiohttp
+import structlog
+from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3.contract import AsyncContract
+
+from flare_ai_social.ftso.abi import FTSOV2_ABI
+
+logger = structlog.get_logger(__name__)
+
+FTSOV2_ADDRESS = "0x3d893C53D9e8056135C26C8c638B76C8b60Df726"
+RPC_URL = "https://coston2-api.flare.network/ext/C/rpc"
+ERR_FTSO_NOT_CONNECTED = "FTSO client not connected."
+
+
+@dataclass(frozen=True)
+class FeedValue:
+    """Value of a single FTSO feed as returned by FtsoV2"""
+
+    feed_id: bytes
+    value: int
+    decimals: int
+    timestamp: int
+
+
+class FtsoClient:
+    """
+    Connection-pooled client for the FtsoV2 contract.
+
+    Attributes:
+        rpc_url (str): JSON-RPC endpoint of the Flare network
+        address (str): FtsoV2 contract address
+        pool_size (int): Maximum number of pooled HTTP connections
+        timeout (float): Total timeout of a single RPC request in seconds
+    """
+
+    def __init__(
+        self,
+        rpc_url: str = RPC_URL,
+        address: str = FTSOV2_ADDRESS,
+        pool_size: int = 16,
+        timeout: float = 30,
+    ) -> None:
+        self.rpc_url = rpc_url
+        self.address = address
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.w3: AsyncWeb3 | None = None
+        self._contract: AsyncContract | None = None
+
+    async def connect(self) -> None:
+        """Open the pooled HTTP session and build the contract object."""
+        if self.w3:
+            return
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.pool_size),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        provider = AsyncHTTPProvider(self.rpc_url)
+        await provider.cache_async_session(session)
+        self.w3 = AsyncWeb3(provider)
+        self._contract = self.w3.eth.contract(
+            address=AsyncWeb3.to_checksum_address(self.address), abi=FTSOV2_ABI
+        )
+        logger.info("FTSO client connected", rpc_url=self.rpc_url)
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session."""
+        if self.w3:
+            await self.w3.provider.disconnect()
+            self.w3 = None
+            self._contract = None
+
+    @property
+    def contract(self) -> AsyncContract:
+        """The FtsoV2 contract bound to the pooled provider."""
+        if self._contract is None:
+            raise RuntimeError(ERR_FTSO_NOT_CONNECTED)
+        return self._contract
+
+    async def get_feeds_by_id(self, feed_ids: Sequence[bytes]) -> list[FeedValue]:
+        """
+        Read the current values of several feeds in one call.
+
+        Args:
+            feed_ids: bytes21 feed identifiers
+
+        Returns:
+            One FeedValue per requested feed, in request order
+        """
+        values, decimals, timestamp = await self.contract.functions.getFeedsById(
+            list(feed_ids)
+        ).call()
+        return [
+            FeedValue(
+                feed_id=feed_id, value=value, decimals=decimal, timestamp=timestamp
+            )
+            for feed_id, value, decimal in zip(feed_ids, values, decimals, strict=True)
+        ]
+
+    async def get_feeds_by_index(
+        self, indices: Sequence[int], feed_ids: Sequence[bytes]
+    ) -> list[FeedValue]:
+        """
+        Read the current values of several feeds by their FtsoV2 index.
+
+        Args:
+            indices: Feed indices as returned by getFeedIndex
+            feed_ids: bytes21 identifiers of the same feeds, used to label values
+
+        Returns:
+            One FeedValue per requested feed, in request order
+        """
+        values, decimals, timestamp = await self.contract.functions.getFeedsByIndex(
+            list(indices)
+        ).call()
+        return [
+            FeedValue(
+                feed_id=feed_id, value=value, decimals=decimal, timestamp=timestamp
+            )
+            for feed_id, value, decimal in zip(feed_ids, values, decimals, strict=True)
+        ]
+
+    async def get_feed_index(self, feed_id: bytes) -> int:
+        """
+        Resolve the FtsoV2 index of a feed.
+
+        Args:
+            feed_id: bytes21 feed identifier
+
+        Returns:
+            The feed's index, usable with getFeedsByIndex
+        """
+        return await self.contract.functions.getFeedIndex(feed_id).call()
@@ -0,0 +1,135 @@
+"""
+Feed Reader Module
+
+This module coalesces concurrent FTSO feed lookups. Reads arriving within a
+short window, from any number of chats, are merged into a single getFeedsById
+call and the values are fanned back out to each caller. Duplicate feed IDs in
+the same window share one slot of the batch, and values still fresh in the
+optional FeedValueCache are answered without joining a batch at all.
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+import structlog
+from web3.exceptions import ContractLogicError
+
+from flare_ai_social.ftso.cache import FeedValueCache
+from flare_ai_social.ftso.client import FeedValue, FtsoClient
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class FeedReaderMetrics:
+    """Counters describing how well reads are being batched"""
+
+    reads: int
+    rpc_calls: int
+    batch_size_max: int
+
+
+class FeedReader:
+    """
+    Micro-batching reader in front of FtsoClient.
+
+    Attributes:
+        client (FtsoClient): Client used for the batched contract calls
+        batch_window (float): Seconds to collect reads before issuing a call
+        max_batch_size (int): Number of distinct feeds that triggers an early call
+        cache (FeedValueCache | None): Cache consulted before and filled after calls
+    """
+
+    def __init__(
+        self,
+        client: FtsoClient,
+        batch_window: float = 0.05,
+        max_batch_size: int = 100,
+        cache: FeedValueCache | None = None,
+    ) -> None:
+        self.client = client
+        self.cache = cache
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self._pending: dict[bytes, asyncio.Future[FeedValue]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+        self._reads = 0
+        self._rpc_calls = 0
+        self._batch_size_max = 0
+
+    async def read(self, feed_id: bytes) -> FeedValue:
+        """
+        Read the current value of a feed as part of the next batch.
+
+        Args:
+            feed_id: bytes21 feed identifier
+
+        Returns:
+            The feed's value, decimals and timestamp
+        """
+        self._reads += 1
+        if self.cache and (cached := self.cache.get(feed_id)):
+            return cached
+        future = self._pending.get(feed_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[feed_id] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.batch_window, self._flush)
+        # Shield the shared future so one cancelled caller does not fail the others
+        return await asyncio.shield(future)
+
+    async def close(self) -> None:
+        """Issue any pending batch and wait for in-flight calls."""
+        if self._pending:
+            self._flush()
+        await asyncio.gather(*self._batches, return_exceptions=True)
+
+    def metrics(self) -> FeedReaderMetrics:
+        """Return read, call and batch size counters."""
+        return FeedReaderMetrics(
+            reads=self._reads,
+            rpc_calls=self._rpc_calls,
+            batch_size_max=self._batch_size_max,
+        )
+
+    def _flush(self) -> None:
+        """Hand the collected reads to a batch task."""
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        task = asyncio.create_task(self._read_batch(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _read_batch(self, batch: dict[bytes, asyncio.Future[FeedValue]]) -> None:
+        """Read a batch of feeds in one call and resolve the waiting futures."""
+        self._batch_size_max = max(self._batch_size_max, len(batch))
+        try:
+            self._rpc_calls += 1
+            values = await self.client.get_feeds_by_id(list(batch))
+        except Exception as e:  # noqa: BLE001 - delivered to the waiting callers
+            if len(batch) > 1 and isinstance(e, ContractLogicError):
+                # One unknown feed reverts the whole call, retry feeds on their own.
+                # Transport and rate-limit errors fail the batch, so an outage
+                # does not multiply the calls.
+                logger.warning("Batched feed read reverted, retrying per feed")
+                await asyncio.gather(
+                    *(self._read_batch({feed_id: f}) for feed_id, f in batch.items())
+                )
+                return
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for value in values:
+            if self.cache:
+                self.cache.put(value)
+            future = batch[value.feed_id]
+            if not future.done():
+                future.set_result(value)
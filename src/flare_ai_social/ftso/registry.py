@@ -0,0 +1,177 @@
+"""
+Feed Registry Module
+
+This module maps feed symbols such as "FLR/USD" to their FtsoV2 bytes21 feed IDs
+and indices. IDs are encoded once when the registry is created, indices are
+resolved on-chain in the background at startup and refreshed periodically. Lookups
+by symbol or by hex ID are dictionary hits, and all registered feeds can be read
+with a single getFeedsByIndex call.
+"""
+
+import asyncio
+import contextlib
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+
+import structlog
+
+from flare_ai_social.ftso.client import FeedValue, FtsoClient
+
+logger = structlog.get_logger(__name__)
+
+CRYPTO_FEED_CATEGORY = 1
+FEED_NAME_LENGTH = 20
+DEFAULT_FEED_SYMBOLS = (
+    "FLR/USD",
+    "SGB/USD",
+    "BTC/USD",
+    "ETH/USD",
+    "XRP/USD",
+    "DOGE/USD",
+    "SOL/USD",
+    "USDC/USD",
+    "USDT/USD",
+)
+ERR_FEED_NAME_TOO_LONG = "Feed name must be at most 20 ASCII characters"
+
+
+@dataclass(frozen=True)
+class FeedInfo:
+    """A registered feed with its precomputed identifier"""
+
+    symbol: str
+    feed_id: bytes
+    index: int | None = None
+
+    @property
+    def hex_id(self) -> str:
+        """The feed ID as a 0x-prefixed hex string."""
+        return "0x" + self.feed_id.hex()
+
+
+def encode_feed_id(symbol: str, category: int = CRYPTO_FEED_CATEGORY) -> bytes:
+    """
+    Encode a feed symbol into its FtsoV2 bytes21 identifier.
+
+    Args:
+        symbol: Feed name, e.g. "FLR/USD"
+        category: Feed category byte, 1 for crypto
+
+    Returns:
+        The category byte followed by the zero-padded ASCII feed name
+    """
+    name = symbol.encode("ascii")
+    if len(name) > FEED_NAME_LENGTH:
+        raise ValueError(ERR_FEED_NAME_TOO_LONG)
+    return bytes([category]) + name.ljust(FEED_NAME_LENGTH, b"\0")
+
+
+class FeedRegistry:
+    """
+    Symbol and ID index of the feeds the bot knows about.
+
+    Attributes:
+        client (FtsoClient): Client used to resolve feed indices
+        refresh_interval (float): Seconds between index refreshes
+    """
+
+    def __init__(
+        self,
+        client: FtsoClient,
+        symbols: Iterable[str] = DEFAULT_FEED_SYMBOLS,
+        refresh_interval: float = 3600,
+    ) -> None:
+        self.client = client
+        self.refresh_interval = refresh_interval
+        feeds = [
+            FeedInfo(symbol.upper(), encode_feed_id(symbol.upper()))
+            for symbol in symbols
+        ]
+        self._by_symbol: dict[str, FeedInfo] = {}
+        self._by_id: dict[str, FeedInfo] = {}
+        self._index(feeds)
+        self._refresher: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Resolve feed indices in the background and keep them refreshed."""
+        if self._refresher:
+            return
+        self._refresher = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh."""
+        if self._refresher:
+            self._refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresher
+            self._refresher = None
+
+    async def refresh(self) -> None:
+        """Resolve the on-chain index of every registered feed."""
+        feeds = list(self._by_symbol.values())
+        indices = await asyncio.gather(
+            *(self.client.get_feed_index(feed.feed_id) for feed in feeds),
+            return_exceptions=True,
+        )
+        resolved: list[FeedInfo] = []
+        for feed, index in zip(feeds, indices, strict=True):
+            if isinstance(index, BaseException):
+                logger.warning("Failed to resolve feed index", symbol=feed.symbol)
+                resolved.append(feed)
+            else:
+                resolved.append(replace(feed, index=index))
+        self._index(resolved)
+        logger.info(
+            "Feed registry refreshed",
+            feeds=len(resolved),
+            indexed=sum(feed.index is not None for feed in resolved),
+        )
+
+    def lookup(self, text: str) -> FeedInfo | None:
+        """
+        Find a registered feed by symbol or by hex feed ID.
+
+        Args:
+            text: A symbol such as "flr/usd" or a 0x-prefixed feed ID
+
+        Returns:
+            The matching FeedInfo, or None if the feed is not registered
+        """
+        key = text.strip()
+        if key[:2].lower() == "0x":
+            return self._by_id.get(key.lower())
+        return self._by_symbol.get(key.upper())
+
+    def feeds(self) -> list[FeedInfo]:
+        """All registered feeds, in registration order."""
+        return list(self._by_symbol.values())
+
+    async def read_all(self) -> list[tuple[FeedInfo, FeedValue]]:
+        """
+        Read every indexed feed with a single getFeedsByIndex call.
+
+        Returns:
+            Pairs of feed and current value, for feeds whose index is known
+        """
+        feeds = [feed for feed in self._by_symbol.values() if feed.index is not None]
+        if not feeds:
+            return []
+        values = await self.client.get_feeds_by_index(
+            [feed.index for feed in feeds if feed.index is not None],
+            [feed.feed_id for feed in feeds],
+        )
+        return list(zip(feeds, values, strict=True))
+
+    def _index(self, feeds: list[FeedInfo]) -> None:
+        """Swap in new symbol and ID lookup tables."""
+        self._by_symbol = {feed.symbol: feed for feed in feeds}
+        self._by_id = {feed.hex_id: feed for feed in feeds}
+
+    async def _refresh_loop(self) -> None:
+        """Resolve feed indices now and then periodically."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Feed registry refresh failed")
+            await asyncio.sleep(self.refresh_interval)
@@ -12,12 +12,18 @@ Dependencies:
     - Custom providers for AI, blockchain, and attestation services
 """
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
 import google.generativeai as genai
 import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from flare_ai_social import ChatRouter, GeminiProvider, start_bot_manager
+from flare_ai_social.api import TelegramWebhookRouter
+from flare_ai_social.bot_manager import BotManager, create_quota_manager
 from flare_ai_social.settings import settings
 
 logger = structlog.get_logger(__name__)
@@ -37,6 +43,7 @@ def create_app() -> FastAPI:
        - Vtpm for attestation services
        - PromptService for managing chat prompts
     4. Sets up routing for chat endpoints
+    5. In Telegram webhook mode, hosts the Telegram bot and its webhook route
 
     Returns:
         FastAPI: Configured FastAPI application instance
@@ -48,8 +55,29 @@ def create_app() -> FastAPI:
         - gemini_model: Model identifier for Gemini AI
         - web3_provider_url: URL for Web3 provider
         - simulate_attestation: Boolean flag for attestation simulation
+        - telegram_webhook_url: Enables Telegram webhook mode when set
     """
-    app = FastAPI(title="Social AI Agent", redirect_slashes=False)
+    # One set of LLM quotas for the API and any bots hosted in this process
+    quota = create_quota_manager()
+    bot_manager = BotManager(quota=quota)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        if not settings.telegram_webhook_url:
+            yield
+            return
+        bot_manager.initialize_ai_provider()
+        await bot_manager.start_telegram_bot()
+        monitor_task = asyncio.create_task(bot_manager.monitor_bots())
+        try:
+            yield
+        finally:
+            monitor_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await monitor_task
+            await bot_manager.shutdown()
+
+    app = FastAPI(title="Social AI Agent", redirect_slashes=False, lifespan=lifespan)
 
     # Configure CORS middleware with settings from configuration
     app.add_middleware(
@@ -65,11 +93,25 @@ def create_app() -> FastAPI:
         ai=GeminiProvider(
             api_key=settings.gemini_api_key,
             model_name=f"tunedModels/{settings.tuned_model_name}",
-        )
+        ),
+        quota=quota,
     )
 
     # Register chat routes with API
     app.include_router(chat.router, prefix="/api/routes/chat", tags=["chat"])
+
+    if settings.telegram_webhook_url:
+        telegram = TelegramWebhookRouter(
+            lambda: (
+                bot_manager.telegram_bot.application
+                if bot_manager.telegram_bot
+                else None
+            ),
+            secret=settings.telegram_webhook_secret,
+        )
+        app.include_router(
+            telegram.router, prefix="/api/routes/telegram", tags=["telegram"]
+        )
     return app
 
 
@@ -0,0 +1,17 @@
+from .cache import (
+    DATE_COLUMNS,
+    TOKEN_PRICES_QUERY_ID,
+    TVL_QUERY_ID,
+    MarketDataCache,
+    MarketSnapshot,
+)
+from .store import DatedTable
+
+__all__ = [
+    "DATE_COLUMNS",
+    "TOKEN_PRICES_QUERY_ID",
+    "TVL_QUERY_ID",
+    "DatedTable",
+    "MarketDataCache",
+    "MarketSnapshot",
+]
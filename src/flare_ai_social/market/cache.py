@@ -0,0 +1,208 @@
+"""
+Market Data Cache Module
+
+This module keeps the latest results of the Dune queries behind the /tvl and
+token price replies in memory. Entries are served immediately and refreshed in
+the background once they are older than the TTL (stale-while-revalidate), with
+at most one Dune request in flight per query (single-flight). Each refresh is
+loaded into a day-indexed DatedTable once, and results are persisted to disk so
+a restart starts with warm data.
+"""
+
+import asyncio
+import contextlib
+import functools
+import json
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+from dune_client.client import DuneClient
+from dune_client.models import ExecutionState
+
+from flare_ai_social.market.store import DatedTable
+
+logger = structlog.get_logger(__name__)
+
+TVL_QUERY_ID = 4841961
+TOKEN_PRICES_QUERY_ID = 4838993
+# Column holding the day of each row, per query
+DATE_COLUMNS: Mapping[int, str] = {TVL_QUERY_ID: "time", TOKEN_PRICES_QUERY_ID: "day"}
+
+ERR_EXECUTION_INCOMPLETE = "Latest Dune execution has no complete result"
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """Indexed rows of one Dune query result together with when they were fetched"""
+
+    query_id: int
+    table: DatedTable
+    fetched_at: float
+
+    def age(self) -> float:
+        """Seconds since the snapshot was fetched."""
+        return time.time() - self.fetched_at
+
+
+class MarketDataCache:
+    """
+    In-memory, disk-backed cache of Dune query results.
+
+    Attributes:
+        date_columns (Mapping[int, str]): Queries refreshed by the background
+            task, mapped to the column holding each row's day
+        ttl (float): Seconds after which a snapshot is refreshed on access
+        refresh_interval (float): Seconds between background refreshes
+        cache_path (Path | None): File the snapshots are persisted to
+    """
+
+    def __init__(
+        self,
+        date_columns: Mapping[int, str] = DATE_COLUMNS,
+        ttl: float = 300,
+        refresh_interval: float | None = None,
+        cache_path: Path | None = None,
+        client_factory: Callable[[], DuneClient] = DuneClient.from_env,
+    ) -> None:
+        self.date_columns = date_columns
+        self.ttl = ttl
+        self.refresh_interval = refresh_interval or ttl
+        self.cache_path = cache_path
+        self._client_factory = client_factory
+        self._client: DuneClient | None = None
+        self._snapshots: dict[int, MarketSnapshot] = {}
+        self._inflight: dict[int, asyncio.Task[MarketSnapshot]] = {}
+        self._refresher: asyncio.Task[None] | None = None
+        self._save_lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Load persisted snapshots and start refreshing in the background."""
+        if self._refresher:
+            return
+        if self.cache_path:
+            self._snapshots.update(await asyncio.to_thread(self._load))
+            logger.info(
+                "Market data cache loaded",
+                queries=sorted(self._snapshots),
+                path=str(self.cache_path),
+            )
+        self._refresher = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh and wait for in-flight fetches."""
+        if self._refresher:
+            self._refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresher
+            self._refresher = None
+        await asyncio.gather(*self._inflight.values(), return_exceptions=True)
+
+    async def get(self, query_id: int) -> MarketSnapshot:
+        """
+        Return the latest snapshot of a query.
+
+        A cached snapshot is returned immediately, scheduling a background refresh
+        if it is older than the TTL. Only a cold cache waits for Dune.
+
+        Args:
+            query_id: Dune query identifier
+
+        Returns:
+            MarketSnapshot with the query's latest rows
+        """
+        snapshot = self._snapshots.get(query_id)
+        if snapshot is None:
+            return await self._refresh(query_id)
+        if snapshot.age() > self.ttl:
+            self._refresh(query_id)
+        return snapshot
+
+    def _refresh(self, query_id: int) -> asyncio.Task[MarketSnapshot]:
+        """Start a fetch for the query unless one is already running."""
+        task = self._inflight.get(query_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch(query_id))
+            self._inflight[query_id] = task
+            task.add_done_callback(functools.partial(self._on_fetched, query_id))
+        return task
+
+    def _on_fetched(self, query_id: int, task: asyncio.Task[MarketSnapshot]) -> None:
+        """Clear the single-flight slot and log failed background fetches."""
+        del self._inflight[query_id]
+        if not task.cancelled() and (error := task.exception()):
+            logger.warning("Market data refresh failed", query_id=query_id, error=error)
+
+    async def _fetch(self, query_id: int) -> MarketSnapshot:
+        """Fetch the latest result of a query from Dune and cache it."""
+        if self._client is None:
+            self._client = self._client_factory()
+        result = await asyncio.to_thread(self._client.get_latest_result, query_id)
+        # get_rows() is empty unless the execution completed, which must not
+        # replace the previous snapshot
+        if result.state != ExecutionState.COMPLETED:
+            raise RuntimeError(ERR_EXECUTION_INCOMPLETE, query_id, result.state.value)
+        snapshot = self._snapshot(query_id, result.get_rows(), time.time())
+        self._snapshots[query_id] = snapshot
+        logger.debug(
+            "Market data refreshed", query_id=query_id, rows=len(snapshot.table)
+        )
+        if self.cache_path:
+            async with self._save_lock:
+                await asyncio.to_thread(self._save, list(self._snapshots.values()))
+        return snapshot
+
+    async def _refresh_loop(self) -> None:
+        """Periodically refresh every registered query."""
+        while True:
+            await asyncio.gather(
+                *(self._refresh(query_id) for query_id in self.date_columns),
+                return_exceptions=True,
+            )
+            await asyncio.sleep(self.refresh_interval)
+
+    def _load(self) -> dict[int, MarketSnapshot]:
+        """Read persisted snapshots, ignoring a missing or corrupt file."""
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text())
+            snapshots = [
+                self._snapshot(entry["query_id"], entry["rows"], entry["fetched_at"])
+                for entry in data
+                if entry["query_id"] in self.date_columns
+            ]
+        except (OSError, ValueError, TypeError, KeyError):
+            logger.exception("Ignoring unreadable market data cache")
+            return {}
+        return {snapshot.query_id: snapshot for snapshot in snapshots}
+
+    def _save(self, snapshots: list[MarketSnapshot]) -> None:
+        """Atomically write the snapshots to the cache file."""
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        data = [
+            {
+                "query_id": snapshot.query_id,
+                "rows": snapshot.table.records(),
+                "fetched_at": snapshot.fetched_at,
+            }
+            for snapshot in snapshots
+        ]
+        tmp_path.write_text(json.dumps(data))
+        tmp_path.replace(self.cache_path)
+
+    def _snapshot(
+        self, query_id: int, rows: list[dict[str, Any]], fetched_at: float
+    ) -> MarketSnapshot:
+        """Index the rows of a query result into a snapshot."""
+        return MarketSnapshot(
+            query_id=query_id,
+            table=DatedTable(rows, self.date_columns[query_id]),
+            fetched_at=fetched_at,
+        )
@@ -0,0 +1,106 @@
+"""
+Dated Table Module
+
+This module stores the rows of a Dune query result in a column-oriented pandas
+frame sorted by day and symbol, together with a day -> row slice index. The
+index is built once per refresh so that the latest day, the rows of a given day
+and contiguous day ranges are answered without scanning the result again. Rows
+are handed back as the original dictionaries, so missing values stay missing
+rather than becoming NaN, and integers are not widened to floats.
+"""
+
+import bisect
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+class DatedTable:
+    """
+    Dune result rows indexed by day.
+
+    Rows are sorted by the date column and, within a day, by the symbol column,
+    so every day occupies one contiguous slice of the frame.
+
+    Attributes:
+        date_column (str): Column holding the (lexicographically sortable) day
+        symbol_column (str): Column used to order rows within a day
+        dates (tuple[str, ...]): Distinct days in ascending order
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[dict[str, Any]],
+        date_column: str,
+        symbol_column: str = "symbol",
+    ) -> None:
+        self.date_column = date_column
+        self.symbol_column = symbol_column
+        records = list(rows)
+        frame = pd.DataFrame.from_records(records)
+        if date_column not in frame.columns:
+            frame = pd.DataFrame(columns=[date_column])
+        # Rows without a day cannot be indexed
+        frame = frame[frame[date_column].notna()]
+        sort_by = [c for c in (date_column, symbol_column) if c in frame.columns]
+        frame = frame.sort_values(sort_by, kind="stable")
+        self._rows = [records[i] for i in frame.index]
+        self._frame = frame.reset_index(drop=True)
+        dates, starts = np.unique(
+            self._frame[date_column].to_numpy(dtype=str), return_index=True
+        )
+        stops = [*starts[1:], len(self._frame)] if len(starts) else []
+        self.dates: tuple[str, ...] = tuple(str(d) for d in dates)
+        self._slices = {
+            date: slice(int(start), int(stop))
+            for date, start, stop in zip(self.dates, starts, stops, strict=True)
+        }
+
+    def __len__(self) -> int:
+        """Number of rows in the table."""
+        return len(self._frame)
+
+    @property
+    def latest_date(self) -> str | None:
+        """Most recent day with data, or None for an empty table."""
+        return self.dates[-1] if self.dates else None
+
+    def rows_for(self, date: str) -> list[dict[str, Any]]:
+        """
+        Rows of a single day, ordered by symbol.
+
+        Args:
+            date: Day in the same format as the date column
+
+        Returns:
+            The day's rows as dictionaries, empty if the day has no data
+        """
+        day = self._slices.get(date)
+        if day is None:
+            return []
+        return [dict(row) for row in self._rows[day]]
+
+    def between(self, start: str, end: str) -> pd.DataFrame:
+        """
+        Rows for all days in the inclusive range [start, end].
+
+        Args:
+            start: First day of the range
+            end: Last day of the range
+
+        Returns:
+            A view of the frame restricted to the range, ordered by day and symbol
+        """
+        first = bisect.bisect_left(self.dates, start)
+        last = bisect.bisect_right(self.dates, end)
+        if first >= last:
+            return self._frame.iloc[0:0]
+        start_row = self._slices[self.dates[first]].start
+        stop_row = self._slices[self.dates[last - 1]].stop
+        return self._frame.iloc[start_row:stop_row]
+
+    def records(self) -> list[dict[str, Any]]:
+        """All rows as dictionaries, ordered by day and symbol."""
+        return [dict(row) for row in self._rows]
@@ -0,0 +1,79 @@
+"""
+Metrics Module
+
+This module provides lightweight in-process instrumentation for the bots'
+background services. Latencies are kept in a bounded window of recent samples so
+that percentiles can be reported without unbounded memory growth.
+"""
+
+import math
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    """Point-in-time summary of a latency recorder, in seconds"""
+
+    count: int
+    mean: float
+    p50: float
+    p99: float
+    max: float
+
+
+class LatencyRecorder:
+    """
+    Record operation latencies and summarize them on demand.
+
+    The lifetime count and total are exact, percentiles and the maximum are
+    computed over the most recent `window` samples.
+    """
+
+    def __init__(self, window: int = 1024) -> None:
+        """
+        Initialize the recorder.
+
+        Args:
+            window: Number of recent samples kept for percentile computation
+        """
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record a single latency sample."""
+        self._samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Record the wall-clock duration of the wrapped block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> LatencyStats:
+        """Summarize the recorded samples."""
+        if not self._samples:
+            return LatencyStats(count=self.count, mean=0.0, p50=0.0, p99=0.0, max=0.0)
+        ordered = sorted(self._samples)
+        return LatencyStats(
+            count=self.count,
+            mean=self.total / self.count,
+            p50=_percentile(ordered, 0.50),
+            p99=_percentile(ordered, 0.99),
+            max=ordered[-1],
+        )
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty sample list."""
+    rank = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[rank]
@@ -0,0 +1,279 @@
+"""
+Quota Module
+
+This module rations LLM calls between everything that makes them. A global token
+bucket caps the total rate, so Telegram, Twitter and the HTTP API together stay
+within the Gemini quota. The global rate is divided between those sources by
+weight: a source within its share is always admitted while the global budget
+lasts, and a source over its share may borrow capacity another source is not
+using, but only while the global bucket is more than half full, which keeps the
+rest for sources within their share. Per-user and per-chat buckets on top of that
+stop a single noisy user or group from using up their source's share.
+
+The manager is thread-safe, so the Twitter bot's thread can share it with the
+event loop, but its state lives in one process.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass
+
+from flare_ai_social.ratelimit import TokenBucket
+
+SOURCE_TELEGRAM = "telegram"
+SOURCE_TWITTER = "twitter"
+SOURCE_API = "api"
+DEFAULT_WEIGHTS = {SOURCE_TELEGRAM: 2.0, SOURCE_TWITTER: 1.0, SOURCE_API: 1.0}
+
+# Which limit throttled a request
+LIMIT_USER = "user"
+LIMIT_CHAT = "chat"
+LIMIT_SHARE = "share"
+LIMIT_GLOBAL = "global"
+
+ERR_UNKNOWN_SOURCE = "Unknown quota source"
+
+
+class QuotaExceededError(Exception):
+    """
+    Raised when a request is over one of its quotas.
+
+    Attributes:
+        limit (str): The limit that was hit, e.g. "user" or "global"
+        retry_after (float): Seconds until the request would be admitted
+    """
+
+    def __init__(self, limit: str, retry_after: float) -> None:
+        super().__init__(f"{limit} quota exceeded, retry in {retry_after:.1f}s")
+        self.limit = limit
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class Limit:
+    """Sustained rate in requests per second, and the burst allowed above it"""
+
+    rate: float
+    burst: float
+
+    @classmethod
+    def per_minute(cls, requests: float, burst: float) -> "Limit":
+        """Build a limit from a per-minute request count."""
+        return cls(rate=requests / 60, burst=burst)
+
+
+@dataclass(frozen=True)
+class SourceMetrics:
+    """Admission counters of one quota source"""
+
+    admitted: int
+    borrowed: int  # Admitted above the source's share, from unused capacity
+    throttled: dict[str, int]  # Limit -> requests it rejected
+
+
+@dataclass(frozen=True)
+class QuotaMetrics:
+    """Snapshot of the quota manager"""
+
+    global_available: float
+    tracked_users: int
+    tracked_chats: int
+    sources: dict[str, SourceMetrics]
+
+
+class _SourceState:
+    """Share bucket and counters of one source"""
+
+    def __init__(self, bucket: TokenBucket) -> None:
+        self.bucket = bucket
+        self.admitted = 0
+        self.borrowed = 0
+        self.throttled: dict[str, int] = {}
+
+
+class QuotaManager:
+    """
+    Global, per-source, per-user and per-chat LLM request quotas.
+
+    Attributes:
+        global_limit (Limit): Total rate across all sources
+        user_limit (Limit | None): Rate of each user, unlimited if None
+        chat_limit (Limit | None): Rate of each chat, unlimited if None
+        max_keys (int): Users and chats tracked each, least recently seen first out
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        global_limit: Limit,
+        *,
+        user_limit: Limit | None = None,
+        chat_limit: Limit | None = None,
+        weights: Mapping[str, float] | None = None,
+        max_keys: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.global_limit = global_limit
+        self.user_limit = user_limit
+        self.chat_limit = chat_limit
+        self.max_keys = max_keys
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._global = TokenBucket(global_limit.rate, global_limit.burst, clock)
+        weights = weights or DEFAULT_WEIGHTS
+        total = sum(weights.values())
+        self._sources = {
+            source: _SourceState(
+                TokenBucket(
+                    global_limit.rate * weight / total,
+                    max(global_limit.burst * weight / total, 1.0),
+                    clock,
+                )
+            )
+            for source, weight in weights.items()
+        }
+        self._users: OrderedDict[tuple[str, Hashable], TokenBucket] = OrderedDict()
+        self._chats: OrderedDict[tuple[str, Hashable], TokenBucket] = OrderedDict()
+
+    def try_acquire(
+        self,
+        source: str,
+        *,
+        user: Hashable | None = None,
+        chat: Hashable | None = None,
+    ) -> float:
+        """
+        Admit one request if every quota it falls under allows it.
+
+        Args:
+            source: Where the request comes from, e.g. SOURCE_TELEGRAM
+            user: The requesting user, within the source
+            chat: The chat or conversation, within the source
+
+        Returns:
+            0 if the request was admitted, otherwise the seconds until it would
+            be. Nothing is consumed in the latter case.
+        """
+        return self._admit(source, user, chat)[0]
+
+    async def acquire(
+        self,
+        source: str,
+        *,
+        user: Hashable | None = None,
+        chat: Hashable | None = None,
+    ) -> None:
+        """
+        Wait until a request is admitted, e.g. for background work.
+
+        Bound the wait with asyncio.timeout if needed.
+
+        Args:
+            source: Where the request comes from, e.g. SOURCE_TWITTER
+            user: The requesting user, within the source
+            chat: The chat or conversation, within the source
+        """
+        while wait := self.try_acquire(source, user=user, chat=chat):  # noqa: ASYNC110 - refill is time-based
+            await asyncio.sleep(wait)
+
+    def check(
+        self,
+        source: str,
+        *,
+        user: Hashable | None = None,
+        chat: Hashable | None = None,
+    ) -> None:
+        """
+        Admit one request or raise.
+
+        Raises:
+            QuotaExceededError: If the request is over a quota
+        """
+        wait, limit = self._admit(source, user, chat)
+        if wait:
+            raise QuotaExceededError(limit, wait)
+
+    def metrics(self) -> QuotaMetrics:
+        """Return the global budget, tracked keys and per-source counters."""
+        with self._lock:
+            return QuotaMetrics(
+                global_available=self._global.available(),
+                tracked_users=len(self._users),
+                tracked_chats=len(self._chats),
+                sources={
+                    source: SourceMetrics(
+                        admitted=state.admitted,
+                        borrowed=state.borrowed,
+                        throttled=dict(state.throttled),
+                    )
+                    for source, state in self._sources.items()
+                },
+            )
+
+    def _admit(
+        self, source: str, user: Hashable | None, chat: Hashable | None
+    ) -> tuple[float, str]:
+        """Admit a request, or return the wait and the limit that blocks it."""
+        state = self._sources.get(source)
+        if state is None:
+            raise ValueError(ERR_UNKNOWN_SOURCE, source)
+        with self._lock:
+            buckets: list[tuple[str, TokenBucket]] = []
+            if user is not None and self.user_limit:
+                bucket = self._bucket(self._users, (source, user), self.user_limit)
+                buckets.append((LIMIT_USER, bucket))
+            if chat is not None and self.chat_limit:
+                bucket = self._bucket(self._chats, (source, chat), self.chat_limit)
+                buckets.append((LIMIT_CHAT, bucket))
+            buckets.append((LIMIT_GLOBAL, self._global))
+            for limit, bucket in buckets:
+                if wait := _wait(bucket):
+                    return self._throttle(state, limit, wait)
+
+            within_share = state.bucket.available() >= 1
+            # Borrowers leave the lower half of the global bucket to sources
+            # within their share
+            if (
+                not within_share
+                and self._global.available() - 1 < self._global.capacity / 2
+            ):
+                return self._throttle(state, LIMIT_SHARE, _wait(state.bucket))
+
+            for _limit, bucket in buckets:
+                bucket.try_acquire()
+            if within_share:
+                state.bucket.try_acquire()
+            else:
+                state.borrowed += 1
+            state.admitted += 1
+            return 0.0, ""
+
+    def _bucket(
+        self,
+        buckets: OrderedDict[tuple[str, Hashable], TokenBucket],
+        key: tuple[str, Hashable],
+        limit: Limit,
+    ) -> TokenBucket:
+        """Return the bucket of a user or chat, creating it if needed."""
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = TokenBucket(limit.rate, limit.burst, self._clock)
+            if len(buckets) > self.max_keys:
+                buckets.popitem(last=False)
+        else:
+            buckets.move_to_end(key)
+        return bucket
+
+    def _throttle(
+        self, state: _SourceState, limit: str, wait: float
+    ) -> tuple[float, str]:
+        """Count a rejected request. Caller holds the lock."""
+        state.throttled[limit] = state.throttled.get(limit, 0) + 1
+        return wait, limit
+
+
+def _wait(bucket: TokenBucket) -> float:
+    """Seconds until a bucket holds a whole token, 0 if it already does."""
+    return max(0.0, (1 - bucket.available()) / bucket.rate)
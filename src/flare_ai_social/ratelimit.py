@@ -0,0 +1,77 @@
+"""
+Rate Limit Module
+
+This module provides a token bucket for pacing outgoing requests. The bucket is
+guarded by a lock so it can be shared between the event loop and worker threads;
+callers either poll it with try_acquire or await acquire, which sleeps until
+enough tokens have accumulated.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+
+ERR_INVALID_RATE = "Token bucket rate and capacity must be positive"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Attributes:
+        rate (float): Tokens added per second
+        capacity (float): Maximum number of tokens, i.e. the allowed burst
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        if self.rate <= 0 or self.capacity <= 0:
+            raise ValueError(ERR_INVALID_RATE)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket if enough are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            0 if the tokens were taken, otherwise the seconds until they will be
+            available. Nothing is taken in the latter case.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until the tokens can be taken, then take them."""
+        while wait := self.try_acquire(tokens):  # noqa: ASYNC110 - refill is time-based
+            await asyncio.sleep(wait)
+
+    def available(self) -> float:
+        """Number of tokens currently in the bucket."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update. Caller holds the lock."""
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 import structlog
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -40,6 +41,8 @@ class Settings(BaseSettings):
     # RapidAPI configuration for X/Twitter search (required for the TwitterBot)
     rapidapi_key: str = ""
     rapidapi_host: str = "twitter241.p.rapidapi.com"
+    rapidapi_max_concurrency: int = 5  # Searches in flight at once, per the plan
+    rapidapi_max_query_length: int = 500  # Longest combined "@a OR @b" query
 
     # Twitter accounts to monitor (comma-separated list with @ symbols)
     twitter_accounts_to_monitor: str = "@FlareNetworks"
@@ -47,6 +50,20 @@ class Settings(BaseSettings):
     # Twitter monitoring interval in seconds
     twitter_polling_interval: int = 60
 
+    # Pooled HTTP connections shared by all Twitter API and RapidAPI calls
+    twitter_http_pool_size: int = 20  # Open connections in total
+    twitter_http_pool_size_per_host: int = 10  # Open connections to one host
+    twitter_http_keepalive: float = 30.0  # Seconds an idle connection stays open
+    twitter_http_timeout: float = 30.0  # Seconds before a request is abandoned
+
+    # Mention pipeline: fetch -> dedupe -> generate -> post
+    twitter_generate_workers: int = 8  # Replies generated concurrently
+    twitter_post_workers: int = 4  # Replies posted concurrently
+    twitter_pipeline_queue_size: int = 100  # Mentions buffered per stage
+    # Answered tweet IDs remembered above the per-account since_id cursors, which
+    # are persisted in state_db_path
+    twitter_max_seen_ids: int = 1000
+
     # Telegram Bot settings
     enable_telegram: bool = True  # Enable Telegram bot
     telegram_api_token: str = ""  # Required for Telegram bot
@@ -54,6 +71,85 @@ class Settings(BaseSettings):
         ""  # Comma-separated list of allowed user IDs (optional)
     )
     telegram_polling_interval: int = 5  # Seconds between checking for updates
+    telegram_summary_workers: int = 1  # Threads running the reply summarizer
+    telegram_summary_batch_size: int = 8  # Max replies summarized per worker job
+    # Milliseconds to wait for more replies before dispatching a summary batch
+    telegram_summary_batch_window_ms: int = 20
+    # Handlers running at once in each scheduler lane; each chat is sequential.
+    # The data lane serves commands and price/TVL/feed lookups, the generative
+    # lane serves LLM replies
+    telegram_data_lane_concurrency: int = 16
+    telegram_generative_lane_concurrency: int = 8
+    telegram_chat_queue_size: int = 16  # Pending updates kept per chat
+    # Which update to drop when a chat's queue is full: drop_oldest or drop_newest
+    telegram_chat_drop_policy: Literal["drop_oldest", "drop_newest"] = "drop_oldest"
+    # Stream LLM replies: send the first chunk at once, then edit the message as
+    # text arrives, at most once per interval (seconds) per chat type. Streamed
+    # replies are not summarized
+    telegram_stream_replies: bool = False
+    telegram_stream_private_edit_interval: float = 1.0
+    telegram_stream_group_edit_interval: float = 3.0
+    # Per-chat conversation sessions for LLM replies. At most telegram_max_sessions
+    # are kept in memory, least recently used first out, and sessions idle for
+    # telegram_session_idle_timeout seconds are evicted. Each keeps the last
+    # telegram_session_max_history messages; evicted sessions are spilled to the
+    # state store and resumed later if telegram_session_spill is set
+    telegram_chat_sessions: bool = True
+    telegram_max_sessions: int = 256
+    telegram_session_idle_timeout: float = 1800.0
+    telegram_session_max_history: int = 20
+    telegram_session_spill: bool = True
+    # Merge consecutive messages from one user into a single LLM reply: a burst is
+    # answered once the user has been quiet for the window, or at the latest
+    # max_wait after its first message. A window of 0 answers every message
+    telegram_coalesce_window_ms: int = 800
+    telegram_coalesce_max_wait_ms: int = 3000
+    # Update dumps for diagnostics: a random sample and/or every update from the
+    # comma-separated chat IDs is logged at debug level, and optionally recorded
+    # as JSON lines for replay-telegram
+    telegram_debug_sample_rate: float = 0.0
+    telegram_debug_chats: str = ""
+    telegram_debug_record_path: Path | None = None
+    # Webhook mode: set to the public HTTPS URL of the API's
+    # /api/routes/telegram/webhook route to receive updates instead of polling
+    telegram_webhook_url: str = ""
+    telegram_webhook_secret: str = ""  # Checked against X-Telegram-Bot-Api-Secret-Token
+
+    # Dune market data cache (/tvl and token price replies)
+    market_data_ttl: int = 300  # Seconds before a cached query result is refreshed
+    market_data_cache_path: Path = Path("cache") / "market_data.json"
+
+    # Flare network access for FTSO feed lookups
+    flare_rpc_url: str = "https://coston2-api.flare.network/ext/C/rpc"
+    ftsov2_address: str = "0x3d893C53D9e8056135C26C8c638B76C8b60Df726"
+    flare_rpc_pool_size: int = 16  # Max pooled HTTP connections to the RPC node
+    # Milliseconds to collect feed lookups into one getFeedsById call
+    ftso_batch_window_ms: int = 50
+    # Seconds after a feed's on-chain timestamp during which its value is cached
+    ftso_cache_horizon: float = 2.0
+    # Comma-separated feed symbols registered for /prices and symbol lookups
+    ftso_feed_symbols: str = (
+        "FLR/USD,SGB/USD,BTC/USD,ETH/USD,XRP/USD,DOGE/USD,SOL/USD,USDC/USD,USDT/USD"
+    )
+    ftso_registry_refresh_interval: int = 3600  # Seconds between index refreshes
+
+    # Embedded SQLite store for subscriptions, cursors and per-chat state
+    state_db_path: Path = Path("cache") / "state.db"
+    state_flush_interval: float = 1.0  # Seconds between batched commits
+
+    # LLM request quotas, shared in this process by Telegram, Twitter and the HTTP
+    # API. The global rate is split between them by weight, and a source over its
+    # share borrows capacity the others leave unused. Each user and chat also has
+    # its own limit. Rates are requests per minute, bursts are requests
+    quota_global_per_minute: float = 120
+    quota_global_burst: float = 20
+    quota_user_per_minute: float = 6
+    quota_user_burst: float = 3
+    quota_chat_per_minute: float = 20
+    quota_chat_burst: float = 5
+    quota_telegram_weight: float = 2.0
+    quota_twitter_weight: float = 1.0
+    quota_api_weight: float = 1.0
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -69,6 +165,24 @@ class Settings(BaseSettings):
             account.strip() for account in self.twitter_accounts_to_monitor.split(",")
         ]
 
+    @property
+    def debug_chat_ids(self) -> list[int]:
+        """Parse the comma-separated list of chats whose updates are dumped."""
+        return [
+            int(chat_id)
+            for chat_id in self.telegram_debug_chats.split(",")
+            if chat_id.strip()
+        ]
+
+    @property
+    def feed_symbols(self) -> list[str]:
+        """Parse the comma-separated list of registered FTSO feed symbols."""
+        return [
+            symbol.strip()
+            for symbol in self.ftso_feed_symbols.split(",")
+            if symbol.strip()
+        ]
+
     @property
     def telegram_allowed_user_ids(self) -> list[int]:
         """Parse the comma-separated list of allowed Telegram user IDs."""
@@ -0,0 +1,185 @@
+"""
+State Store Module
+
+This module persists small pieces of bot state, such as monitor subscriptions,
+feed cursors and per-chat settings, in an embedded SQLite database running in
+WAL mode. Values are JSON documents keyed by (namespace, key). Writes are
+buffered in memory and committed in one transaction per flush interval, and each
+namespace is read only when a component first asks for it, so a restart costs a
+handful of small queries.
+"""
+
+import asyncio
+import contextlib
+import json
+import sqlite3
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+ERR_STORE_NOT_OPEN = "State store not open."
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID
+"""
+_DELETED = object()
+
+
+class StateStore:
+    """
+    Namespaced key-value store backed by SQLite with write-behind batching.
+
+    Attributes:
+        path (Path | str): Database file, or ":memory:" for a process-local store
+        flush_interval (float): Seconds between commits of buffered writes
+    """
+
+    def __init__(
+        self, path: Path | str = ":memory:", flush_interval: float = 1.0
+    ) -> None:
+        self.path = path
+        self.flush_interval = flush_interval
+        # A single thread owns the connection, which also serialises all queries
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="state-store"
+        )
+        self._conn: sqlite3.Connection | None = None
+        self._pending: dict[tuple[str, str], Any] = {}
+        self._flusher: asyncio.Task[None] | None = None
+
+    async def open(self) -> None:
+        """Open the database and start committing buffered writes."""
+        if self._conn:
+            return
+        loop = asyncio.get_running_loop()
+        self._conn = await loop.run_in_executor(self._executor, self._connect)
+        self._flusher = asyncio.create_task(self._flush_loop())
+        logger.info("State store opened", path=str(self.path))
+
+    async def close(self) -> None:
+        """Commit buffered writes and close the database."""
+        if self._flusher:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        if self._conn:
+            await self.flush()
+            conn, self._conn = self._conn, None
+            await asyncio.get_running_loop().run_in_executor(self._executor, conn.close)
+
+    async def load(self, namespace: str) -> dict[str, Any]:
+        """
+        Read every entry of a namespace, including writes not yet committed.
+
+        Args:
+            namespace: Namespace to read, e.g. "monitor_chats"
+
+        Returns:
+            Mapping of key to decoded value
+        """
+        # Snapshot first: a flush may commit and clear these while the query runs
+        pending = dict(self._pending)
+        rows = await self._run(
+            lambda conn: conn.execute(
+                "SELECT key, value FROM kv WHERE namespace = ?", (namespace,)
+            ).fetchall()
+        )
+        values = {key: json.loads(value) for key, value in rows}
+        for (ns, key), value in pending.items():
+            if ns != namespace:
+                continue
+            if value is _DELETED:
+                values.pop(key, None)
+            else:
+                values[key] = value
+        return values
+
+    async def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """Read a single value, or default if it is not stored."""
+        if (namespace, key) in self._pending:
+            value = self._pending[namespace, key]
+            return default if value is _DELETED else value
+        row = await self._run(
+            lambda conn: conn.execute(
+                "SELECT value FROM kv WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        )
+        return json.loads(row[0]) if row else default
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Buffer a write of a JSON-serialisable value."""
+        self._pending[namespace, key] = value
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Buffer the removal of a key."""
+        self._pending[namespace, key] = _DELETED
+
+    async def flush(self) -> None:
+        """Commit all buffered writes in a single transaction."""
+        if not self._pending or not self._conn:
+            return
+        batch, self._pending = self._pending, {}
+        upserts = [
+            (ns, key, json.dumps(value))
+            for (ns, key), value in batch.items()
+            if value is not _DELETED
+        ]
+        deletes = [key for key, value in batch.items() if value is _DELETED]
+
+        def write(conn: sqlite3.Connection) -> None:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO kv (namespace, key, value) VALUES (?, ?, ?) "
+                    "ON CONFLICT (namespace, key) DO UPDATE SET value = excluded.value",
+                    upserts,
+                )
+                conn.executemany(
+                    "DELETE FROM kv WHERE namespace = ? AND key = ?", deletes
+                )
+
+        try:
+            await self._run(write)
+        except Exception:
+            # Keep the batch unless newer writes to the same keys arrived meanwhile
+            self._pending = batch | self._pending
+            raise
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection and create the schema. Runs on the store thread."""
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        return conn
+
+    async def _run(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """Run fn(connection) on the store thread."""
+        if self._conn is None:
+            raise RuntimeError(ERR_STORE_NOT_OPEN)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, self._conn)
+
+    async def _flush_loop(self) -> None:
+        """Commit buffered writes every flush_interval seconds."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("State store flush failed")
@@ -1,3 +1,39 @@
+from .broadcast import Broadcaster, BroadcastResult
+from .classifier import Classification, Intent, MessageClassifier
+from .coalescer import CoalescerMetrics, MessageCoalescer
+from .debug import UpdateDebugger
+from .feed_monitor import FeedMonitor, FeedMonitorMetrics, FeedPost
+from .scheduler import (
+    DATA_LANE,
+    GENERATIVE_LANE,
+    ChatUpdateProcessor,
+    LaneMetrics,
+    SchedulerMetrics,
+)
 from .service import TelegramBot
+from .streaming import StreamingMetrics, StreamingReplier
+from .summary import SummaryMetrics, SummaryService
 
-__all__ = ["TelegramBot"]
+__all__ = [
+    "DATA_LANE",
+    "GENERATIVE_LANE",
+    "BroadcastResult",
+    "Broadcaster",
+    "ChatUpdateProcessor",
+    "Classification",
+    "CoalescerMetrics",
+    "FeedMonitor",
+    "FeedMonitorMetrics",
+    "FeedPost",
+    "Intent",
+    "LaneMetrics",
+    "MessageClassifier",
+    "MessageCoalescer",
+    "SchedulerMetrics",
+    "StreamingMetrics",
+    "StreamingReplier",
+    "SummaryMetrics",
+    "SummaryService",
+    "TelegramBot",
+    "UpdateDebugger",
+]
@@ -0,0 +1,188 @@
+"""
+Broadcast Module
+
+This module fans a message out to many Telegram chats. Sends run concurrently
+but are paced by token buckets that mirror Telegram's limits: about 30 messages
+per second overall, one per second to a private chat and 20 per minute to a
+group. Flood-control errors are waited out as instructed by RetryAfter, network
+errors are retried with backoff, and a chat is only reported for removal when
+Telegram says it can never be reached again.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
+
+import structlog
+from telegram import Bot
+from telegram.error import (
+    BadRequest,
+    ChatMigrated,
+    Forbidden,
+    NetworkError,
+    RetryAfter,
+    TelegramError,
+)
+
+from flare_ai_social.ratelimit import TokenBucket
+
+logger = structlog.get_logger(__name__)
+
+GLOBAL_RATE = 30.0
+PRIVATE_CHAT_RATE = 1.0
+GROUP_CHAT_RATE = 20 / 60
+
+# BadRequest descriptions that mean the chat is gone for good, as opposed to a
+# problem with the message itself that would fail for every chat
+PERMANENT_BAD_REQUESTS = (
+    "chat not found",
+    "user is deactivated",
+    "bot was kicked",
+    "not enough rights",
+    "have no rights to send",
+    "chat_write_forbidden",
+)
+
+
+@dataclass(frozen=True)
+class BroadcastResult:
+    """Outcome of a broadcast"""
+
+    delivered: int
+    failed: int
+    unsubscribed: list[int] = field(default_factory=list)
+    migrated: dict[int, int] = field(default_factory=dict)
+
+
+class Broadcaster:
+    """
+    Rate-limited, concurrent sender of one message to many chats.
+
+    Attributes:
+        bot (Bot): Bot used to send the messages
+        max_concurrency (int): Maximum number of sends in flight
+        max_retries (int): Retries of a send after flood or network errors
+        max_chats (int): Per-chat buckets kept, least recently used first out
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        bot: Bot,
+        *,
+        global_rate: float = GLOBAL_RATE,
+        private_chat_rate: float = PRIVATE_CHAT_RATE,
+        group_chat_rate: float = GROUP_CHAT_RATE,
+        max_concurrency: int = 64,
+        max_retries: int = 3,
+        max_chats: int = 10_000,
+    ) -> None:
+        self.bot = bot
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.max_chats = max_chats
+        self.private_chat_rate = private_chat_rate
+        self.group_chat_rate = group_chat_rate
+        self._global = TokenBucket(global_rate)
+        # Shared by overlapping broadcasts, so a chat is paced across all of them
+        self._chats: OrderedDict[int, TokenBucket] = OrderedDict()
+
+    async def broadcast(
+        self, chat_ids: Iterable[int], text: str, **kwargs: Any
+    ) -> BroadcastResult:
+        """
+        Send a message to every chat.
+
+        Args:
+            chat_ids: Chats to send to
+            text: Message text
+            **kwargs: Extra arguments for Bot.send_message, e.g. parse_mode
+
+        Returns:
+            Delivery counts, chats that should be unsubscribed and chats that
+            migrated to a new ID
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        unsubscribed: list[int] = []
+        migrated: dict[int, int] = {}
+
+        async def send(chat_id: int) -> bool:
+            async with semaphore:
+                return await self._send(chat_id, text, kwargs, unsubscribed, migrated)
+
+        chat_ids = list(chat_ids)
+        results = await asyncio.gather(*(send(chat_id) for chat_id in chat_ids))
+        delivered = sum(results)
+        logger.info(
+            "Broadcast finished",
+            chats=len(chat_ids),
+            delivered=delivered,
+            unsubscribed=len(unsubscribed),
+        )
+        return BroadcastResult(
+            delivered=delivered,
+            failed=len(chat_ids) - delivered,
+            unsubscribed=unsubscribed,
+            migrated=migrated,
+        )
+
+    async def _send(
+        self,
+        chat_id: int,
+        text: str,
+        kwargs: dict[str, Any],
+        unsubscribed: list[int],
+        migrated: dict[int, int],
+    ) -> bool:
+        """Send to one chat, retrying transient errors. Returns True on delivery."""
+        target = chat_id
+        for attempt in range(self.max_retries + 1):
+            await self._bucket(target).acquire()
+            await self._global.acquire()
+            try:
+                await self.bot.send_message(chat_id=target, text=text, **kwargs)
+            except RetryAfter as e:
+                delay = retry_after_seconds(e.retry_after)
+                logger.warning("Flood control hit", chat_id=target, retry_after=delay)
+                await asyncio.sleep(delay)
+            except ChatMigrated as e:
+                migrated[chat_id] = target = e.new_chat_id
+            except Forbidden:
+                unsubscribed.append(target)
+                return False
+            except BadRequest as e:
+                if any(s in e.message.lower() for s in PERMANENT_BAD_REQUESTS):
+                    unsubscribed.append(target)
+                else:
+                    logger.warning("Broadcast rejected", chat_id=target, error=str(e))
+                return False
+            except NetworkError:
+                await asyncio.sleep(2**attempt)
+            except TelegramError as e:
+                logger.warning("Broadcast failed", chat_id=target, error=str(e))
+                return False
+            else:
+                return True
+        logger.warning("Broadcast retries exhausted", chat_id=target)
+        return False
+
+    def _bucket(self, chat_id: int) -> TokenBucket:
+        """Return the per-chat bucket, group chats having negative IDs."""
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            rate = self.group_chat_rate if chat_id < 0 else self.private_chat_rate
+            bucket = self._chats[chat_id] = TokenBucket(rate, capacity=1)
+            if len(self._chats) > self.max_chats:
+                self._chats.popitem(last=False)
+        else:
+            self._chats.move_to_end(chat_id)
+        return bucket
+
+
+def retry_after_seconds(retry_after: float | timedelta) -> float:
+    """Normalise RetryAfter.retry_after, which may be seconds or a timedelta."""
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
@@ -0,0 +1,157 @@
+"""
+Message Classifier Module
+
+This module decides what the bot should do with an incoming text message. The
+patterns depend only on the bot's identity and the registered feed symbols, so
+they are compiled once per bot. A message is classified with at most a couple of
+regex scans; group-chat chatter that neither mentions the bot nor asks for data,
+by far the most common case, is rejected by a single scan of the raw text.
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import StrEnum
+
+from telegram import Update
+
+GROUP_CHAT_TYPES = frozenset({"group", "supergroup", "channel"})
+
+
+class Intent(StrEnum):
+    """What a message asks the bot to do"""
+
+    PRICE = "price"  # Token price table
+    TVL = "tvl"  # /tvl command
+    FEED = "feed"  # FTSO feed lookup by symbol or hex feed ID
+    COMMAND = "command"  # Any other bot command
+    MENTION = "mention"  # Group message mentioning the bot
+    REPLY = "reply"  # Group message replying to the bot
+    DIRECT = "direct"  # Private message for the LLM
+    IGNORE = "ignore"  # Group chatter not addressed to the bot
+
+
+DATA_INTENTS = frozenset({Intent.PRICE, Intent.TVL, Intent.FEED, Intent.COMMAND})
+
+
+@dataclass(frozen=True)
+class Classification:
+    """Intent of a message and the text the handler should act on"""
+
+    intent: Intent
+    text: str
+
+    @property
+    def is_data(self) -> bool:
+        """Whether the message is answered from market or feed data."""
+        return self.intent in DATA_INTENTS
+
+
+IGNORED = Classification(Intent.IGNORE, "")
+
+
+class MessageClassifier:
+    """
+    One-pass intent classifier for a specific bot.
+
+    Attributes:
+        bot_id (int | None): Telegram user ID of the bot, for reply detection
+        username (str | None): Bot username without the @, for mention detection
+    """
+
+    def __init__(
+        self,
+        bot_id: int | None = None,
+        username: str | None = None,
+        symbols: Iterable[str] = (),
+    ) -> None:
+        self.bot_id = bot_id
+        self.username = username
+        self._symbols = frozenset(symbol.upper() for symbol in symbols)
+        self._max_symbol_length = max(map(len, self._symbols), default=0)
+        self._hex_id = re.compile(r"0x[0-9a-fA-F]*")
+        self._token = re.compile("token", re.IGNORECASE)
+        self._tvl = re.compile(r"/tvl(?:@\w+)?(?:\s|$)", re.IGNORECASE)
+        self._mention = (
+            re.compile(rf"@{re.escape(username)}(?!\w)", re.IGNORECASE)
+            if username
+            else None
+        )
+        # Everything that can make a group message relevant, in one alternation
+        triggers = ["token"]
+        if username:
+            triggers.append(rf"@{re.escape(username)}(?!\w)")
+        self._group_trigger = re.compile("|".join(triggers), re.IGNORECASE)
+
+    def classify(
+        self, text: str, *, is_group: bool = False, reply_to_bot: bool = False
+    ) -> Classification:
+        """
+        Classify a message.
+
+        Args:
+            text: Message text
+            is_group: Whether the message was sent to a group or channel
+            reply_to_bot: Whether the message replies to one of the bot's messages
+
+        Returns:
+            The intent and the cleaned text, with any bot mention removed
+        """
+        if is_group and not reply_to_bot and self._is_chatter(text):
+            return IGNORED
+
+        stripped = text.strip()
+        intent = self._data_intent(stripped)
+        if intent:
+            return Classification(intent, stripped)
+        if not is_group:
+            return Classification(Intent.DIRECT, stripped)
+        if self._mention and self._mention.search(stripped):
+            cleaned = self._mention.sub("", stripped).strip()
+            return Classification(Intent.MENTION, cleaned or "Hello")
+        return Classification(Intent.REPLY, stripped) if reply_to_bot else IGNORED
+
+    def classify_update(self, update: Update) -> Classification:
+        """
+        Classify the message of an update.
+
+        Args:
+            update: Telegram update
+
+        Returns:
+            The classification, IGNORE for updates without message text
+        """
+        message = update.message
+        if not message or not message.text:
+            return IGNORED
+        reply_to = message.reply_to_message
+        return self.classify(
+            message.text,
+            is_group=message.chat.type in GROUP_CHAT_TYPES,
+            reply_to_bot=bool(
+                self.bot_id
+                and reply_to
+                and reply_to.from_user
+                and reply_to.from_user.id == self.bot_id
+            ),
+        )
+
+    def _is_chatter(self, text: str) -> bool:
+        """Fast path: whether a group message cannot concern the bot at all."""
+        return (
+            not text.startswith(("0x", "/"))
+            and len(text) > self._max_symbol_length
+            and not self._group_trigger.search(text)
+        )
+
+    def _data_intent(self, text: str) -> Intent | None:
+        """Return the data intent of a stripped message, if it has one."""
+        if text.startswith("/"):
+            return Intent.TVL if self._tvl.match(text) else Intent.COMMAND
+        if self._token.search(text):
+            return Intent.PRICE
+        if self._hex_id.fullmatch(text) or (
+            len(text) <= self._max_symbol_length and text.upper() in self._symbols
+        ):
+            return Intent.FEED
+        return None
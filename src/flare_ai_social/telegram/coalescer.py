@@ -0,0 +1,191 @@
+"""
+Message Coalescer Module
+
+This module merges bursts of short consecutive messages from the same user into
+a single LLM prompt and reply. Messages are registered as they arrive, before
+their handlers run, so the handler of the first message in a burst can wait
+until the user has been quiet for the coalescing window and then answer all of
+them at once; the handlers of the other messages find their text already taken
+and return without replying. If more text arrives while the merged prompt is
+still being generated, the generation is cancelled and the burst is answered
+again, including the new text, by the handler of a later message. A message
+whose handler never runs, e.g. because the scheduler dropped it, is discarded,
+and a burst left unanswered past the maximum wait is replaced by the next one.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CoalescerMetrics:
+    """Counts of coalesced messages and superseded generations"""
+
+    pending: int  # Bursts waiting for an answer
+    answered: int  # Bursts answered with one reply
+    merged: int  # Messages answered as part of another message's reply
+    superseded: int  # Generations cancelled because more text arrived
+
+
+@dataclass
+class _Burst:
+    """Consecutive messages of one user awaiting a single reply"""
+
+    first_arrival: float
+    last_arrival: float
+    parts: dict[int, str] = field(default_factory=dict)  # Message ID -> text
+    task: asyncio.Task[Any] | None = None  # Generation in flight
+
+
+class MessageCoalescer:
+    """
+    Debounces bursts of messages per key, e.g. per (chat, user).
+
+    Attributes:
+        window (float): Seconds of quiet after the last message before answering
+        max_wait (float): Seconds after the first message after which the burst
+            is answered even if the user keeps typing
+    """
+
+    def __init__(
+        self,
+        window: float = 0.8,
+        max_wait: float = 3.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window = window
+        self.max_wait = max_wait
+        self._clock = clock
+        self._bursts: dict[Hashable, _Burst] = {}
+        self._answered = 0
+        self._merged = 0
+        self._superseded = 0
+
+    def add(self, key: Hashable, message_id: int, text: str) -> None:
+        """
+        Register a message when it arrives, before its handler runs.
+
+        Args:
+            key: Coalescing key, e.g. (chat ID, user ID)
+            message_id: Telegram message ID
+            text: Message text
+        """
+        now = self._clock()
+        burst = self._bursts.get(key)
+        if (
+            burst is None
+            or (burst.task and burst.task.done())
+            or (burst.task is None and now - burst.first_arrival > self.max_wait)
+        ):
+            # The previous burst has its answer, or is stale because its handler
+            # never ran, so this message starts a new one
+            burst = self._bursts[key] = _Burst(now, now)
+        elif burst.task:
+            burst.task.cancel()
+            burst.task = None
+            self._superseded += 1
+            logger.debug("Generation superseded by new message", key=key)
+        burst.parts[message_id] = text
+        burst.last_arrival = now
+
+    async def run(
+        self,
+        key: Hashable,
+        message_id: int,
+        generate: Callable[[str], Awaitable[T]],
+    ) -> T | None:
+        """
+        Answer a message's burst, unless another handler already did.
+
+        Waits for the coalescing window, then generates from the merged text of
+        every message in the burst.
+
+        Args:
+            key: Coalescing key the message was added under
+            message_id: Telegram message ID the handler is running for
+            generate: Produces the answer from the merged prompt. It is
+                cancelled if the burst grows before it finishes.
+
+        Returns:
+            The answer, or None if the message is answered by another handler
+        """
+        burst = self._bursts.get(key)
+        if burst is None or message_id not in burst.parts or burst.task:
+            self._merged += 1
+            return None
+
+        try:
+            while True:
+                # Each message that arrives meanwhile pushes the deadline back
+                wait = self._deadline(burst) - self._clock()
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self._discard(key, burst)
+            raise
+
+        task = burst.task = asyncio.create_task(
+            generate("\n".join(burst.parts.values()))
+        )
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if not task.cancelled() or (current and current.cancelling()):
+                task.cancel()
+                raise
+            # Superseded: a later message's handler answers the grown burst
+            return None
+        except Exception:
+            self._discard(key, burst)
+            raise
+        self._discard(key, burst)
+        self._answered += 1
+        return result
+
+    def discard(self, key: Hashable, message_id: int) -> None:
+        """
+        Forget a message whose handler will never run, e.g. a dropped update.
+
+        Text already part of an in-flight generation is left to be answered.
+
+        Args:
+            key: Coalescing key the message was added under
+            message_id: Telegram message ID
+        """
+        burst = self._bursts.get(key)
+        if burst is None or burst.task or message_id not in burst.parts:
+            return
+        del burst.parts[message_id]
+        if not burst.parts:
+            self._discard(key, burst)
+
+    def metrics(self) -> CoalescerMetrics:
+        """Return pending bursts and coalescing counters."""
+        return CoalescerMetrics(
+            pending=len(self._bursts),
+            answered=self._answered,
+            merged=self._merged,
+            superseded=self._superseded,
+        )
+
+    def _deadline(self, burst: _Burst) -> float:
+        """When a burst is answered if no further message arrives."""
+        return min(
+            burst.last_arrival + self.window, burst.first_arrival + self.max_wait
+        )
+
+    def _discard(self, key: Hashable, burst: _Burst) -> None:
+        """Forget an answered burst, unless a newer one replaced it."""
+        if self._bursts.get(key) is burst:
+            del self._bursts[key]
@@ -0,0 +1,120 @@
+"""
+Update Debugging Module
+
+This module provides on-demand dumps of incoming Telegram updates. Nothing is
+built for an update unless a rule selects it: a chat on the watch list, or a
+random sample at the configured rate. Selected updates are logged at debug level
+through a lazy wrapper, so the dictionary is only serialised if the log line is
+actually rendered, and can also be recorded as JSON lines for the webhook replay
+tool.
+"""
+
+import json
+import random
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+import structlog
+from telegram import Update
+
+logger = structlog.get_logger(__name__)
+
+
+def dump_update(update: Update) -> dict[str, Any]:
+    """
+    Summarise an update's message for debugging.
+
+    Args:
+        update: Telegram update
+
+    Returns:
+        Message ID, sender, chat, text, entities and the replied-to message
+    """
+    message = update.message
+    if not message:
+        return {"update_id": update.update_id}
+    text = message.text or ""
+    result: dict[str, Any] = {
+        "update_id": update.update_id,
+        "message_id": message.message_id,
+        "from_user": message.from_user.to_dict() if message.from_user else None,
+        "chat": message.chat.to_dict(),
+        "date": str(message.date),
+        "text": message.text,
+        "entities": [
+            {
+                "type": e.type,
+                "offset": e.offset,
+                "length": e.length,
+                "text": text[e.offset : e.offset + e.length],
+            }
+            for e in message.entities
+        ],
+    }
+    if reply := message.reply_to_message:
+        result["reply_to_message"] = {
+            "message_id": reply.message_id,
+            "from_user": reply.from_user.to_dict() if reply.from_user else None,
+            "text": reply.text,
+        }
+    return result
+
+
+class _LazyDump:
+    """Defers dump_update until the log line holding it is rendered"""
+
+    __slots__ = ("update",)
+
+    def __init__(self, update: Update) -> None:
+        self.update = update
+
+    def __repr__(self) -> str:
+        return repr(dump_update(self.update))
+
+
+class UpdateDebugger:
+    """
+    Sampled, lazily serialised update dumps.
+
+    Attributes:
+        sample_rate (float): Fraction of all updates to dump, 0 to disable
+        chat_ids (frozenset[int]): Chats whose updates are always dumped
+        record_path (Path | None): JSON lines file receiving the raw updates
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        chat_ids: Iterable[int] = (),
+        record_path: Path | None = None,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.chat_ids = frozenset(chat_ids)
+        self.record_path = record_path
+        self._rng = rng
+        if record_path:
+            record_path.parent.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any rule can select an update."""
+        return self.sample_rate > 0 or bool(self.chat_ids)
+
+    def selects(self, update: Update) -> bool:
+        """Whether an update matches a watch-list or sampling rule."""
+        chat = update.effective_chat
+        if chat and chat.id in self.chat_ids:
+            return True
+        return self.sample_rate > 0 and self._rng() < self.sample_rate
+
+    def observe(self, update: Update) -> None:
+        """Dump an update if a rule selects it."""
+        if not self.selects(update):
+            return
+        logger.debug("Update dump", update=_LazyDump(update))
+        if self.record_path:
+            # Only sampled updates get here, so a blocking append is acceptable
+            with self.record_path.open("a") as f:
+                f.write(json.dumps(update.to_dict()) + "\n")
@@ -0,0 +1,104 @@
+"""
+Feed Monitor Module
+
+This module polls the @FlareNetworks RSS feed for new posts. Requests are
+conditional (ETag / If-Modified-Since), so an unchanged feed costs a single 304
+response, and parsing happens in a worker thread only when the feed changed.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from http import HTTPStatus
+
+import feedparser
+import httpx
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+NITTER_RSS_URL = "https://nitter.net/FlareNetworks/rss"
+
+
+@dataclass(frozen=True)
+class FeedPost:
+    """The parts of an RSS entry that are broadcast to monitoring chats"""
+
+    id: str
+    title: str
+    link: str
+
+
+@dataclass(frozen=True)
+class FeedMonitorMetrics:
+    """Counters of the feed polls made so far"""
+
+    polls: int
+    not_modified: int
+    parsed: int
+
+
+class FeedMonitor:
+    """
+    Conditional-GET poller of an RSS feed.
+
+    Attributes:
+        url (str): RSS feed URL
+        timeout (float): Request timeout in seconds
+    """
+
+    def __init__(self, url: str = NITTER_RSS_URL, timeout: float = 30) -> None:
+        self.url = url
+        self.timeout = timeout
+        self._client: httpx.AsyncClient | None = None
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._polls = 0
+        self._not_modified = 0
+        self._parsed = 0
+
+    async def fetch_latest(self) -> FeedPost | None:
+        """
+        Fetch the newest post if the feed changed since the previous poll.
+
+        Returns:
+            The newest post, or None if the feed is unchanged or empty
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        headers: dict[str, str] = {}
+        if self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+
+        self._polls += 1
+        response = await self._client.get(self.url, headers=headers)
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            self._not_modified += 1
+            return None
+        response.raise_for_status()
+        self._etag = response.headers.get("ETag")
+        self._last_modified = response.headers.get("Last-Modified")
+
+        feed = await asyncio.to_thread(feedparser.parse, response.content)
+        self._parsed += 1
+        if not feed.entries:
+            return None
+        entry = feed.entries[0]
+        return FeedPost(
+            id=entry.get("id", entry.get("link", "")),
+            title=entry.get("title", ""),
+            link=entry.get("link", ""),
+        )
+
+    def metrics(self) -> FeedMonitorMetrics:
+        """Return poll, not-modified and parse counters."""
+        return FeedMonitorMetrics(
+            polls=self._polls, not_modified=self._not_modified, parsed=self._parsed
+        )
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
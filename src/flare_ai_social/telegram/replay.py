@@ -0,0 +1,105 @@
+"""
+Webhook Replay Module
+
+This module stands in for Telegram when testing webhook mode locally. It reads
+recorded updates, one JSON object per line, and POSTs them to the webhook route
+with the secret token header, reporting the status codes and request latencies.
+
+Usage:
+    uv run replay-telegram updates.jsonl --secret <token>
+"""
+
+import argparse
+import asyncio
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import httpx
+import structlog
+
+from flare_ai_social.api.routes.telegram import SECRET_TOKEN_HEADER
+from flare_ai_social.metrics import LatencyRecorder
+from flare_ai_social.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+DEFAULT_WEBHOOK_URL = "http://localhost:8080/api/routes/telegram/webhook"
+
+
+def load_updates(path: Path) -> list[dict[str, Any]]:
+    """
+    Read recorded updates from a JSON lines file.
+
+    Args:
+        path: File with one Telegram update object per line
+
+    Returns:
+        The decoded updates, in file order
+    """
+    with path.open() as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+async def replay(
+    updates: list[dict[str, Any]], url: str, secret: str, concurrency: int = 1
+) -> tuple[Counter[int], LatencyRecorder]:
+    """
+    POST updates to a webhook endpoint.
+
+    Args:
+        updates: Telegram update objects
+        url: Webhook URL
+        secret: Secret token sent in the X-Telegram-Bot-Api-Secret-Token header
+        concurrency: Number of requests in flight, 1 preserves update order
+
+    Returns:
+        Counts of response status codes and the request latencies
+    """
+    statuses: Counter[int] = Counter()
+    latency = LatencyRecorder(window=max(len(updates), 1))
+    queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    for update in updates:
+        queue.put_nowait(update)
+
+    async with httpx.AsyncClient(headers={SECRET_TOKEN_HEADER: secret}) as client:
+
+        async def worker() -> None:
+            while not queue.empty():
+                update = queue.get_nowait()
+                with latency.time():
+                    response = await client.post(url, json=update)
+                statuses[response.status_code] += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return statuses, latency
+
+
+def start() -> None:
+    """Replay recorded updates from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Replay recorded Telegram updates against the webhook route."
+    )
+    parser.add_argument("path", type=Path, help="JSON lines file of updates")
+    parser.add_argument("--url", default=DEFAULT_WEBHOOK_URL)
+    parser.add_argument("--secret", default=settings.telegram_webhook_secret)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+
+    updates = load_updates(args.path)
+    statuses, latency = asyncio.run(
+        replay(updates, args.url, args.secret, args.concurrency)
+    )
+    stats = latency.snapshot()
+    logger.info(
+        "Replay finished",
+        updates=len(updates),
+        statuses=dict(statuses),
+        p50_ms=round(stats.p50 * 1000, 1),
+        p99_ms=round(stats.p99 * 1000, 1),
+    )
+
+
+if __name__ == "__main__":
+    start()
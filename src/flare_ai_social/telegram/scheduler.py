@@ -0,0 +1,254 @@
+"""
+Update Scheduler Module
+
+This module provides the update processor the Telegram Application runs handlers
+through. Every update is classified into a lane when it arrives, e.g. a fast lane
+for price and TVL lookups and a slow lane for LLM replies. Each lane has its own
+concurrency limit and latency metrics, so a saturated generative lane never holds
+up data lookups. Within a lane, updates from different chats run concurrently
+while updates from the same chat run strictly one after another in arrival order.
+Each chat has a bounded queue per lane, so a flood in one chat cannot build up
+unbounded work: once it is full the oldest or the newest pending update is
+dropped, depending on the configured policy, and reported to a drop callback.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine, Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import structlog
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+from flare_ai_social.metrics import LatencyRecorder, LatencyStats
+
+logger = structlog.get_logger(__name__)
+
+DropPolicy = Literal["drop_oldest", "drop_newest"]
+
+DATA_LANE = "data"
+GENERATIVE_LANE = "generative"
+DEFAULT_LANES = {DATA_LANE: 16, GENERATIVE_LANE: 8}
+
+
+@dataclass(frozen=True)
+class LaneMetrics:
+    """Load and latency of one scheduler lane"""
+
+    running: int
+    queued: int
+    dropped: int
+    queue_wait: LatencyStats
+    latency: LatencyStats
+
+
+@dataclass(frozen=True)
+class SchedulerMetrics:
+    """Snapshot of the update scheduler's load"""
+
+    active_chats: int
+    lanes: dict[str, LaneMetrics]
+
+
+@dataclass
+class _Pending:
+    """A queued handler coroutine, its update and its arrival time"""
+
+    update: object
+    coro: Coroutine[Any, Any, Any]
+    enqueued_at: float
+
+
+class _Lane:
+    """Concurrency limit, counters and latency recorders of one lane"""
+
+    def __init__(self, concurrency: int) -> None:
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.queue_wait = LatencyRecorder()
+        self.latency = LatencyRecorder()
+        self.running = 0
+        self.dropped = 0
+
+
+def chat_key(update: object) -> Hashable | None:
+    """
+    Return the key updates are ordered by.
+
+    Args:
+        update: Update received by the Application
+
+    Returns:
+        The chat ID, the user ID for chat-less updates such as inline queries,
+        or None if the update needs no ordering
+    """
+    if not isinstance(update, Update):
+        return None
+    if update.effective_chat:
+        return update.effective_chat.id
+    if update.effective_user:
+        return ("user", update.effective_user.id)
+    return None
+
+
+class ChatUpdateProcessor(BaseUpdateProcessor):
+    """
+    Update processor with classified lanes and per-chat ordering.
+
+    Attributes:
+        classify (Callable[[object], str] | None): Returns the lane of an update.
+            TelegramBot installs its classifier here if none is given.
+        default_lane (str): Lane used without a classifier, the first one
+        max_chat_queue (int): Pending updates kept per chat and lane
+        drop_policy (DropPolicy): Which update to drop when a chat queue is full
+        on_drop (Callable[[object], None] | None): Called with every update
+            whose handler will never run, dropped or discarded at shutdown.
+            TelegramBot installs its own callback here if none is given.
+    """
+
+    def __init__(
+        self,
+        lanes: Mapping[str, int] | None = None,
+        classify: Callable[[object], str] | None = None,
+        max_chat_queue: int = 16,
+        drop_policy: DropPolicy = "drop_oldest",
+        on_drop: Callable[[object], None] | None = None,
+    ) -> None:
+        lanes = lanes or DEFAULT_LANES
+        super().__init__(sum(lanes.values()))
+        self.default_lane = next(iter(lanes))
+        self.classify = classify
+        self.max_chat_queue = max_chat_queue
+        self.drop_policy = drop_policy
+        self.on_drop = on_drop
+        self._lanes = {name: _Lane(limit) for name, limit in lanes.items()}
+        self._queues: dict[tuple[str, Hashable], deque[_Pending]] = {}
+        self._workers: set[asyncio.Task[None]] = set()
+
+    async def do_process_update(
+        self, update: object, coroutine: Awaitable[Any]
+    ) -> None:
+        """
+        Queue an update behind earlier updates of the same chat in its lane.
+
+        Returns as soon as the update is queued, so the Application keeps
+        fetching updates for other chats while this one waits its turn.
+        """
+        pending = _Pending(update, _as_coroutine(coroutine), time.monotonic())
+        lane = self.classify(update) if self.classify else self.default_lane
+        if lane not in self._lanes:
+            logger.warning("Update classified into unknown lane", lane=lane)
+            lane = self.default_lane
+        key = chat_key(update)
+        if key is None:
+            self._start_worker(lane, deque([pending]))
+            return
+
+        queue = self._queues.get((lane, key))
+        if queue is None:
+            queue = self._queues[lane, key] = deque([pending])
+            self._start_worker(lane, queue, key)
+            return
+
+        if len(queue) >= self.max_chat_queue:
+            self._lanes[lane].dropped += 1
+            if self.drop_policy == "drop_newest":
+                logger.warning("Chat queue full, dropping update", lane=lane, chat=key)
+                self._drop(pending)
+                return
+            logger.warning(
+                "Chat queue full, dropping oldest update", lane=lane, chat=key
+            )
+            self._drop(queue.popleft())
+        queue.append(pending)
+
+    async def initialize(self) -> None:
+        """Nothing to allocate, workers are started on demand."""
+
+    async def shutdown(self) -> None:
+        """Cancel running handlers and discard queued updates."""
+        for queue in self._queues.values():
+            while queue:
+                self._drop(queue.popleft())
+        self._queues.clear()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+    def metrics(self) -> SchedulerMetrics:
+        """Return active chats and per-lane load and latency."""
+        queued = dict.fromkeys(self._lanes, 0)
+        for (lane, _key), queue in self._queues.items():
+            queued[lane] += len(queue)
+        return SchedulerMetrics(
+            active_chats=len({key for _lane, key in self._queues}),
+            lanes={
+                name: LaneMetrics(
+                    running=lane.running,
+                    queued=queued[name],
+                    dropped=lane.dropped,
+                    queue_wait=lane.queue_wait.snapshot(),
+                    latency=lane.latency.snapshot(),
+                )
+                for name, lane in self._lanes.items()
+            },
+        )
+
+    def _drop(self, pending: _Pending) -> None:
+        """Discard a queued update without running its handler."""
+        pending.coro.close()
+        if self.on_drop:
+            try:
+                self.on_drop(pending.update)
+            except Exception:
+                logger.exception("Drop callback failed")
+
+    def _start_worker(
+        self, lane: str, queue: deque[_Pending], key: Hashable | None = None
+    ) -> None:
+        """Start a task draining a chat queue."""
+        worker = asyncio.create_task(self._drain(lane, queue, key))
+        self._workers.add(worker)
+        worker.add_done_callback(self._workers.discard)
+
+    async def _drain(
+        self, name: str, queue: deque[_Pending], key: Hashable | None
+    ) -> None:
+        """Run a chat's updates in order, then retire the queue."""
+        lane = self._lanes[name]
+        try:
+            while queue:
+                # The head stays queued until it runs, so it counts towards the bound
+                async with lane.semaphore:
+                    if not queue:
+                        break  # The waiting head was dropped meanwhile
+                    pending = queue.popleft()
+                    lane.queue_wait.observe(time.monotonic() - pending.enqueued_at)
+                    lane.running += 1
+                    try:
+                        await pending.coro
+                    except Exception:
+                        logger.exception(
+                            "Unhandled error processing update",
+                            lane=name,
+                            chat=key,
+                        )
+                    finally:
+                        lane.running -= 1
+                        lane.latency.observe(time.monotonic() - pending.enqueued_at)
+        finally:
+            if key is not None and self._queues.get((name, key)) is queue:
+                del self._queues[name, key]
+
+
+def _as_coroutine(awaitable: Awaitable[Any]) -> Coroutine[Any, Any, Any]:
+    """Wrap a non-coroutine awaitable so it can be queued and closed."""
+    if isinstance(awaitable, Coroutine):
+        return awaitable
+
+    async def wrapper() -> Any:
+        return await awaitable
+
+    return wrapper()
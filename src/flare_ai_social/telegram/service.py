@@ -1,17 +1,16 @@
 import time
-from typing import Any, cast
-from web3 import AsyncHTTPProvider, AsyncWeb3
-import feedparser
+from typing import Any, TypeVar
+import asyncio
+import contextlib
+import functools
+import math
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime
-from summarizer import Summarizer
-from dune_client.types import QueryParameter
-from dune_client.client import DuneClient
-from dune_client.query import QueryBase
 import datetime
 import time
 import structlog
 import dotenv
-from telegram import Bot, Chat, Message, MessageEntity, Update, User , InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Bot, Chat, Update, User , InlineKeyboardButton, InlineKeyboardMarkup, Message
 from telegram.error import TelegramError
 from telegram.ext import (
     Application,
@@ -19,23 +18,54 @@ from telegram.ext import (
     ContextTypes,
     MessageHandler,
     filters,
-    CallbackQueryHandler
+    CallbackQueryHandler,
+    TypeHandler,
 )
 
-from flare_ai_social.ai import BaseAIProvider
+from flare_ai_social.ai import BaseAIProvider, ChatSessionPool, ModelResponse
+from flare_ai_social.ftso import (
+    FeedReader,
+    FeedRegistry,
+    FeedValueCache,
+    FtsoClient,
+)
+from flare_ai_social.market import (
+    TOKEN_PRICES_QUERY_ID,
+    TVL_QUERY_ID,
+    MarketDataCache,
+)
+from flare_ai_social.quota import SOURCE_TELEGRAM, QuotaExceededError, QuotaManager
+from flare_ai_social.storage import StateStore
+from flare_ai_social.telegram.broadcast import Broadcaster
+from flare_ai_social.telegram.classifier import (
+    GROUP_CHAT_TYPES,
+    Intent,
+    MessageClassifier,
+)
+from flare_ai_social.telegram.coalescer import MessageCoalescer
+from flare_ai_social.telegram.debug import UpdateDebugger
+from flare_ai_social.telegram.feed_monitor import FeedMonitor
+from flare_ai_social.telegram.scheduler import (
+    DATA_LANE,
+    GENERATIVE_LANE,
+    ChatUpdateProcessor,
+)
+from flare_ai_social.telegram.streaming import StreamingReplier, prefetch
+from flare_ai_social.telegram.summary import SummaryService
 
 logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
 dotenv.load_dotenv(".env")
 
 ERR_API_TOKEN_NOT_PROVIDED = "Telegram API token not provided."
 ERR_BOT_NOT_INITIALIZED = "Bot not initialized."
 ERR_UPDATER_NOT_INITIALIZED = "Updater was not initialized"
-NITTER_RSS_URL = "https://nitter.net/FlareNetworks/rss"  # Nitter RSS feed for @FlareNetworks
 CHECK_INTERVAL = 300
-FTSOV2_ADDRESS = "0x3d893C53D9e8056135C26C8c638B76C8b60Df726"
-RPC_URL = "https://coston2-api.flare.network/ext/C/rpc"
-# ABI for FtsoV2
-ABI = '[{"inputs":[{"internalType":"address","name":"_addressUpdater","type":"address"}],"stateMutability":"nonpayable","type":"constructor"},{"inputs":[],"name":"FTSO_PROTOCOL_ID","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"fastUpdater","outputs":[{"internalType":"contract IFastUpdater","name":"","type":"address"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"fastUpdatesConfiguration","outputs":[{"internalType":"contract IFastUpdatesConfiguration","name":"","type":"address"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"getAddressUpdater","outputs":[{"internalType":"address","name":"_addressUpdater","type":"address"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"bytes21","name":"_feedId","type":"bytes21"}],"name":"getFeedById","outputs":[{"internalType":"uint256","name":"","type":"uint256"},{"internalType":"int8","name":"","type":"int8"},{"internalType":"uint64","name":"","type":"uint64"}],"stateMutability":"payable","type":"function"},{"inputs":[{"internalType":"bytes21","name":"_feedId","type":"bytes21"}],"name":"getFeedByIdInWei","outputs":[{"internalType":"uint256","name":"_value","type":"uint256"},{"internalType":"uint64","name":"_timestamp","type":"uint64"}],"stateMutability":"payable","type":"function"},{"inputs":[{"internalType":"uint256","name":"_index","type":"uint256"}],"name":"getFeedByIndex","outputs":[{"internalType":"uint256","name":"","type":"uint256"},{"internalType":"int8","name":"","type":"int8"},{"internalType":"uint64","name":"","type":"uint64"}],"stateMutability":"payable","type":"function"},{"inputs":[{"internalType":"uint256","name":"_index","type":"uint256"}],"name":"getFeedByIndexInWei","outputs":[{"internalType":"uint256","name":"_value","type":"uint256"},{"internalType":"uint64","name":"_timestamp","type":"uint64"}],"stateMutability":"payable","type":"function"},{"inputs":[{"internalType":"uint256","name":"_index","type":"uint256"}],"name":"getFeedId","outputs":[{"internalType":"bytes21","name":"","type":"bytes21"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"bytes21","name":"_feedId","type":"bytes21"}],"name":"getFeedIndex","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"bytes21[]","name":"_feedIds","type":"bytes21[]"}],"name":"getFeedsById","outputs":[{"internalType":"uint256[]","name":"","type":"uint256[]"},{"internalType":"int8[]","name":"","type":"int8[]"},{"internalType":"uint64","name":"","type":"uint64"}],"stateMutability":"payable","type":"function"},{"inputs":[{"internalType":"bytes21[]","name":"_feedIds","type":"bytes21[]"}],"name":"getFeedsByIdInWei","outputs":[{"internalType":"uint256[]","name":"_values","type":"uint256[]"},{"internalType":"uint64","name":"_timestamp","type":"uint64"}],"stateMutability":"payable","type":"function"},{"inputs":[{"internalType":"uint256[]","name":"_indices","type":"uint256[]"}],"name":"getFeedsByIndex","outputs":[{"internalType":"uint256[]","name":"","type":"uint256[]"},{"internalType":"int8[]","name":"","type":"int8[]"},{"internalType":"uint64","name":"","type":"uint64"}],"stateMutability":"payable","type":"function"},{"inputs":[{"internalType":"uint256[]","name":"_indices","type":"uint256[]"}],"name":"getFeedsByIndexInWei","outputs":[{"internalType":"uint256[]","name":"_values","type":"uint256[]"},{"internalType":"uint64","name":"_timestamp","type":"uint64"}],"stateMutability":"payable","type":"function"},{"inputs":[],"name":"relay","outputs":[{"internalType":"contract IRelay","name":"","type":"address"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"bytes32[]","name":"_contractNameHashes","type":"bytes32[]"},{"internalType":"address[]","name":"_contractAddresses","type":"address[]"}],"name":"updateContractAddresses","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"components":[{"internalType":"bytes32[]","name":"proof","type":"bytes32[]"},{"components":[{"internalType":"uint32","name":"votingRoundId","type":"uint32"},{"internalType":"bytes21","name":"id","type":"bytes21"},{"internalType":"int32","name":"value","type":"int32"},{"internalType":"uint16","name":"turnoutBIPS","type":"uint16"},{"internalType":"int8","name":"decimals","type":"int8"}],"internalType":"struct FtsoV2Interface.FeedData","name":"body","type":"tuple"}],"internalType":"struct FtsoV2Interface.FeedDataWithProof","name":"_feedData","type":"tuple"}],"name":"verifyFeedData","outputs":[{"internalType":"bool","name":"","type":"bool"}],"stateMutability":"view","type":"function"}]'  # noqa: E501
+MONITOR_CHATS_NAMESPACE = "monitor_chats"
+MONITOR_NAMESPACE = "monitor"
+LLM_INTENTS = frozenset({Intent.MENTION, Intent.REPLY, Intent.DIRECT})
 
 
 class TelegramBot:
@@ -45,6 +75,17 @@ class TelegramBot:
         api_token: str,
         allowed_user_ids: list[int] | None = None,
         polling_interval: int = 5,
+        summary_service: SummaryService | None = None,
+        market_data: MarketDataCache | None = None,
+        feed_reader: FeedReader | None = None,
+        feed_registry: FeedRegistry | None = None,
+        state_store: StateStore | None = None,
+        update_processor: ChatUpdateProcessor | None = None,
+        debugger: UpdateDebugger | None = None,
+        streamer: StreamingReplier | None = None,
+        sessions: ChatSessionPool | None = None,
+        coalescer: MessageCoalescer | None = None,
+        quota: QuotaManager | None = None,
     ) -> None:
         """
         Initialize the Telegram bot.
@@ -55,6 +96,34 @@ class TelegramBot:
             allowed_user_ids: Optional list of allowed Telegram user.
                               If empty or None, all users are allowed.
             polling_interval: Time between update checks in seconds.
+            summary_service: Shared summarizer for AI replies. A default
+                             single-worker service is created if omitted.
+            market_data: Cache of the Dune queries behind /tvl and token prices.
+                         An in-memory cache is created if omitted.
+            feed_reader: Batching reader over the pooled FtsoV2 client used for
+                         feed lookups. A reader for the default Coston2
+                         endpoint is created if omitted.
+            feed_registry: Symbol -> feed ID registry. Defaults to the standard
+                           crypto feeds on the feed reader's client.
+            state_store: Persistent store for monitor subscriptions and the
+                         feed cursor. An in-memory store is used if omitted.
+            update_processor: Scheduler running handlers concurrently across
+                              chats and in order within a chat. Updates are
+                              split into data and generative lanes by
+                              classify_update unless it has its own classifier,
+                              and dropped updates leave the coalescer through
+                              discard_update unless it has its own callback.
+            debugger: Sampling rules for update dumps. Dumps are off if omitted.
+            streamer: Delivers AI replies as they stream in, editing the sent
+                      message. Replies are generated in full and summarized
+                      if omitted.
+            sessions: Per-chat conversation sessions, so replies see earlier
+                      turns. Every message is answered without context if
+                      omitted.
+            coalescer: Merges bursts of messages from one user into a single
+                       LLM reply. Every message is answered if omitted.
+            quota: Per-user, per-chat and global LLM request quotas, shared
+                   with the other bots and the API. Unlimited if omitted.
             monitor_channels: List of channel usernames to monitor (e.g., ["flarenetworks"])
             monitor_data_file: File path to store monitored messages
         """
@@ -64,9 +133,32 @@ class TelegramBot:
             allowed_user_ids or []
         )  # Empty list means no restrictions
         self.polling_interval = polling_interval
+        self.summary_service = summary_service or SummaryService()
+        self.market_data = market_data or MarketDataCache()
+        self.feed_reader = feed_reader or FeedReader(
+            FtsoClient(), cache=FeedValueCache()
+        )
+        self.ftso = self.feed_reader.client
+        self.feed_registry = feed_registry or FeedRegistry(self.ftso)
+        self.feed_monitor = FeedMonitor()
+        self.state = state_store or StateStore()
+        self.update_processor = update_processor or ChatUpdateProcessor()
+        if self.update_processor.classify is None:
+            self.update_processor.classify = self.classify_update
+        if self.update_processor.on_drop is None:
+            self.update_processor.on_drop = self.discard_update
+        self.debugger = debugger or UpdateDebugger()
+        self.streamer = streamer
+        self.sessions = sessions
+        self.coalescer = coalescer
+        self.quota = quota
+        self._monitor_task: asyncio.Task[None] | None = None
         self.application: Application | None = None
-        self.me: User | None = None  # Will store bot's own information
-        self.active_monitor_chats = set() 
+        self.broadcaster: Broadcaster | None = None
+        self.webhook_url = ""  # Set when updates arrive by webhook
+        self.me = None  # Will store bot's own information
+        # Loaded from the state store in initialize()
+        self.active_monitor_chats: set[int] = set()
         self.last_post_id = ""
 
 
@@ -89,6 +181,72 @@ class TelegramBot:
             )
 
 
+    @property
+    def me(self) -> User | None:
+        """The bot's own user, once retrieved."""
+        return self._me
+
+    @me.setter
+    def me(self, me: User | None) -> None:
+        # Mention and reply patterns depend on the bot's identity
+        self._me = me
+        self.classifier = MessageClassifier(
+            bot_id=me.id if me else None,
+            username=me.username if me else None,
+            symbols=self._feed_symbols(),
+        )
+
+    def _feed_symbols(self) -> list[str]:
+        """Symbols of the registered feeds, recognised as feed lookups."""
+        return [feed.symbol for feed in self.feed_registry.feeds()]
+
+    def classify_update(self, update: object) -> str:
+        """
+        Pick the scheduler lane of an update.
+
+        Commands, button presses, ignored chatter and messages answered from
+        market or feed data go to the data lane. Messages that need an LLM reply
+        go to the generative lane, so slow generations never delay data lookups.
+
+        Args:
+            update: Update received by the Application
+
+        Returns:
+            DATA_LANE or GENERATIVE_LANE
+        """
+        if not isinstance(update, Update):
+            return DATA_LANE
+        classification = self.classifier.classify_update(update)
+        if classification.intent not in LLM_INTENTS:
+            return DATA_LANE
+        message = update.message
+        user = message.from_user if message else None
+        if self.coalescer and message and user and self._is_user_allowed(user.id):
+            # Registered on arrival, so the handler of the first message of a
+            # burst can see the ones queued behind it
+            self.coalescer.add(
+                (message.chat.id, user.id), message.message_id, classification.text
+            )
+        return GENERATIVE_LANE
+
+    def discard_update(self, update: object) -> None:
+        """
+        Forget an update the scheduler dropped before its handler ran.
+
+        Removes its message from the coalescer, so the text is not answered as
+        part of a later message's burst.
+
+        Args:
+            update: Update dropped by the scheduler
+        """
+        if not self.coalescer or not isinstance(update, Update):
+            return
+        message = update.message
+        if message and message.from_user:
+            self.coalescer.discard(
+                (message.chat.id, message.from_user.id), message.message_id
+            )
+
     def _is_user_allowed(self, user_id: int) -> bool:
         """
         Check if a user is allowed to use the bot.
@@ -111,62 +269,6 @@ class TelegramBot:
             return obj.to_dict()  # type: ignore[union-attr]
         return str(obj)
 
-    def _dump_update(self, update: Update) -> dict[str, Any]:
-        """Convert update to a dictionary for debugging."""
-        if not update:
-            return {"error": "Update is None"}
-        try:
-            result: dict[str, Any] = {}
-            if update.message:
-                message: Message = update.message
-                result["message"] = {
-                    "message_id": message.message_id,
-                    "from_user": self._safe_dict(message.from_user),
-                    "chat": self._safe_dict(message.chat),
-                    "date": str(message.date),
-                    "text": message.text,
-                    "has_entities": bool(message.entities),
-                }
-                if message.entities:
-                    # Cast result["message"] to dict[str, Any] for type safety
-                    msg_dict = cast(dict[str, Any], result["message"])
-                    msg_dict["entities"] = [
-                        {
-                            "type": e.type,
-                            "offset": e.offset,
-                            "length": e.length,
-                            "text": (
-                                message.text[e.offset : e.offset + e.length]
-                                if message.text
-                                else None
-                            ),
-                        }
-                        for e in message.entities
-                    ]
-                if message.reply_to_message:
-                    reply: Message = message.reply_to_message
-                    result["message"]["reply_to_message"] = {
-                        "message_id": reply.message_id,
-                        "from_user": self._safe_dict(reply.from_user),
-                        "text": reply.text,
-                    }
-                return result
-            return result
-        except Exception as e:
-            logger.exception("Error dumping update")
-            return {"error": str(e)}
-        else:
-            return {"error": "Update is None"}
-    
-    def fetch_latest_posts(self):
-        try:
-            feed = feedparser.parse(NITTER_RSS_URL)
-            if feed.entries:
-                return feed.entries[0]
-        except Exception as e:
-            logger.error(f"Error fetching RSS feed: {e}")
-            return None
-
     async def catch_all(
         self, update: Update, _context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -187,21 +289,8 @@ class TelegramBot:
     async def raw_update_handler(
         self, update: Update, _context: ContextTypes.DEFAULT_TYPE
     ) -> None:
-        """Log raw update data for debugging."""
-        try:
-            _ = self._dump_update(update)
-            if update.message and update.message.text and self.me and self.me.username:
-                possible_mentions = [
-                    f"@{self.me.username}",
-                    self.me.username,
-                    self.me.first_name,
-                ]
-                _ = any(
-                    mention.lower() in update.message.text.lower()
-                    for mention in possible_mentions
-                )
-        except Exception:
-            logger.exception("Error in raw update handler")
+        """Dump updates selected by the debugger's sampling rules."""
+        self.debugger.observe(update)
 
     async def debug_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
@@ -259,6 +348,24 @@ class TelegramBot:
         )
         logger.info("Start command handled", user_id=user_id)
 
+    async def reset_command(
+        self, update: Update, _context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        """Handle the /reset command: forget this chat's conversation."""
+        if not update.effective_user or not update.message or not update.effective_chat:
+            return
+
+        if not self._is_user_allowed(update.effective_user.id):
+            await update.message.reply_text(
+                "Sorry, you're not authorized to use this bot."
+            )
+            return
+
+        if self.sessions:
+            self.sessions.reset(update.effective_chat.id)
+        await update.message.reply_text("Conversation cleared, let's start fresh.")
+        logger.info("Conversation reset", chat_id=update.effective_chat.id)
+
     async def TVL_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """ Handle TVL related queries"""
         if not update.message or not update.effective_user or not update.effective_chat:
@@ -277,33 +384,30 @@ class TelegramBot:
             # Get current date in the format matching your data
             today = datetime.datetime.now().strftime("%Y-%m-%d 00:00:00.000 UTC")
             
-            # Fetch data from Dune
-            dune = DuneClient.from_env()
-            query_result = dune.get_latest_result(4841961) # type: ignore
-            # Extract rows from the ResultsResponse object
-            all_rows = query_result.result.rows
-            
-            # Filter rows for today's date only
-            today_rows = [row for row in all_rows if row.get("time") == today]
+            # Latest Dune result, served from the market data cache
+            snapshot = await self.market_data.get(TVL_QUERY_ID)
+            table = snapshot.table
+
+            # Rows for today's date only, already ordered by symbol
+            today_rows = table.rows_for(today)
             
             if not today_rows:
-                # If no data for today, find the most recent date with data
-                available_dates = sorted(set(row.get("time") for row in all_rows), reverse=True)
-                
-                if not available_dates:
+                # If no data for today, use the most recent date with data
+                most_recent_date = table.latest_date
+
+                if most_recent_date is None:
                     await update.message.reply_text("No price data available")
                     return
-                    
-                most_recent_date = available_dates[0] 
-                most_recent_rows = [row for row in all_rows if row.get("time") == most_recent_date]
+
+                most_recent_rows = table.rows_for(most_recent_date)
                 
                 date_obj = datetime.datetime.strptime(most_recent_date, "%Y-%m-%d 00:00:00.000 UTC")
                 formatted_date = date_obj.strftime("%B %d, %Y")
                 
                 message = f"📊 *TVL Yield on Flare Blockchain* - {formatted_date}\n\n"
                 
-                # Sort by symbol for consistent output
-                for row in sorted(most_recent_rows, key=lambda x: x.get("symbol", "")):
+                # Rows are ordered by symbol for consistent output
+                for row in most_recent_rows:
                     tvl = row.get("tvl", "")
                         
                     message += f"$*{tvl}*\n"
@@ -317,8 +421,8 @@ class TelegramBot:
                 
                 message = f"📊 *TVL Yield on Flare Blockchain Today* - {formatted_date}\n\n"
                 
-                # Sort by symbol for consistent output
-                for row in sorted(today_rows, key=lambda x: x.get("symbol", "")):
+                # Rows are ordered by symbol for consistent output
+                for row in today_rows:
                     tvl = row.get("tvl", "")
                     message += f"$*{tvl}*\n"
                 
@@ -392,7 +496,7 @@ class TelegramBot:
         
         # Handle monitor activation/deactivation
         if query.data == "activate_monitor":
-            self.active_monitor_chats.add(chat_id)
+            self._subscribe(chat_id)
             await query.edit_message_text(
                 "✅ *@FlareNetworks X/Twitter monitoring activated!*\n\n"
                 "You'll receive the latest posts from @FlareNetworks.",
@@ -401,8 +505,7 @@ class TelegramBot:
             logger.info("Monitor activated", chat_id=chat_id, user_id=user_id)
             
         elif query.data == "deactivate_monitor":
-            if chat_id in self.active_monitor_chats:
-                self.active_monitor_chats.remove(chat_id)
+            self._unsubscribe(chat_id)
             await query.edit_message_text(
                 "❌ *@FlareNetworks X/Twitter monitoring deactivated.*\n\n"
                 "You won't receive any more updates.",
@@ -411,19 +514,29 @@ class TelegramBot:
             logger.info("Monitor deactivated", chat_id=chat_id, user_id=user_id)
     
     # Add this method to check for new posts and send them to active chats
-    async def check_and_send_updates(self, context: ContextTypes.DEFAULT_TYPE) -> None:
+    async def check_and_send_updates(
+        self, _context: ContextTypes.DEFAULT_TYPE | None = None
+    ) -> None:
         """Check for new posts and send them to active monitoring chats."""
-        if not self.active_monitor_chats:
+        if not self.active_monitor_chats or not self.broadcaster:
             return  # No active chats, no need to check
-        
-        latest_post = self.fetch_latest_posts()
+
+        try:
+            latest_post = await self.feed_monitor.fetch_latest()
+        except Exception:
+            logger.exception("Error fetching RSS feed")
+            return
         if not latest_post:
-            logger.warning("No posts found or error fetching posts")
+            logger.debug("RSS feed unchanged or empty")
             return
         
         # Check if this is a new post
         if latest_post.id != self.last_post_id:
             self.last_post_id = latest_post.id
+            # Commit the cursor before fanning out, so a restart mid-broadcast
+            # never sends the same post twice
+            self.state.set(MONITOR_NAMESPACE, "last_post_id", latest_post.id)
+            await self.state.flush()
             
             # Format the message
             message = (
@@ -432,24 +545,39 @@ class TelegramBot:
                 f"[Read more]({latest_post.link})"
             )
             
-            # Send to all active chats
-            for chat_id in list(self.active_monitor_chats):  # Create a copy of the set to iterate
-                try:
-                    await context.bot.send_message(
-                        chat_id=chat_id,
-                        text=message,
-                        parse_mode="Markdown",
-                        disable_web_page_preview=False
-                    )
-                    logger.info("Sent X/Twitter update", chat_id=chat_id)
-                except Exception as e:
-                    logger.error(f"Error sending message to {chat_id}: {e}")
-                    # Remove chat if we can't send messages to it
-                    if chat_id in self.active_monitor_chats:
-                        self.active_monitor_chats.remove(chat_id)
-
-        
-        
+            result = await self.broadcaster.broadcast(
+                self.active_monitor_chats,
+                message,
+                parse_mode="Markdown",
+                disable_web_page_preview=False,
+            )
+            for old_id, new_id in result.migrated.items():
+                self._unsubscribe(old_id)
+                self._subscribe(new_id)
+            # Only chats Telegram reports as unreachable are unsubscribed
+            for chat_id in result.unsubscribed:
+                self._unsubscribe(chat_id)
+
+    def _subscribe(self, chat_id: int) -> None:
+        """Add a chat to the monitor and persist the subscription."""
+        self.active_monitor_chats.add(chat_id)
+        self.state.set(MONITOR_CHATS_NAMESPACE, str(chat_id), chat_id)
+
+    def _unsubscribe(self, chat_id: int) -> None:
+        """Remove a chat from the monitor and persist the removal."""
+        self.active_monitor_chats.discard(chat_id)
+        self.state.delete(MONITOR_CHATS_NAMESPACE, str(chat_id))
+
+    async def _load_monitor_state(self) -> None:
+        """Restore monitor subscriptions and the feed cursor from the store."""
+        chats = await self.state.load(MONITOR_CHATS_NAMESPACE)
+        self.active_monitor_chats = {int(chat_id) for chat_id in chats}
+        self.last_post_id = await self.state.get(MONITOR_NAMESPACE, "last_post_id", "")
+        logger.info(
+            "Monitor state restored",
+            chats=len(self.active_monitor_chats),
+            last_post_id=self.last_post_id,
+        )
 
     async def help_command(
         self, update: Update, _context: ContextTypes.DEFAULT_TYPE
@@ -472,7 +600,9 @@ class TelegramBot:
             "I can answer questions about Flare Network."
             "*Available commands:*\n"
             "/start - Start the conversation\n"
-            "/token - Show token data"
+            "/reset - Forget the conversation so far\n"
+            "/token - Show token data\n"
+            "/prices - Show all registered FTSO feed prices\n"
             "/monitor - Toggle X/Twitter monitoring\n"
             "/about - Show what this bot can do\n"
             "\n\nSimply send me a message, and I'll do my best to assist you!"
@@ -481,47 +611,6 @@ class TelegramBot:
 
    
 
-    async def _process_group_chat_mention(
-        self, text: str, entities: tuple[MessageEntity, ...], update: Update
-    ) -> tuple[bool, str]:
-        """Check if bot was mentioned in group chat and return cleaned message text."""
-        if not self.me or not self.me.username:
-            return False, text
-
-        # Check direct mentions using entities
-        for entity in entities:
-            if entity.type == "mention":
-                mention_text = text[entity.offset : entity.offset + entity.length]
-                bot_username = self.me.username.lower()
-                mention_without_at = (
-                    mention_text[1:].lower()
-                    if mention_text.startswith("@")
-                    else mention_text.lower()
-                )
-                if mention_without_at == bot_username:
-                    return True, text.replace(mention_text, "").strip()
-
-        # Check text-based mentions
-        for variation in [f"@{self.me.username}", f"@{self.me.username.lower()}"]:
-            if variation.lower() in text.lower():
-                idx = text.lower().find(variation.lower())
-                if idx >= 0:
-                    actual_length = len(variation)
-                    actual_mention = text[idx : idx + actual_length]
-                    return True, text.replace(actual_mention, "").strip()
-
-        # Check if message is a reply to bot
-        if (
-            update.message
-            and update.message.reply_to_message
-            and update.message.reply_to_message.from_user
-            and self.me
-            and update.message.reply_to_message.from_user.id == self.me.id
-        ):
-            return True, text
-
-        return False, text
-
     async def _handle_unauthorized_access(
         self, update: Update, chat_type: str, user_id: int, chat_id: int | str
     ) -> bool:
@@ -538,6 +627,76 @@ class TelegramBot:
         )
         return True
 
+    async def _reply_with_ai(self, message: Message, text: str) -> bool:
+        """
+        Generate an AI response to a message and send it as a reply.
+
+        Returns:
+            False if the message was answered along with others of its burst
+        """
+        try:
+            if self.streamer:
+                # Streamed replies are shown as they are generated, unsummarized
+                chunks = await self._coalesce(
+                    message, text, functools.partial(self._start_stream, message)
+                )
+                if chunks is None:
+                    return False
+                await self.streamer.deliver(message, chunks)
+                return True
+            ai_response = await self._coalesce(
+                message, text, functools.partial(self._generate, message)
+            )
+        except QuotaExceededError as e:
+            logger.info(
+                "LLM quota exceeded",
+                chat_id=message.chat.id,
+                limit=e.limit,
+                retry_after=e.retry_after,
+            )
+            # Answering every throttled message would flood a busy group further
+            if message.chat.type not in GROUP_CHAT_TYPES:
+                await message.reply_text(
+                    "You're sending messages faster than I can answer. "
+                    f"Please try again in {math.ceil(e.retry_after)} seconds."
+                )
+            return True
+        if ai_response is None:
+            return False
+        summary = await self.summary_service.summarize(ai_response.text)
+        await message.reply_text(summary)
+        return True
+
+    async def _coalesce(
+        self, message: Message, text: str, generate: Callable[[str], Awaitable[T]]
+    ) -> T | None:
+        """Run a generation for a message's whole burst, if coalescing is on."""
+        if not self.coalescer or not message.from_user:
+            return await generate(text)
+        return await self.coalescer.run(
+            (message.chat.id, message.from_user.id), message.message_id, generate
+        )
+
+    async def _generate(self, message: Message, prompt: str) -> ModelResponse:
+        """Generate a reply, in the chat's session if sessions are enabled."""
+        self._check_quota(message)
+        if self.sessions:
+            return await self.sessions.send(message.chat.id, prompt)
+        return await self.ai_provider.agenerate_content(prompt)
+
+    async def _start_stream(self, message: Message, prompt: str) -> AsyncIterator[str]:
+        """Start streaming a reply and wait for its first chunk."""
+        self._check_quota(message)
+        if self.sessions:
+            return await prefetch(self.sessions.stream(message.chat.id, prompt))
+        return await prefetch(self.ai_provider.astream_content(prompt))
+
+    def _check_quota(self, message: Message) -> None:
+        """Charge an LLM call to the sender and chat, raising if over quota."""
+        if self.quota:
+            user = message.from_user.id if message.from_user else None
+            self.quota.check(SOURCE_TELEGRAM, user=user, chat=message.chat.id)
+
     async def handle_message(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -546,8 +705,6 @@ class TelegramBot:
             logger.warning("Missing message, user, or chat; skipping")
             return
 
-        self._dump_update(update)
-
         user: User = update.effective_user
         user_id: int = user.id
         chat: Chat = update.effective_chat
@@ -572,49 +729,35 @@ class TelegramBot:
             logger.debug("Skipping message without text")
             return
 
-        var_text: str = update.message.text
-        if var_text and "token" in var_text.lower():
+        classification = self.classifier.classify_update(update)
+        if classification.intent is Intent.IGNORE:
+            logger.debug(
+                "Ignoring group message (not mentioned)",
+                chat_id=chat_id,
+                user_id=user_id,
+            )
+            return
+        if classification.intent is Intent.PRICE:
             await self.handle_token(update, context)
             return
-        elif var_text and (var_text.startswith("0x") and all(c in "0123456789abcdefABCDEF" for c in var_text[2:])):
-            return await self.handle_offchain(update, context)
-        
-        is_group_chat = chat_type in ["group", "supergroup", "channel"]
+        if classification.intent is Intent.FEED:
+            await self.handle_offchain(update, context)
+            return
 
-        # Log message details
-        entities: tuple[MessageEntity, ...] = update.message.entities
-        logger.info(
+        var_text = classification.text
+        is_group_chat = chat_type in GROUP_CHAT_TYPES
+
+        logger.debug(
             "Received message details",
             user_id=user_id,
             chat_id=chat_id,
             chat_type=chat_type,
             message_id=update.message.message_id,
             message_text=var_text,
-            has_entities=bool(entities),
-            entity_count=len(entities),
+            intent=classification.intent,
             bot_username=self.me.username if self.me else "unknown",
         )
 
-        # Handle group chat mentions
-        if is_group_chat:
-            is_mentioned, var_text = await self._process_group_chat_mention(
-                var_text, entities, update
-            )
-            if not is_mentioned:
-                logger.debug(
-                    "Ignoring group message (not mentioned)",
-                    chat_id=chat_id,
-                    user_id=user_id,
-                )
-                return
-            if not var_text:
-                var_text = "Hello"
-                logger.info(
-                    "Empty mention received, responding with greeting",
-                    chat_id=chat_id,
-                    user_id=user_id,
-                )
-
         # Check user authorization
         if not self._is_user_allowed(
             user_id
@@ -629,24 +772,22 @@ class TelegramBot:
             user_id=user_id,
             chat_id=chat_id,
             is_group=is_group_chat,
-            message_text=var_text,
+            intent=classification.intent,
         )
 
         try:
             await context.bot.send_chat_action(chat_id=chat_id, action="typing")
-            ai_response = self.ai_provider.generate_content(var_text)
-            response_text = ai_response.text
-            summarizer = Summarizer()
-            summary = summarizer(response_text, min_length=50, max_length=150)
+            replied = await self._reply_with_ai(update.message, var_text)
 
             chat_id_key = int(chat_id) if isinstance(chat_id, str) else chat_id
             self.last_processed_time[chat_id_key] = time.time()
-            await update.message.reply_text(summary)
             logger.info(
                 "Sent AI response",
                 chat_id=chat_id,
                 user_id=user_id,
                 is_group=is_group_chat,
+                # Merged messages were answered by the reply to their burst
+                merged=not replied,
             )
         except Exception:
             logger.exception("Error generating AI response")
@@ -671,34 +812,30 @@ class TelegramBot:
             # Get current date in the format matching your data
             today = datetime.datetime.now().strftime("%Y-%m-%d")
             
-            # Fetch data from Dune
-            dune = DuneClient.from_env()
-            query_result = dune.get_latest_result(4838993) # type: ignore
-            
-            # Extract rows from the ResultsResponse object
-            all_rows = query_result.result.rows
-            
-            # Filter rows for today's date only
-            today_rows = [row for row in all_rows if row.get("day") == today]
+            # Latest Dune result, served from the market data cache
+            snapshot = await self.market_data.get(TOKEN_PRICES_QUERY_ID)
+            table = snapshot.table
+
+            # Rows for today's date only, already ordered by symbol
+            today_rows = table.rows_for(today)
             
             if not today_rows:
-                # If no data for today, find the most recent date with data
-                available_dates = sorted(set(row.get("day") for row in all_rows), reverse=True)
-                
-                if not available_dates:
+                # If no data for today, use the most recent date with data
+                most_recent_date = table.latest_date
+
+                if most_recent_date is None:
                     await update.message.reply_text("No price data available")
                     return
-                    
-                most_recent_date = available_dates[0]
-                most_recent_rows = [row for row in all_rows if row.get("day") == most_recent_date]
+
+                most_recent_rows = table.rows_for(most_recent_date)
                 
                 date_obj = datetime.datetime.strptime(most_recent_date, "%Y-%m-%d")
                 formatted_date = date_obj.strftime("%B %d, %Y")
                 
                 message = f"📊 *Token Prices* - {formatted_date}\n\n"
                 
-                # Sort by symbol for consistent output
-                for row in sorted(most_recent_rows, key=lambda x: x.get("symbol", "")):
+                # Rows are ordered by symbol for consistent output
+                for row in most_recent_rows:
                     symbol = row.get("symbol", "")
                     price = row.get("price", 0)
                     
@@ -720,8 +857,8 @@ class TelegramBot:
                 
                 message = f"📊 *Token Prices Today* - {formatted_date}\n\n"
                 
-                # Sort by symbol for consistent output
-                for row in sorted(today_rows, key=lambda x: x.get("symbol", "")):
+                # Rows are ordered by symbol for consistent output
+                for row in today_rows:
                     symbol = row.get("symbol", "")
                     price = row.get("price", 0)
                     
@@ -771,8 +908,12 @@ class TelegramBot:
         try:
             await context.bot.send_chat_action(chat_id=chat_id, action="typing")
             
+            # Registered symbols and IDs resolve to precomputed bytes21 IDs
+            registered = self.feed_registry.lookup(query_text)
+            if registered:
+                feed_id_hex = registered.hex_id
             # Extract feed ID - use the whole string if it looks like a hex string
-            if query_text.startswith("0x") and all(c in "0123456789abcdefABCDEF" for c in query_text[2:]):
+            elif query_text.startswith("0x") and all(c in "0123456789abcdefABCDEF" for c in query_text[2:]):
                 feed_id_hex = query_text
             else:
                 # Try to find a hex pattern in the text
@@ -784,21 +925,21 @@ class TelegramBot:
                 feed_id_hex = match.group(0)
             
             # Convert hex string to bytes21
-            feed_id_bytes = bytes.fromhex(feed_id_hex[2:])
-            
-            w3 = AsyncWeb3(AsyncHTTPProvider(RPC_URL))
-            ftsov2 = w3.eth.contract(address=w3.to_checksum_address(FTSOV2_ADDRESS), abi=ABI)
+            feed_id_bytes = (
+                registered.feed_id if registered else bytes.fromhex(feed_id_hex[2:])
+            )
             
-            # Call the function with a list containing one feed ID
-            feeds, decimals, timestamp = await ftsov2.functions.getFeedsById([feed_id_bytes]).call()
+            # Batched with concurrent lookups into one getFeedsById call
+            feed = await self.feed_reader.read(feed_id_bytes)
             
             # Create response message with proper formatting
             feed_info = (
-                f"🪙 *Feed Info*\n\n"
-                f"*Feed ID:* `{feed_id_hex}`\n"
-                f"*Value:* {feeds[0] if feeds and len(feeds) > 0 else 'N/A'}\n"
-                f"*Decimals:* {decimals[0] if decimals and len(decimals) > 0 else 'N/A'}\n"
-                f"*Timestamp:* {timestamp}\n"
+                "🪙 *Feed Info*\n\n"
+                + (f"*Feed:* {registered.symbol}\n" if registered else "")
+                + f"*Feed ID:* `{feed_id_hex}`\n"
+                f"*Value:* {feed.value}\n"
+                f"*Decimals:* {feed.decimals}\n"
+                f"*Timestamp:* {feed.timestamp}\n"
             )
             
             await update.message.reply_text(feed_info, parse_mode="Markdown")
@@ -812,6 +953,36 @@ class TelegramBot:
                 f"Error processing feed ID: {str(e)}\n\nPlease check the format and try again."
             )
 
+    async def prices_command(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        """Handle the /prices command with one read of all registered feeds."""
+        if not update.message or not update.effective_user or not update.effective_chat:
+            return
+
+        chat_id = update.effective_chat.id
+
+        try:
+            await context.bot.send_chat_action(chat_id=chat_id, action="typing")
+            feeds = await self.feed_registry.read_all()
+            if not feeds:
+                await update.message.reply_text("No feed prices available yet.")
+                return
+
+            message = "🪙 *FTSO Feed Prices*\n\n"
+            for feed, value in feeds:
+                if self.feed_reader.cache:
+                    self.feed_reader.cache.put(value)
+                message += f"*{feed.symbol}*: {value.value / 10**value.decimals:g}\n"
+
+            await update.message.reply_text(message, parse_mode="Markdown")
+            self.last_processed_time[chat_id] = time.time()
+        except Exception:
+            logger.exception("Error reading feed prices")
+            await update.message.reply_text(
+                "I'm having trouble reading feed prices. Please try again later."
+            )
+
     async def error_handler(
         self, update: object, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -823,8 +994,13 @@ class TelegramBot:
         logger.info("Initializing Telegram bot")
 
         # Build the application with default settings
-        builder = Application.builder().token(self.api_token)
+        builder = (
+            Application.builder()
+            .token(self.api_token)
+            .concurrent_updates(self.update_processor)
+        )
         self.application = builder.build()
+        self.broadcaster = Broadcaster(self.application.bot)
 
         try:
             self.me = await Bot(self.api_token).get_me()
@@ -838,11 +1014,20 @@ class TelegramBot:
             logger.exception("Failed to get bot info")
             self.me = None
 
+        # Dump sampled updates before any other handler sees them, only
+        # registered when a rule is configured so the hot path stays untouched
+        if self.debugger.enabled:
+            self.application.add_handler(
+                TypeHandler(Update, self.raw_update_handler), group=-1
+            )
+
         # Add handlers in the correct order
         self.application.add_handler(CommandHandler("start", self.start_command))
         self.application.add_handler(CommandHandler("help", self.help_command))
+        self.application.add_handler(CommandHandler("reset", self.reset_command))
         self.application.add_handler(CommandHandler("debug", self.debug_command))
         self.application.add_handler(CommandHandler("tvl", self.TVL_command))
+        self.application.add_handler(CommandHandler("prices", self.prices_command))
 
         self.application.add_handler(CommandHandler("monitor", self.monitor_command))
         
@@ -858,10 +1043,49 @@ class TelegramBot:
         # Add error handler
         self.application.add_error_handler(self.error_handler)
 
+        # Restore subscriptions before the first monitor poll can run
+        await self.state.open()
+        await self._load_monitor_state()
+
+        # Poll the X/Twitter RSS feed for monitoring chats
+        self._schedule_monitor()
+
+        # Load the summarizer model once, before any message can need it.
+        # Streamed replies are never summarized
+        if not self.streamer:
+            await self.summary_service.start()
+        await self.market_data.start()
+        await self.ftso.connect()
+        await self.feed_registry.start()
+
         # Initialize the application
         await self.application.initialize()
         logger.info("Telegram bot initialized successfully")
 
+    def _schedule_monitor(self) -> None:
+        """Run check_and_send_updates every CHECK_INTERVAL seconds."""
+        if not self.application:
+            raise RuntimeError(ERR_BOT_NOT_INITIALIZED)
+        if self.application.job_queue:
+            self.application.job_queue.run_repeating(
+                self.check_and_send_updates,
+                interval=CHECK_INTERVAL,
+                name="x_monitor",
+            )
+            return
+        # Without the job-queue extra, drive the same callback from a plain task
+        self._monitor_task = asyncio.create_task(self._monitor_loop())
+
+    async def _monitor_loop(self) -> None:
+        """Fallback scheduler for the monitor when no JobQueue is installed."""
+        while True:
+            await asyncio.sleep(CHECK_INTERVAL)
+            try:
+                await self.check_and_send_updates()
+            except Exception:
+                # Like a failed JobQueue job, log it and try again next interval
+                logger.exception("X/Twitter monitor check failed")
+
     async def start_polling(self) -> None:
         """Start polling for updates."""
         if not self.application:
@@ -885,6 +1109,36 @@ class TelegramBot:
             pool_timeout=30,
         )
 
+    async def start_webhook(self, url: str, secret: str) -> None:
+        """
+        Start processing updates pushed to a webhook instead of polling.
+
+        Updates are expected on application.update_queue, which the API's
+        TelegramWebhookRouter fills from Telegram's POST requests.
+
+        Args:
+            url: Public HTTPS URL of the webhook route
+            secret: Secret token Telegram sends with every update
+        """
+        if not self.application:
+            raise RuntimeError(ERR_BOT_NOT_INITIALIZED)
+
+        logger.info("Starting Telegram bot in webhook mode", url=url)
+        await self.application.start()
+        await self.application.bot.set_webhook(
+            url=url, secret_token=secret, allowed_updates=Update.ALL_TYPES
+        )
+        self.webhook_url = url
+
+    @property
+    def running(self) -> bool:
+        """Whether updates are currently being received and processed."""
+        if not self.application:
+            return False
+        if self.webhook_url:
+            return self.application.running
+        return bool(self.application.updater and self.application.updater.running)
+
     async def start(self) -> None:
         """Start the Telegram bot."""
         try:
@@ -900,7 +1154,30 @@ class TelegramBot:
 
     async def shutdown(self) -> None:
         """Shut down the bot."""
-        if self.application:
-            logger.info("Shutting down Telegram bot")
-            await self.application.stop()
-            await self.application.shutdown()
\ No newline at end of file
+        try:
+            if self.application:
+                logger.info("Shutting down Telegram bot")
+                # Not running after a failed start, or when restarted by the manager
+                updater = self.application.updater
+                if updater and updater.running:
+                    await updater.stop()
+                if self.application.running:
+                    await self.application.stop()
+                await self.application.shutdown()
+        finally:
+            # Persist subscriptions, cursors and sessions however the app stopped
+            if self._monitor_task:
+                self._monitor_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._monitor_task
+                self._monitor_task = None
+            if self.sessions:
+                # Spill live conversations while the state store is still open
+                self.sessions.close()
+            await self.feed_monitor.close()
+            await self.summary_service.stop()
+            await self.market_data.stop()
+            await self.feed_registry.stop()
+            await self.feed_reader.close()
+            await self.ftso.close()
+            await self.state.close()
@@ -0,0 +1,190 @@
+"""
+Streaming Reply Module
+
+This module delivers a streamed LLM response to Telegram. The first chunk is sent
+as a reply as soon as it arrives, and the message is then edited in place as more
+text streams in. Edits are throttled per chat type to stay inside Telegram's
+limits (about one message per second in private chats, 20 per minute in groups),
+flood-control responses push the next edit back, and answers longer than one
+Telegram message continue in a follow-up message.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+
+import structlog
+from telegram import Message
+from telegram.constants import MessageLimit
+from telegram.error import BadRequest, RetryAfter
+
+from flare_ai_social.metrics import LatencyRecorder, LatencyStats
+from flare_ai_social.telegram.broadcast import retry_after_seconds
+from flare_ai_social.telegram.classifier import GROUP_CHAT_TYPES
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class StreamingMetrics:
+    """Latency of streamed replies"""
+
+    first_chunk: LatencyStats
+    complete: LatencyStats
+    edits: int
+
+
+class StreamingReplier:
+    """
+    Sends a streamed response and keeps editing it as chunks arrive.
+
+    Attributes:
+        private_edit_interval (float): Minimum seconds between edits in a private chat
+        group_edit_interval (float): Minimum seconds between edits in a group
+    """
+
+    def __init__(
+        self,
+        private_edit_interval: float = 1.0,
+        group_edit_interval: float = 3.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.private_edit_interval = private_edit_interval
+        self.group_edit_interval = group_edit_interval
+        self._clock = clock
+        self._first_chunk = LatencyRecorder()
+        self._complete = LatencyRecorder()
+        self._edits = 0
+
+    async def deliver(self, message: Message, chunks: AsyncIterator[str]) -> str:
+        """
+        Reply to a message with streamed text.
+
+        Args:
+            message: The user's message to reply to
+            chunks: Successive pieces of the response text
+
+        Returns:
+            The full response text
+        """
+        interval = (
+            self.group_edit_interval
+            if message.chat.type in GROUP_CHAT_TYPES
+            else self.private_edit_interval
+        )
+        started = self._clock()
+        full = ""
+        text = ""  # Text of the message currently being edited
+        shown = ""  # What that message shows right now
+        sent: Message | None = None
+        first: float | None = started  # Start time until the first message is sent
+        next_edit = 0.0
+
+        async for chunk in chunks:
+            full += chunk
+            text += chunk
+            while len(text) > MessageLimit.MAX_TEXT_LENGTH:
+                # Finish the current message, or send the first one whole when the
+                # opening chunks already overflow it, and continue in a new one
+                head, text = _split(text)
+                if sent:
+                    await self._finish(sent, head)
+                elif head.strip():
+                    await self._reply(message, head, first)
+                    first = None
+                sent, shown = None, ""
+            if sent is None:
+                if not text.strip():
+                    continue
+                sent = await self._reply(message, text, first)
+                first = None
+                shown = text
+                next_edit = self._clock() + interval
+            elif self._clock() >= next_edit and text != shown:
+                delay = await self._edit(sent, text)
+                next_edit = self._clock() + max(interval, delay or 0.0)
+                if delay is None:
+                    shown = text
+
+        if sent and text != shown:
+            await self._finish(sent, text)
+        self._complete.observe(self._clock() - started)
+        return full
+
+    def metrics(self) -> StreamingMetrics:
+        """Return time-to-first-chunk and completion latencies."""
+        return StreamingMetrics(
+            first_chunk=self._first_chunk.snapshot(),
+            complete=self._complete.snapshot(),
+            edits=self._edits,
+        )
+
+    async def _reply(
+        self, message: Message, text: str, started: float | None
+    ) -> Message:
+        """Send a new message, recording the time to it if it is the first one."""
+        reply = await message.reply_text(text)
+        if started is not None:
+            self._first_chunk.observe(self._clock() - started)
+        return reply
+
+    async def _edit(self, sent: Message, text: str) -> float | None:
+        """
+        Edit a sent message, tolerating no-op edits.
+
+        Returns:
+            None if the edit went through, else the flood-control wait in seconds
+        """
+        try:
+            await sent.edit_text(text)
+        except RetryAfter as e:
+            delay = retry_after_seconds(e.retry_after)
+            logger.warning("Flood control on streaming edit", retry_after=delay)
+            return delay
+        except BadRequest as e:
+            if "not modified" not in e.message.lower():
+                raise
+        self._edits += 1
+        return None
+
+    async def _finish(self, sent: Message, text: str) -> None:
+        """Make the last edit of a message, waiting out any flood control."""
+        while True:
+            delay = await self._edit(sent, text)
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+
+
+async def prefetch(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Wait for the first chunk of a stream.
+
+    Lets a caller start a generation and hold off replying until text actually
+    exists, e.g. so the generation can still be cancelled before anything is sent.
+
+    Args:
+        chunks: Stream of response text
+
+    Returns:
+        A stream yielding the same chunks, the first one already received
+    """
+    first = await anext(chunks, None)
+
+    async def replay() -> AsyncIterator[str]:
+        if first is not None:
+            yield first
+        async for chunk in chunks:
+            yield chunk
+
+    return replay()
+
+
+def _split(text: str) -> tuple[str, str]:
+    """Split text at the last line break or space that fits one message."""
+    limit = MessageLimit.MAX_TEXT_LENGTH
+    cut = max(text.rfind("\n", 0, limit), text.rfind(" ", 0, limit))
+    if cut <= 0:
+        cut = limit
+    return text[:cut], text[cut:].lstrip()
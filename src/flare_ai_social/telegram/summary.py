@@ -0,0 +1,216 @@
+"""
+Summary Service Module
+
+This module runs the extractive BERT summarizer used to shorten AI replies before
+they are sent to Telegram. The model is loaded once at startup and inference runs
+in a bounded thread pool, so the event loop never blocks on it. Requests that
+arrive close together are grouped into a single executor job.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import structlog
+
+from flare_ai_social.metrics import LatencyRecorder, LatencyStats
+
+logger = structlog.get_logger(__name__)
+
+ERR_SUMMARY_SERVICE_STOPPED = "Summary service is not running."
+
+Summarizer = Callable[..., str]
+
+
+@dataclass(frozen=True)
+class SummaryMetrics:
+    """Snapshot of the summary service state"""
+
+    queue_depth: int
+    in_flight: int
+    batches: int
+    batch_size_max: int
+    queue_wait: LatencyStats
+    inference: LatencyStats
+
+
+@dataclass
+class _SummaryRequest:
+    text: str
+    future: asyncio.Future[str]
+    enqueued_at: float
+
+
+class SummaryService:
+    """
+    Batched, pool-backed wrapper around the extractive summarizer.
+
+    Attributes:
+        max_workers (int): Size of the inference thread pool
+        max_batch_size (int): Maximum number of texts handled by one executor job
+        batch_window (float): Seconds to wait for more requests before dispatching
+        min_length (int): Minimum sentence length kept by the summarizer
+        max_length (int): Maximum sentence length kept by the summarizer
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        max_workers: int = 1,
+        max_batch_size: int = 8,
+        batch_window: float = 0.02,
+        max_queue_size: int = 256,
+        min_length: int = 50,
+        max_length: int = 150,
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_batch_size = max_batch_size
+        self.batch_window = batch_window
+        self.min_length = min_length
+        self.max_length = max_length
+        self._queue: asyncio.Queue[_SummaryRequest] = asyncio.Queue(max_queue_size)
+        self._executor: ThreadPoolExecutor | None = None
+        self._model: Summarizer | None = None
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._slots = asyncio.Semaphore(max_workers)
+        self._batches: set[asyncio.Task[None]] = set()
+        self._in_flight = 0
+        self._batch_count = 0
+        self._batch_size_max = 0
+        self._queue_wait = LatencyRecorder()
+        self._inference = LatencyRecorder()
+
+    async def start(self) -> None:
+        """Load the model in the worker pool and start dispatching requests."""
+        if self._dispatcher:
+            return
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="summarizer"
+        )
+        loop = asyncio.get_running_loop()
+        try:
+            self._model = await loop.run_in_executor(self._executor, _load_model)
+            logger.info("Summarizer model loaded", max_workers=self.max_workers)
+        except Exception:
+            logger.exception("Failed to load summarizer, replies will not be shortened")
+            self._model = None
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def stop(self) -> None:
+        """Stop dispatching, fail queued requests and release the worker pool."""
+        if self._dispatcher:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+            self._dispatcher = None
+        await asyncio.gather(*self._batches, return_exceptions=True)
+        queued: list[_SummaryRequest] = []
+        while not self._queue.empty():
+            queued.append(self._queue.get_nowait())
+        _fail_stopped(queued)
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def summarize(self, text: str) -> str:
+        """
+        Summarize a text.
+
+        Args:
+            text: Text to shorten
+
+        Returns:
+            The extractive summary, or the original text if no model is loaded
+        """
+        if not self._dispatcher:
+            raise RuntimeError(ERR_SUMMARY_SERVICE_STOPPED)
+        if self._model is None:
+            return text
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        await self._queue.put(_SummaryRequest(text, future, time.perf_counter()))
+        return await future
+
+    def metrics(self) -> SummaryMetrics:
+        """Return queue depth, batching and latency figures."""
+        return SummaryMetrics(
+            queue_depth=self._queue.qsize(),
+            in_flight=self._in_flight,
+            batches=self._batch_count,
+            batch_size_max=self._batch_size_max,
+            queue_wait=self._queue_wait.snapshot(),
+            inference=self._inference.snapshot(),
+        )
+
+    async def _dispatch(self) -> None:
+        """Group queued requests into batches and hand them to the pool."""
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = asyncio.get_running_loop().time() + self.batch_window
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - asyncio.get_running_loop().time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except TimeoutError:
+                        break
+                await self._slots.acquire()
+            except asyncio.CancelledError:
+                # Stopped while holding a batch that never reached the pool
+                _fail_stopped(batch)
+                raise
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: list[_SummaryRequest]) -> None:
+        """Run one batch in the worker pool and resolve its futures."""
+        started = time.perf_counter()
+        for request in batch:
+            self._queue_wait.observe(started - request.enqueued_at)
+        self._in_flight += len(batch)
+        self._batch_count += 1
+        self._batch_size_max = max(self._batch_size_max, len(batch))
+        try:
+            loop = asyncio.get_running_loop()
+            summaries = await loop.run_in_executor(
+                self._executor, self._summarize_batch, [r.text for r in batch]
+            )
+        except Exception as e:  # noqa: BLE001 - propagated to every waiter
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+        else:
+            for request, summary in zip(batch, summaries, strict=True):
+                if not request.future.done():
+                    request.future.set_result(summary)
+        finally:
+            self._inference.observe(time.perf_counter() - started)
+            self._in_flight -= len(batch)
+            self._slots.release()
+
+    def _summarize_batch(self, texts: list[str]) -> list[str]:
+        """Summarize several texts with the shared model, inside a pool worker."""
+        if self._model is None:
+            return texts
+        return [
+            self._model(text, min_length=self.min_length, max_length=self.max_length)
+            for text in texts
+        ]
+
+
+def _fail_stopped(requests: list[_SummaryRequest]) -> None:
+    """Fail the futures of requests the stopped service will never run."""
+    for request in requests:
+        if not request.future.done():
+            request.future.set_exception(RuntimeError(ERR_SUMMARY_SERVICE_STOPPED))
+
+
+def _load_model() -> Summarizer:
+    """Import and instantiate the BERT summarizer, inside a pool worker."""
+    # Importing torch and the BERT weights takes seconds, so keep it off the loop
+    from summarizer import Summarizer as BertSummarizer  # noqa: PLC0415
+
+    return BertSummarizer()
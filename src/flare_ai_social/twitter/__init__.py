@@ -1,3 +1,17 @@
+from .cursor import CursorMetrics, MentionCursor
+from .pipeline import MentionPipeline, PipelineMetrics, StageMetrics
+from .planner import SearchQuery, demultiplex, plan_queries
 from .service import TwitterBot, TwitterConfig
 
-__all__ = ["TwitterBot", "TwitterConfig"]
+__all__ = [
+    "CursorMetrics",
+    "MentionCursor",
+    "MentionPipeline",
+    "PipelineMetrics",
+    "SearchQuery",
+    "StageMetrics",
+    "TwitterBot",
+    "TwitterConfig",
+    "demultiplex",
+    "plan_queries",
+]
@@ -0,0 +1,112 @@
+"""
+Mention Cursor Module
+
+This module decides which searched tweets are new mentions. Each monitored
+account has a since_id cursor: every mention of it with an ID at or below the
+cursor has been answered. The cursor only moves past a mention once its reply is
+done, so a mention still being answered when the bot stops is picked up again
+after a restart. Mentions answered above the cursor, while an older one was
+still in flight, are remembered in a bounded least-recently-seen set of tweet
+IDs. Both are persisted in the state store, so a restart resumes exactly where
+the previous run left off, however long cycles take or whether they overlap.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import structlog
+
+from flare_ai_social.storage import StateStore
+
+logger = structlog.get_logger(__name__)
+
+CURSORS_NAMESPACE = "twitter_cursors"
+SEEN_NAMESPACE = "twitter_seen"
+SEEN_KEY = "ids"
+
+
+@dataclass(frozen=True)
+class CursorMetrics:
+    """Snapshot of the mention cursors"""
+
+    cursors: dict[str, int]  # Account -> since_id
+    pending: int  # Mentions handed out and not yet done
+    seen: int  # Answered tweet IDs remembered above the cursors
+
+
+class MentionCursor:
+    """
+    Per-account since_id cursors plus a bounded set of answered tweet IDs.
+
+    Attributes:
+        store (StateStore): Where cursors and seen IDs are persisted
+        max_seen (int): Answered tweet IDs remembered, least recent first out
+    """
+
+    def __init__(self, store: StateStore, *, max_seen: int = 1000) -> None:
+        self.store = store
+        self.max_seen = max_seen
+        self._since: dict[str, int] = {}
+        self._newest: dict[str, int] = {}  # Highest ID done or skipped
+        self._pending: dict[str, set[int]] = {}
+        self._seen: OrderedDict[int, None] = OrderedDict()
+
+    async def load(self) -> None:
+        """Restore the cursors and seen IDs of the previous run."""
+        cursors = await self.store.load(CURSORS_NAMESPACE)
+        self._since = {account: int(since) for account, since in cursors.items()}
+        self._newest = dict(self._since)
+        seen = await self.store.get(SEEN_NAMESPACE, SEEN_KEY, [])
+        self._seen = OrderedDict.fromkeys(int(tweet_id) for tweet_id in seen)
+        logger.info("Mention cursors loaded", cursors=self._since, seen=len(seen))
+
+    def since_id(self, account: str) -> int | None:
+        """Return an account's cursor, None until it has one."""
+        return self._since.get(account.lower())
+
+    def is_new(self, account: str, tweet_id: int) -> bool:
+        """Whether a mention of an account is past its cursor and not answered."""
+        since = self._since.get(account.lower())
+        return (since is None or tweet_id > since) and tweet_id not in self._seen
+
+    def track(self, account: str, tweet_id: int) -> None:
+        """Hold an account's cursor below a mention until it is done."""
+        self._pending.setdefault(account.lower(), set()).add(tweet_id)
+
+    def skip(self, account: str, tweet_ids: Iterable[int]) -> None:
+        """Move an account's cursor past tweets that will not be answered."""
+        key = account.lower()
+        newest = max(tweet_ids, default=None)
+        if newest is not None and newest > self._newest.get(key, 0):
+            self._newest[key] = newest
+            self._advance(key)
+
+    def done(self, tweet_id: int) -> None:
+        """Record a mention as answered, advancing the cursors it held back."""
+        self._seen[tweet_id] = None
+        self._seen.move_to_end(tweet_id)
+        while len(self._seen) > self.max_seen:
+            self._seen.popitem(last=False)
+        self.store.set(SEEN_NAMESPACE, SEEN_KEY, list(self._seen))
+        for key, pending in self._pending.items():
+            if tweet_id in pending:
+                pending.discard(tweet_id)
+                self._newest[key] = max(self._newest.get(key, 0), tweet_id)
+                self._advance(key)
+
+    def metrics(self) -> CursorMetrics:
+        """Return the cursors and the pending and seen counts."""
+        return CursorMetrics(
+            cursors=dict(self._since),
+            pending=sum(len(pending) for pending in self._pending.values()),
+            seen=len(self._seen),
+        )
+
+    def _advance(self, key: str) -> None:
+        """Move a cursor up to its oldest pending mention, and persist it."""
+        pending = self._pending.get(key)
+        since = min(pending) - 1 if pending else self._newest.get(key, 0)
+        if since > self._since.get(key, 0):
+            self._since[key] = since
+            self.store.set(CURSORS_NAMESPACE, key, since)
@@ -0,0 +1,249 @@
+"""
+Mention Pipeline Module
+
+This module answers mentions in a staged pipeline: fetch -> dedupe -> generate ->
+post. Each stage has its own pool of workers and hands mentions to the next one
+through a bounded queue, so a burst of mentions is generated and posted in
+parallel, while a slow stage fills its queue and holds the earlier stages back
+instead of buffering without limit. A failure is logged and drops the mention
+without stopping its worker.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from flare_ai_social.metrics import LatencyRecorder, LatencyStats
+
+logger = structlog.get_logger(__name__)
+
+Tweet = dict[str, Any]
+
+STAGE_FETCH = "fetch"
+STAGE_DEDUPE = "dedupe"
+STAGE_GENERATE = "generate"
+STAGE_POST = "post"
+
+
+@dataclass(frozen=True)
+class StageMetrics:
+    """Snapshot of one pipeline stage"""
+
+    workers: int
+    queue_depth: int
+    processed: int
+    queue_wait: LatencyStats  # Time mentions waited for a worker
+    latency: LatencyStats  # Time spent on a mention, or on a whole fetch cycle
+
+
+@dataclass(frozen=True)
+class PipelineMetrics:
+    """Snapshot of the mention pipeline"""
+
+    in_flight: int
+    duplicates: int  # Mentions dropped because they were already in flight
+    failed: int
+    stages: dict[str, StageMetrics]
+
+
+@dataclass
+class _Mention:
+    tweet: Tweet
+    enqueued_at: float
+    reply: str = ""
+    admitted: bool = False  # Passed dedupe, so it holds an in-flight slot
+
+
+class _Stage:
+    """Queue, workers and counters of one stage"""
+
+    def __init__(
+        self,
+        name: str,
+        workers: int,
+        queue_size: int,
+        handle: Callable[[_Mention], Awaitable[bool]],
+    ) -> None:
+        self.name = name
+        self.workers = workers
+        self.handle = handle  # Returns whether the mention moves on
+        self.queue: asyncio.Queue[_Mention] = asyncio.Queue(queue_size)
+        self.processed = 0
+        self.queue_wait = LatencyRecorder()
+        self.latency = LatencyRecorder()
+
+
+class MentionPipeline:
+    """
+    Fetch -> dedupe -> generate -> post worker pipeline for mentions.
+
+    The done callback is called with every mention that passed dedupe once it
+    has been posted or has failed, but not with mentions abandoned by stop().
+
+    Attributes:
+        generate_workers (int): Replies generated concurrently
+        post_workers (int): Replies posted concurrently
+        queue_size (int): Capacity of each stage's queue
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        generate: Callable[[Tweet], Awaitable[str]],
+        post: Callable[[Tweet, str], Awaitable[None]],
+        *,
+        done: Callable[[Tweet], None] | None = None,
+        generate_workers: int = 8,
+        post_workers: int = 4,
+        queue_size: int = 100,
+    ) -> None:
+        self.generate_workers = generate_workers
+        self.post_workers = post_workers
+        self.queue_size = queue_size
+        self._generate = generate
+        self._post = post
+        self._done = done
+        self._stages = [
+            _Stage(STAGE_DEDUPE, 1, queue_size, self._dedupe),
+            _Stage(STAGE_GENERATE, generate_workers, queue_size, self._reply),
+            _Stage(STAGE_POST, post_workers, queue_size, self._send),
+        ]
+        self._fetch = LatencyRecorder()
+        self._fetched = 0
+        self._workers: list[asyncio.Task[None]] = []
+        self._in_flight: set[str] = set()
+        self._duplicates = 0
+        self._failed = 0
+
+    def start(self) -> None:
+        """Start the workers of every stage."""
+        if self._workers:
+            return
+        following: list[_Stage | None] = [*self._stages[1:], None]
+        for stage, after in zip(self._stages, following, strict=True):
+            self._workers.extend(
+                asyncio.create_task(self._work(stage, after))
+                for _ in range(stage.workers)
+            )
+
+    async def stop(self) -> None:
+        """Cancel the workers, abandoning queued mentions."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def run(self, mentions: AsyncIterator[Tweet]) -> int:
+        """
+        Run one fetch cycle, feeding the mentions it yields into the pipeline.
+
+        Blocks while the dedupe queue is full, so fetching slows to the pace the
+        later stages can sustain.
+
+        Args:
+            mentions: The cycle's new mentions, as they are found
+
+        Returns:
+            The number of mentions fetched
+        """
+        fetched = 0
+        fetching = 0.0
+        while True:
+            started = time.perf_counter()
+            try:
+                tweet = await anext(mentions)
+            except StopAsyncIteration:
+                break
+            finally:
+                fetching += time.perf_counter() - started
+            fetched += 1
+            await self._stages[0].queue.put(_Mention(tweet, time.perf_counter()))
+        self._fetch.observe(fetching)
+        self._fetched += fetched
+        return fetched
+
+    async def drain(self) -> None:
+        """Wait until every submitted mention has left the pipeline."""
+        for stage in self._stages:
+            await stage.queue.join()
+
+    def metrics(self) -> PipelineMetrics:
+        """Return queue depths, counters and per-stage latencies."""
+        fetch = StageMetrics(
+            workers=1,
+            queue_depth=0,
+            processed=self._fetched,
+            queue_wait=LatencyRecorder().snapshot(),
+            latency=self._fetch.snapshot(),
+        )
+        return PipelineMetrics(
+            in_flight=len(self._in_flight),
+            duplicates=self._duplicates,
+            failed=self._failed,
+            stages={STAGE_FETCH: fetch}
+            | {
+                stage.name: StageMetrics(
+                    workers=stage.workers,
+                    queue_depth=stage.queue.qsize(),
+                    processed=stage.processed,
+                    queue_wait=stage.queue_wait.snapshot(),
+                    latency=stage.latency.snapshot(),
+                )
+                for stage in self._stages
+            },
+        )
+
+    async def _work(self, stage: _Stage, following: _Stage | None) -> None:
+        """Take mentions off a stage's queue and pass them on."""
+        while True:
+            mention = await stage.queue.get()
+            started = time.perf_counter()
+            stage.queue_wait.observe(started - mention.enqueued_at)
+            try:
+                forward = await stage.handle(mention)
+            except Exception:
+                logger.exception(
+                    "Mention pipeline stage failed",
+                    stage=stage.name,
+                    tweet_id=mention.tweet.get("id_str"),
+                )
+                self._failed += 1
+                forward = False
+            finally:
+                stage.latency.observe(time.perf_counter() - started)
+                stage.processed += 1
+            try:
+                if forward and following:
+                    mention.enqueued_at = time.perf_counter()
+                    # Blocks while the next stage is saturated
+                    await following.queue.put(mention)
+                elif mention.admitted:
+                    self._in_flight.discard(mention.tweet.get("id_str", ""))
+                    if self._done:
+                        self._done(mention.tweet)
+            finally:
+                stage.queue.task_done()
+
+    async def _dedupe(self, mention: _Mention) -> bool:
+        """Drop mentions already in the pipeline, e.g. from an overlapping cycle."""
+        tweet_id = mention.tweet.get("id_str", "")
+        if tweet_id in self._in_flight:
+            self._duplicates += 1
+            logger.debug("Dropping duplicate mention", tweet_id=tweet_id)
+            return False
+        self._in_flight.add(tweet_id)
+        mention.admitted = True
+        return True
+
+    async def _reply(self, mention: _Mention) -> bool:
+        """Generate the reply to a mention."""
+        mention.reply = await self._generate(mention.tweet)
+        return True
+
+    async def _send(self, mention: _Mention) -> bool:
+        """Post the reply to a mention, the last stage."""
+        await self._post(mention.tweet, mention.reply)
+        return False
@@ -0,0 +1,84 @@
+"""
+Query Planner Module
+
+This module packs the monitored handles into as few RapidAPI search queries as
+the provider's query-length limit allows, e.g. "@a OR @b OR @c", so a polling
+cycle costs one search per group of accounts instead of one per account. The
+tweets a combined query returns are demultiplexed back to the accounts they
+mention.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+OR = " OR "
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """One search request and the monitored accounts it covers"""
+
+    query: str
+    accounts: tuple[str, ...]
+
+
+def plan_queries(
+    accounts: Sequence[str], max_length: int, max_accounts: int | None = None
+) -> list[SearchQuery]:
+    """
+    Pack accounts into combined OR queries no longer than max_length.
+
+    Accounts keep their order. One that is too long to share a query on its own
+    is searched alone, and duplicates are searched once.
+
+    Args:
+        accounts: Monitored handles, e.g. "@FlareNetworks"
+        max_length: Longest query the search provider accepts
+        max_accounts: Most accounts one query covers, e.g. so that each still
+            gets its full share of the results one search can return
+
+    Returns:
+        The queries to run each polling cycle
+    """
+    queries: list[SearchQuery] = []
+    group: list[str] = []
+    length = 0
+    for account in dict.fromkeys(accounts):
+        added = len(account) + (len(OR) if group else 0)
+        full = max_accounts is not None and len(group) >= max_accounts
+        if group and (full or length + added > max_length):
+            queries.append(SearchQuery(OR.join(group), tuple(group)))
+            group, length, added = [], 0, len(account)
+        group.append(account)
+        length += added
+    if group:
+        queries.append(SearchQuery(OR.join(group), tuple(group)))
+    return queries
+
+
+def demultiplex(
+    tweets: Sequence[dict[str, Any]], accounts: Sequence[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """
+    Assign the tweets of a combined query to the accounts they mention.
+
+    A tweet mentioning several of the accounts goes to the first of them it
+    mentions, so it is answered once. Tweets mentioning none are dropped.
+
+    Args:
+        tweets: Tweets returned by the query
+        accounts: Accounts the query covers
+
+    Returns:
+        Account -> its tweets, in the order returned, for every account
+    """
+    by_handle = {account.lower(): account for account in accounts}
+    demuxed: dict[str, list[dict[str, Any]]] = {account: [] for account in accounts}
+    for tweet in tweets:
+        for mention in tweet.get("entities", {}).get("user_mentions", []):
+            account = by_handle.get(f"@{mention.get('screen_name', '').lower()}")
+            if account:
+                demuxed[account].append(tweet)
+                break
+    return demuxed
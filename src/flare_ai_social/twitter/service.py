@@ -2,13 +2,21 @@ import asyncio
 import calendar
 import time
 import uuid
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 from typing import Any
 
 import aiohttp
+import requests
 import structlog
+from requests.adapters import HTTPAdapter
 
 from flare_ai_social.ai import BaseAIProvider
+from flare_ai_social.quota import SOURCE_TWITTER, QuotaManager
+from flare_ai_social.storage import StateStore
+from flare_ai_social.twitter.cursor import MentionCursor
+from flare_ai_social.twitter.pipeline import MentionPipeline
+from flare_ai_social.twitter.planner import SearchQuery, demultiplex, plan_queries
 
 logger = structlog.get_logger(__name__)
 
@@ -16,6 +24,8 @@ logger = structlog.get_logger(__name__)
 HTTP_OK = 200
 HTTP_RATE_LIMIT = 429
 HTTP_SERVER_ERROR = 500
+SEARCH_COUNT = 20  # Results requested per monitored account
+MAX_SEARCH_COUNT = 100  # Results one search may return
 ERR_TWITTER_CREDENTIALS = "Required Twitter API credentials not provided."
 ERR_RAPIDAPI_KEY = "RapidAPI key not provided. Please check your settings."
 FALLBACK_REPLY = "We're experiencing some difficulties."
@@ -32,8 +42,20 @@ class TwitterConfig:
     access_secret: str | None = None
     rapidapi_key: str | None = None
     rapidapi_host: str | None = "twitter241.p.rapidapi.com"
+    rapidapi_max_concurrency: int = 5  # Searches in flight at once
+    rapidapi_max_query_length: int = 500  # Longest combined OR query
     accounts_to_monitor: list[str] | None = None
     polling_interval: int = 30
+    # Pooled HTTP connections shared by all Twitter API and RapidAPI calls
+    http_pool_size: int = 20  # Open connections in total
+    http_pool_size_per_host: int = 10  # Open connections to any one host
+    http_keepalive: float = 30.0  # Seconds an idle connection is kept open
+    http_timeout: float = 30.0  # Seconds before a request is abandoned
+    # Mention pipeline
+    generate_workers: int = 8  # Replies generated concurrently
+    post_workers: int = 4  # Replies posted concurrently
+    pipeline_queue_size: int = 100  # Mentions buffered per stage
+    max_seen_ids: int = 1000  # Answered tweet IDs remembered above the cursors
 
 
 class TwitterBot:
@@ -41,8 +63,13 @@ class TwitterBot:
         self,
         ai_provider: BaseAIProvider,
         config: TwitterConfig,
+        quota: QuotaManager | None = None,
+        state_store: StateStore | None = None,
     ) -> None:
         self.ai_provider = ai_provider
+        self.quota = quota  # LLM quotas shared with Telegram and the API
+        # Persists the mention cursors; opened and closed by monitor_mentions
+        self.state = state_store or StateStore()
 
         # Twitter API credentials
         self.bearer_token = config.bearer_token
@@ -54,6 +81,8 @@ class TwitterBot:
         # RapidAPI credentials
         self.rapidapi_key = config.rapidapi_key
         self.rapidapi_host = config.rapidapi_host
+        # Bounds concurrent searches to what the RapidAPI plan allows
+        self._search_limit = asyncio.Semaphore(config.rapidapi_max_concurrency)
 
         # Check if required credentials are provided
         if not all(
@@ -67,6 +96,37 @@ class TwitterBot:
         # Monitoring parameters
         self.accounts_to_monitor = config.accounts_to_monitor or ["@privychatxyz"]
         self.polling_interval = config.polling_interval
+        # Accounts are searched in combined "@a OR @b" queries, few enough per
+        # query that each account still gets SEARCH_COUNT results
+        self.search_queries = plan_queries(
+            self.accounts_to_monitor,
+            config.rapidapi_max_query_length,
+            max_accounts=MAX_SEARCH_COUNT // SEARCH_COUNT,
+        )
+        self.cursor = MentionCursor(self.state, max_seen=config.max_seen_ids)
+
+        # One connection pool for every request, created on first use in the
+        # bot's event loop and closed by close()
+        self.http_pool_size = config.http_pool_size
+        self.http_pool_size_per_host = config.http_pool_size_per_host
+        self.http_keepalive = config.http_keepalive
+        self.http_timeout = config.http_timeout
+        self._session: aiohttp.ClientSession | None = None
+        self._sync_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2, pool_maxsize=config.http_pool_size_per_host
+        )
+        self._sync_session.mount("https://", adapter)
+
+        # New mentions are answered concurrently by a worker pipeline
+        self.pipeline = MentionPipeline(
+            self.generate_reply,
+            self.post_mention_reply,
+            generate_workers=config.generate_workers,
+            post_workers=config.post_workers,
+            queue_size=config.pipeline_queue_size,
+            done=self._mention_done,
+        )
 
         # API endpoints
         self.twitter_api_base = "https://api.twitter.com/2"
@@ -77,6 +137,28 @@ class TwitterBot:
             accounts=self.accounts_to_monitor,
         )
 
+    def _http(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it in the running loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.http_pool_size,
+                limit_per_host=self.http_pool_size_per_host,
+                keepalive_timeout=self.http_keepalive,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.http_timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled HTTP sessions."""
+        if self._session:
+            await self._session.close()
+            self._session = None
+        self._sync_session.close()
+
     def _url_encode(self, value: Any) -> str:
         """Properly URL encode according to OAuth 1.0a spec (RFC 3986)"""
         import urllib.parse
@@ -184,15 +266,13 @@ class TwitterBot:
         url = f"{self.twitter_api_base}/{endpoint}"
         headers = self._get_twitter_api_headers(method.upper(), url)
         
-        # Use synchronous requests for sync methods
-        import requests
-        
+        # Sync methods share a pooled requests session
         try:
-            response = requests.request(
+            response = self._sync_session.request(
                 method=method.lower(),
                 url=url,
                 headers=headers,
-                timeout=30,
+                timeout=self.http_timeout,
                 **kwargs
             )
             
@@ -211,17 +291,10 @@ class TwitterBot:
 
         try:
             headers = self._get_twitter_api_headers("POST", url)
-            timeout = aiohttp.ClientTimeout(total=30)
-
-            async with (
-                aiohttp.ClientSession() as session,
-                session.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=timeout,
-                ) as response,
-            ):
+
+            async with self._http().post(
+                url, headers=headers, json=payload
+            ) as response:
                 if response.status in [HTTP_OK, 201]:
                     result = await response.json()
                     tweet_id = result["data"]["id"]
@@ -286,15 +359,9 @@ class TwitterBot:
         try:
             headers = self._get_twitter_api_headers("POST", url)
 
-            async with (
-                aiohttp.ClientSession() as session,
-                session.post(
-                    url,
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as response,
-            ):
+            async with self._http().post(
+                url, headers=headers, json=payload
+            ) as response:
                 if response.status in [HTTP_OK, 201]:
                     result = await response.json()
                     logger.info("Reply posted successfully")
@@ -386,9 +453,10 @@ class TwitterBot:
         session: aiohttp.ClientSession,
         retry_count: int = 0,
         max_retries: int = 3,
+        count: int = SEARCH_COUNT,
     ) -> list[dict[str, Any]]:
         """Search Twitter using new RapidAPI endpoint with a recent time filter"""
-        params = {"query": keyword, "count": "20", "type": "Latest"}
+        params = {"query": keyword, "count": str(count), "type": "Latest"}
 
         try:
             async with session.get(
@@ -411,7 +479,7 @@ class TwitterBot:
                     )
                     await asyncio.sleep(retry_delay)
                     return await self.search_twitter(
-                        keyword, session, retry_count + 1, max_retries
+                        keyword, session, retry_count + 1, max_retries, count
                     )
                 error_text = await response.text()
                 logger.error(
@@ -424,6 +492,29 @@ class TwitterBot:
             logger.exception("Error during search for %s", keyword)
             return []
 
+    async def search_accounts(
+        self, session: aiohttp.ClientSession
+    ) -> AsyncIterator[tuple[SearchQuery, list[dict[str, Any]]]]:
+        """Run the planned searches concurrently, yielding as results arrive"""
+
+        async def search(
+            query: SearchQuery,
+        ) -> tuple[SearchQuery, list[dict[str, Any]]]:
+            count = SEARCH_COUNT * len(query.accounts)  # At most MAX_SEARCH_COUNT
+            async with self._search_limit:
+                logger.debug("Searching for mentions of %s", query.query)
+                return query, await self.search_twitter(
+                    query.query, session, count=count
+                )
+
+        tasks = [asyncio.create_task(search(q)) for q in self.search_queries]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+
     def _extract_tweets_from_response(
         self, response_data: dict[str, Any]
     ) -> list[dict[str, Any]]:
@@ -480,52 +571,50 @@ class TwitterBot:
             return tweets
 
     def process_tweets(
-        self, tweets: list[dict[str, Any]], account: str
-    ) -> list[dict[str, Any]]:
-        """Process tweets to find new mentions from the last polling interval"""
-        if not tweets:
-            return []
-
-        new_mentions: list[dict[str, Any]] = []
-        current_time = time.time()
-        time_window_ago = current_time - self.polling_interval
-
-        for tweet in tweets:
-            if not all(k in tweet for k in ["id_str", "created_at"]):
-                continue
-
-            try:
-                created_time = time.strptime(
-                    tweet["created_at"], "%a %b %d %H:%M:%S %z %Y"
-                )
-                tweet_timestamp = calendar.timegm(created_time)
-                if tweet_timestamp < time_window_ago:
-                    continue
-            except (ValueError, KeyError):
-                logger.exception("Error parsing tweet timestamp")
-                continue
-
-            mentioned = False
-            for mention in tweet.get("entities", {}).get("user_mentions", []):
-                if f"@{mention.get('screen_name', '').lower()}" == account.lower():
-                    mentioned = True
-                    break
-
-            if not mentioned:
-                continue
+        self, tweets: list[dict[str, Any]], accounts: Sequence[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Find each account's mentions past its cursor and not yet answered"""
+        # A combined query returns the mentions of all its accounts together
+        by_account = demultiplex(
+            [tweet for tweet in tweets if tweet.get("id_str", "").isdigit()],
+            accounts,
+        )
+        new_mentions: dict[str, list[dict[str, Any]]] = {}
+        for account, mentions in by_account.items():
+            # Until an account has a cursor, only recent mentions are answered
+            bootstrap = self.cursor.since_id(account) is None
+            new_mentions[account] = []
+            skipped: list[int] = []
+            for tweet in mentions:
+                tweet_id = int(tweet["id_str"])
+                if self.cursor.is_new(account, tweet_id) and (
+                    not bootstrap or self._is_recent(tweet)
+                ):
+                    logger.info("Found new mention of %s: %s", account, tweet_id)
+                    self.cursor.track(account, tweet_id)
+                    new_mentions[account].append(tweet)
+                else:
+                    skipped.append(tweet_id)
+            self.cursor.skip(account, skipped)
+        return new_mentions
 
-            logger.info(
-                "Found recent mention (within last %d sec): %s",
-                self.polling_interval,
-                tweet["id_str"],
+    def _is_recent(self, tweet: dict[str, Any]) -> bool:
+        """Whether a tweet was created within the last polling interval"""
+        try:
+            created_time = time.strptime(
+                tweet["created_at"], "%a %b %d %H:%M:%S %z %Y"
             )
-            new_mentions.append(tweet)
-
-        return new_mentions
+        except (ValueError, KeyError):
+            logger.exception("Error parsing tweet timestamp")
+            return False
+        return calendar.timegm(created_time) >= time.time() - self.polling_interval
 
     async def handle_mention(self, tweet: dict[str, Any]) -> None:
         """Handle a mention by generating AI response and replying to it"""
-        tweet_id = tweet.get("id_str", "")
+        await self.post_mention_reply(tweet, await self.generate_reply(tweet))
+
+    async def generate_reply(self, tweet: dict[str, Any]) -> str:
+        """Generate the reply to a mention, falling back to an apology on error"""
         username = "user"
         for mention in tweet.get("entities", {}).get("user_mentions", []):
             if mention.get("id_str") == tweet.get("user_id_str"):
@@ -540,42 +629,61 @@ class TwitterBot:
                 mention_text = f"@{mention.get('screen_name', '')}"
                 clean_text = clean_text.replace(mention_text, "").strip()
 
-            ai_response = self.ai_provider.generate_content(clean_text)
+            if self.quota:
+                # Mentions are background work, so wait for quota rather than drop
+                await self.quota.acquire(
+                    SOURCE_TWITTER, user=tweet.get("user_id_str") or None
+                )
+            ai_response = await self.ai_provider.agenerate_content(clean_text)
             response_text = ai_response.text
 
             max_chars = 280
             if len(response_text) > max_chars:
                 response_text = response_text[: max_chars - 3] + "..."
-
-            await self.post_reply(response_text, tweet_id)
         except Exception:
             logger.exception("Error generating AI response")
-            fallback_reply = f"@{username} {FALLBACK_REPLY}"
-            await self.post_reply(fallback_reply, tweet_id)
+            return f"@{username} {FALLBACK_REPLY}"
+        else:
+            return response_text
+
+    async def post_mention_reply(self, tweet: dict[str, Any], text: str) -> None:
+        """Post a generated reply to a mention"""
+        await self.post_reply(text, tweet.get("id_str", ""))
+
+    def _mention_done(self, tweet: dict[str, Any]) -> None:
+        """Record a mention as answered once it leaves the pipeline"""
+        self.cursor.done(int(tweet["id_str"]))
+
+    async def new_mentions(
+        self, session: aiohttp.ClientSession
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the new mentions of all accounts as their searches complete"""
+        async for query, tweets in self.search_accounts(session):
+            mentions = self.process_tweets(tweets, query.accounts)
+            for account, new_mentions in mentions.items():
+                if not new_mentions:
+                    logger.debug("No new mentions found for %s", account)
+                    continue
+                logger.info(
+                    "Found %d new mentions for %s",
+                    len(new_mentions),
+                    account,
+                )
+                for tweet in new_mentions:
+                    yield tweet
 
     async def monitor_mentions(self) -> None:
         """Main method to monitor mentions for all accounts"""
-        async with aiohttp.ClientSession() as session:
+        session = self._http()
+        await self.state.open()
+        await self.cursor.load()
+        self.pipeline.start()
+        try:
             while True:
                 try:
-                    for account in self.accounts_to_monitor:
-                        logger.debug("Searching for mentions of %s", account)
-                        tweets = await self.search_twitter(account, session)
-                        new_mentions = self.process_tweets(tweets, account)
-
-                        if new_mentions:
-                            logger.info(
-                                "Found %d new mentions for %s",
-                                len(new_mentions),
-                                account,
-                            )
-                            for tweet in new_mentions:
-                                await self.handle_mention(tweet)
-                        else:
-                            logger.debug("No new mentions found for %s", account)
-
-                        if len(self.accounts_to_monitor) > 1:
-                            await asyncio.sleep(1)
+                    # Mentions are answered in the background while the next
+                    # cycle waits; a full pipeline holds the search back
+                    await self.pipeline.run(self.new_mentions(session))
 
                     logger.debug(
                         "Completed mention check cycle, sleeping for %d seconds",
@@ -586,6 +694,10 @@ class TwitterBot:
                 except Exception:
                     logger.exception("Error in monitoring loop")
                     await asyncio.sleep(self.polling_interval * 2)
+        finally:
+            await self.pipeline.stop()
+            await self.state.close()
+            await self.close()
 
     def start(self) -> None:
         """Start the monitoring process"""
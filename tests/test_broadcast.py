@@ -0,0 +1,63 @@
+import asyncio
+import time
+from datetime import timedelta
+from typing import Any
+
+from telegram.error import ChatMigrated, Forbidden, RetryAfter
+
+from flare_ai_social.telegram import Broadcaster
+
+
+class FakeBot:
+    """Bot recording sends and raising queued errors per chat"""
+
+    def __init__(self, errors: dict[int, list[Exception]] | None = None) -> None:
+        self.errors = errors or {}
+        self.sent: list[tuple[int, float]] = []
+
+    async def send_message(self, chat_id: int, text: str, **_kwargs: Any) -> None:
+        if self.errors.get(chat_id):
+            raise self.errors[chat_id].pop(0)
+        self.sent.append((chat_id, time.monotonic()))
+
+
+def test_errors_are_retried_or_reported() -> None:
+    """Test flood control is waited out, and blocked or migrated chats reported"""
+    bot = FakeBot(
+        {
+            1: [RetryAfter(timedelta(milliseconds=10))],
+            2: [Forbidden("bot was blocked by the user")],
+            -3: [ChatMigrated(-1003)],
+        }
+    )
+    broadcaster = Broadcaster(bot, global_rate=1000)  # type: ignore[arg-type]
+
+    result = asyncio.run(broadcaster.broadcast([1, 2, -3], "update"))
+
+    assert (result.delivered, result.failed) == (2, 1)
+    assert result.unsubscribed == [2]
+    assert result.migrated == {-3: -1003}
+    assert sorted(chat_id for chat_id, _ in bot.sent) == [-1003, 1]
+
+
+def test_chat_buckets_pace_overlapping_broadcasts() -> None:
+    """Test a chat's rate holds across concurrent broadcasts and buckets are bounded"""
+    bot = FakeBot()
+    broadcaster = Broadcaster(
+        bot,  # type: ignore[arg-type]
+        global_rate=1000,
+        private_chat_rate=20,
+        max_chats=2,
+    )
+
+    async def run() -> None:
+        await asyncio.gather(
+            broadcaster.broadcast([1], "first"),
+            broadcaster.broadcast([1, 2, 3], "second"),
+        )
+
+    asyncio.run(run())
+
+    to_first = [sent_at for chat_id, sent_at in bot.sent if chat_id == 1]
+    assert to_first[1] - to_first[0] >= 0.04  # noqa: PLR2004
+    assert len(broadcaster._chats) == 2  # noqa: PLR2004, SLF001
@@ -0,0 +1,111 @@
+import os
+import time
+
+import pytest
+
+from flare_ai_social.telegram.classifier import Intent, MessageClassifier
+
+BOT_ID = 42
+SYMBOLS = ["FLR/USD", "BTC/USD", "ETH/USD"]
+
+# Realistic group-chat traffic: mostly chatter the bot must ignore
+GROUP_CORPUS = [
+    "gm everyone",
+    "anyone know when the next delegation reward epoch starts?",
+    "lol",
+    "Just bridged some USDT over, fees were tiny",
+    "Is the FTSO v2 upgrade live on mainnet yet",
+    "https://flare.network/news/some-long-article-about-data-protocols",
+    "I think validators need to update their nodes before Thursday",
+    "👍👍",
+    "what wallet are you guys using for staking",
+    "The airdrop snapshot was yesterday right?",
+    "@somebody_else can you check the explorer",
+    "hey @FlareHelperBot what is the FTSO?",
+    "token prices today?",
+    "FLR/USD",
+    "0x01464c522f55534400000000000000000000000000",
+]
+
+
+@pytest.fixture
+def classifier() -> MessageClassifier:
+    """Fixture to provide a classifier for a bot named FlareHelperBot"""
+    return MessageClassifier(bot_id=BOT_ID, username="FlareHelperBot", symbols=SYMBOLS)
+
+
+@pytest.mark.parametrize(
+    ("text", "is_group", "intent", "cleaned"),
+    [
+        ("gm everyone", True, Intent.IGNORE, ""),
+        ("ping @FlareHelperBot_dev", True, Intent.IGNORE, ""),
+        (
+            "hey @flarehelperbot what is the FTSO?",
+            True,
+            Intent.MENTION,
+            "hey  what is the FTSO?",
+        ),
+        ("@FlareHelperBot", True, Intent.MENTION, "Hello"),
+        ("show me token prices", True, Intent.PRICE, "show me token prices"),
+        ("flr/usd", True, Intent.FEED, "flr/usd"),
+        ("0x01464c52", True, Intent.FEED, "0x01464c52"),
+        ("0x01zz", False, Intent.DIRECT, "0x01zz"),
+        ("/tvl@FlareHelperBot", True, Intent.TVL, "/tvl@FlareHelperBot"),
+        ("/help", False, Intent.COMMAND, "/help"),
+        ("  what is Flare?  ", False, Intent.DIRECT, "what is Flare?"),
+    ],
+)
+def test_classify(
+    classifier: MessageClassifier,
+    text: str,
+    is_group: bool,  # noqa: FBT001
+    intent: Intent,
+    cleaned: str,
+) -> None:
+    """Test intents and cleaned text for group and private messages"""
+    result = classifier.classify(text, is_group=is_group)
+
+    assert result.intent is intent
+    assert result.text == cleaned
+
+
+def test_reply_to_bot(classifier: MessageClassifier) -> None:
+    """Test group replies to the bot are answered without a mention"""
+    result = classifier.classify(
+        "and what about SGB?", is_group=True, reply_to_bot=True
+    )
+
+    assert result.intent is Intent.REPLY
+
+
+def test_classify_group_corpus_ignores_chatter(classifier: MessageClassifier) -> None:
+    """Test only the questions and commands in group chatter are answered"""
+    ignored = [
+        text
+        for text in GROUP_CORPUS
+        if classifier.classify(text, is_group=True).intent is Intent.IGNORE
+    ]
+    assert len(ignored) == len(GROUP_CORPUS) - 4
+
+
+@pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"), reason="set RUN_BENCHMARKS=1 to run"
+)
+def test_classify_group_corpus_benchmark(
+    classifier: MessageClassifier, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Microbenchmark the ignore path over the group-chat corpus, reporting only"""
+    ignored = [
+        text
+        for text in GROUP_CORPUS
+        if classifier.classify(text, is_group=True).intent is Intent.IGNORE
+    ]
+    rounds = 2000
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in ignored:
+            classifier.classify(text, is_group=True)
+    per_message = (time.perf_counter() - start) / (rounds * len(ignored))
+
+    with capsys.disabled():
+        print(f"\nclassify ignore path: {per_message * 1e6:.2f} us/message")
@@ -0,0 +1,87 @@
+import asyncio
+
+from flare_ai_social.telegram.coalescer import MessageCoalescer
+
+KEY = (-100, 7)
+
+
+def test_burst_is_answered_once() -> None:
+    """Test consecutive messages produce one generation from the merged text"""
+    coalescer = MessageCoalescer(window=0.02, max_wait=1)
+    prompts: list[str] = []
+
+    async def generate(prompt: str) -> str:
+        prompts.append(prompt)
+        return "reply"
+
+    async def run() -> list[str | None]:
+        for message_id, text in enumerate(["so", "what is", "the FTSO?"]):
+            coalescer.add(KEY, message_id, text)
+        # Handlers of a chat run one after another, in arrival order
+        return [
+            await coalescer.run(KEY, message_id, generate) for message_id in range(3)
+        ]
+
+    assert asyncio.run(run()) == ["reply", None, None]
+    assert prompts == ["so\nwhat is\nthe FTSO?"]
+
+
+def test_new_message_supersedes_generation() -> None:
+    """Test text arriving mid-generation cancels it and is answered with the burst"""
+    coalescer = MessageCoalescer(window=0.01, max_wait=1)
+    prompts: list[str] = []
+
+    async def generate(prompt: str) -> str:
+        prompts.append(prompt)
+        await asyncio.sleep(0.05)
+        return prompt
+
+    async def run() -> list[str | None]:
+        coalescer.add(KEY, 1, "first")
+        first = asyncio.create_task(coalescer.run(KEY, 1, generate))
+        await asyncio.sleep(0.03)
+        coalescer.add(KEY, 2, "second")
+        return [await first, await coalescer.run(KEY, 2, generate)]
+
+    assert asyncio.run(run()) == [None, "first\nsecond"]
+    assert prompts == ["first", "first\nsecond"]
+    assert coalescer.metrics().superseded == 1
+
+
+def test_dropped_message_is_not_answered() -> None:
+    """Test a discarded message leaves the burst answered by its other messages"""
+    coalescer = MessageCoalescer(window=0.01, max_wait=1)
+    prompts: list[str] = []
+
+    async def generate(prompt: str) -> str:
+        prompts.append(prompt)
+        return "reply"
+
+    async def run() -> str | None:
+        coalescer.add(KEY, 1, "dropped")
+        coalescer.add(KEY, 2, "kept")
+        coalescer.discard(KEY, 1)
+        return await coalescer.run(KEY, 2, generate)
+
+    assert asyncio.run(run()) == "reply"
+    assert prompts == ["kept"]
+    assert coalescer.metrics().pending == 0
+
+
+def test_stale_burst_is_replaced() -> None:
+    """Test a burst whose handler never ran does not absorb later messages"""
+    now = [0.0]
+    coalescer = MessageCoalescer(window=0.5, max_wait=3, clock=lambda: now[0])
+    prompts: list[str] = []
+
+    async def generate(prompt: str) -> str:
+        prompts.append(prompt)
+        return "reply"
+
+    coalescer.add(KEY, 1, "lost at shutdown")
+    now[0] = 10.0
+    coalescer.add(KEY, 2, "hello")
+    now[0] = 11.0
+
+    assert asyncio.run(coalescer.run(KEY, 2, generate)) == "reply"
+    assert prompts == ["hello"]
@@ -0,0 +1,51 @@
+import datetime as dt
+import json
+from pathlib import Path
+
+import pytest
+from telegram import Chat, Message, Update
+
+from flare_ai_social.telegram import debug
+from flare_ai_social.telegram.debug import UpdateDebugger
+
+WATCHED = -100
+
+
+def make_update(update_id: int, chat_id: int) -> Update:
+    """Build a group text message update"""
+    chat = Chat(chat_id, "group")
+    message = Message(update_id, dt.datetime.now(dt.UTC), chat, text="gm")
+    return Update(update_id, message=message)
+
+
+def test_unselected_update_builds_nothing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test an unsampled, unwatched update is never serialised or recorded"""
+    built: list[str] = []
+    monkeypatch.setattr(debug, "dump_update", lambda _u: built.append("dump"))
+    monkeypatch.setattr(Update, "to_dict", lambda _u, **_kw: built.append("dict"))
+    record = tmp_path / "updates.jsonl"
+    debugger = UpdateDebugger(
+        sample_rate=0.1, chat_ids=[WATCHED], record_path=record, rng=lambda: 0.5
+    )
+
+    for update_id in range(10):
+        debugger.observe(make_update(update_id, 7))
+
+    assert built == []
+    assert not record.exists()
+
+
+def test_watched_chat_is_recorded(tmp_path: Path) -> None:
+    """Test updates of a watched chat are appended to the JSON lines sink"""
+    record = tmp_path / "updates.jsonl"
+    debugger = UpdateDebugger(chat_ids=[WATCHED], record_path=record)
+
+    debugger.observe(make_update(1, WATCHED))
+    debugger.observe(make_update(2, 7))
+    debugger.observe(make_update(3, WATCHED))
+
+    lines = [json.loads(line) for line in record.read_text().splitlines()]
+    assert [line["update_id"] for line in lines] == [1, 3]
+    assert lines[0]["message"]["chat"]["id"] == WATCHED
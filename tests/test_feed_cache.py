@@ -0,0 +1,53 @@
+import asyncio
+
+from flare_ai_social.ftso import FeedReader, FeedValue, FeedValueCache, FtsoClient
+
+FLR = b"\x01FLR/USD".ljust(21, b"\0")
+
+
+class FakeClock:
+    """Manually advanced wall clock"""
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_values_expire_after_timestamp_plus_horizon() -> None:
+    """Test a value is served until its on-chain timestamp plus the horizon"""
+    clock = FakeClock(1000.5)
+    cache = FeedValueCache(horizon=2.0, clock=clock)
+    value = FeedValue(FLR, 100, 2, 1000)
+    cache.put(value)
+
+    assert cache.get(FLR) == value
+    clock.now = 1002.0
+    assert cache.get(FLR) is None
+    metrics = cache.metrics()
+    assert (metrics.hits, metrics.misses, metrics.size) == (1, 1, 0)
+
+
+def test_older_value_does_not_replace_newer() -> None:
+    """Test a late response for an older round is ignored"""
+    cache = FeedValueCache(horizon=2.0, clock=FakeClock(1000))
+    cache.put(FeedValue(FLR, 101, 2, 1000))
+    cache.put(FeedValue(FLR, 100, 2, 999))
+
+    cached = cache.get(FLR)
+
+    assert cached is not None
+    assert cached.value == 101  # noqa: PLR2004
+
+
+def test_reader_serves_cached_values_without_a_call() -> None:
+    """Test a fresh cached value short-circuits the batched read"""
+    cache = FeedValueCache(horizon=2.0, clock=FakeClock(1000))
+    cache.put(FeedValue(FLR, 100, 2, 1000))
+    reader = FeedReader(FtsoClient(), cache=cache)
+
+    value = asyncio.run(reader.read(FLR))
+
+    assert value.value == 100  # noqa: PLR2004
+    assert reader.metrics().rpc_calls == 0
@@ -0,0 +1,108 @@
+import asyncio
+
+import httpx
+import pytest
+
+from flare_ai_social.telegram import service
+from flare_ai_social.telegram.feed_monitor import FeedMonitor, FeedPost
+from flare_ai_social.telegram.service import TelegramBot
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Flare</title>
+<item><guid>post-2</guid><title>Newest</title><link>https://x.com/2</link></item>
+<item><guid>post-1</guid><title>Older</title><link>https://x.com/1</link></item>
+</channel></rss>"""
+ETAG = '"v1"'
+LAST_MODIFIED = "Sat, 01 Mar 2025 12:00:00 GMT"
+
+
+def test_unchanged_feed_costs_one_304_and_no_parse() -> None:
+    """Test validators are sent back and a 304 yields no post"""
+    requests: list[httpx.Request] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == ETAG:
+            return httpx.Response(304)
+        headers = {"ETag": ETAG, "Last-Modified": LAST_MODIFIED}
+        return httpx.Response(200, headers=headers, content=RSS)
+
+    monitor = FeedMonitor("https://feed.test/rss")
+    monitor._client = httpx.AsyncClient(transport=httpx.MockTransport(respond))  # noqa: SLF001
+
+    async def run() -> list[FeedPost | None]:
+        posts = [await monitor.fetch_latest(), await monitor.fetch_latest()]
+        await monitor.close()
+        return posts
+
+    first, second = asyncio.run(run())
+
+    assert first is not None
+    assert (first.id, first.title, first.link) == (
+        "post-2",
+        "Newest",
+        "https://x.com/2",
+    )
+    assert second is None
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == ETAG
+    assert requests[1].headers["If-Modified-Since"] == LAST_MODIFIED
+    metrics = monitor.metrics()
+    assert (metrics.polls, metrics.not_modified, metrics.parsed) == (2, 1, 1)
+
+
+def make_bot() -> TelegramBot:
+    """Build a bot that is never connected to Telegram"""
+    return TelegramBot(ai_provider=None, api_token="token")  # type: ignore[arg-type]  # noqa: S106
+
+
+class FakeFeedMonitor(FeedMonitor):
+    """Feed monitor whose feed never changes"""
+
+    async def fetch_latest(self) -> None:
+        return None
+
+
+class FakeBroadcaster:
+    """Broadcaster failing the test if it is asked to send anything"""
+
+    async def broadcast(self, *_args: object, **_kwargs: object) -> None:
+        pytest.fail("Unchanged feed was broadcast")
+
+
+def test_unchanged_feed_broadcasts_nothing() -> None:
+    """Test a cycle with no new post sends no messages and moves no cursor"""
+    bot = make_bot()
+    bot.feed_monitor = FakeFeedMonitor()
+    bot.broadcaster = FakeBroadcaster()  # type: ignore[assignment]
+    bot.active_monitor_chats = {1}
+
+    asyncio.run(bot.check_and_send_updates())
+
+    assert bot.last_post_id == ""
+
+
+def test_monitor_loop_survives_a_failed_cycle(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test an error in one check is logged and the next check still runs"""
+    monkeypatch.setattr(service, "CHECK_INTERVAL", 0)
+    bot = make_bot()
+    calls: list[int] = []
+
+    async def run() -> None:
+        checked = asyncio.Event()
+
+        async def check() -> None:
+            calls.append(len(calls))
+            if len(calls) == 1:
+                raise RuntimeError
+            checked.set()
+
+        monkeypatch.setattr(bot, "check_and_send_updates", check)
+        loop = asyncio.create_task(bot._monitor_loop())  # noqa: SLF001
+        await asyncio.wait_for(checked.wait(), timeout=1)
+        assert not loop.done()
+        loop.cancel()
+
+    asyncio.run(run())
+
+    assert len(calls) >= 2  # noqa: PLR2004
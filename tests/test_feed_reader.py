@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import Sequence
+
+import aiohttp
+from web3.exceptions import ContractLogicError
+
+from flare_ai_social.ftso import FeedReader, FeedValue, FtsoClient
+
+FLR = b"\x01FLR/USD".ljust(21, b"\0")
+BTC = b"\x01BTC/USD".ljust(21, b"\0")
+BAD = b"\x01BAD/USD".ljust(21, b"\0")
+REVERTED = "execution reverted"
+
+
+class FakeFtsoClient(FtsoClient):
+    """FTSO client recording batches; any batch with an unknown feed reverts"""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        super().__init__()
+        self.calls: list[list[bytes]] = []
+        self.error = error  # Raised by every call, e.g. a transport failure
+
+    async def get_feeds_by_id(self, feed_ids: Sequence[bytes]) -> list[FeedValue]:
+        self.calls.append(list(feed_ids))
+        await asyncio.sleep(0)
+        if self.error:
+            raise self.error
+        if BAD in feed_ids:
+            raise ContractLogicError(REVERTED)
+        return [FeedValue(feed_id, 100, 2, 1700000000) for feed_id in feed_ids]
+
+
+def test_concurrent_reads_share_one_call() -> None:
+    """Test reads within the window are merged and duplicate feeds deduplicated"""
+    client = FakeFtsoClient()
+    reader = FeedReader(client, batch_window=0.01)
+
+    async def run() -> list[FeedValue]:
+        return await asyncio.gather(
+            reader.read(FLR), reader.read(BTC), reader.read(FLR)
+        )
+
+    values = asyncio.run(run())
+
+    assert client.calls == [[FLR, BTC]]
+    assert [value.feed_id for value in values] == [FLR, BTC, FLR]
+    assert reader.metrics().reads == 3  # noqa: PLR2004
+
+
+def test_failed_batch_falls_back_per_feed() -> None:
+    """Test a reverting batch is retried feed by feed, failing only the bad one"""
+    client = FakeFtsoClient()
+    reader = FeedReader(client, batch_window=0.01)
+
+    async def run() -> list[FeedValue | BaseException]:
+        return await asyncio.gather(
+            reader.read(FLR), reader.read(BAD), reader.read(BTC), return_exceptions=True
+        )
+
+    flr, bad, btc = asyncio.run(run())
+
+    assert isinstance(flr, FeedValue)
+    assert isinstance(btc, FeedValue)
+    assert isinstance(bad, ContractLogicError)
+    assert client.calls[0] == [FLR, BAD, BTC]
+    assert sorted(client.calls[1:]) == sorted([[FLR], [BAD], [BTC]])
+
+
+def test_transport_error_fails_the_batch_in_one_call() -> None:
+    """Test a non-revert error is not retried per feed"""
+    client = FakeFtsoClient(aiohttp.ClientConnectionError("connection reset"))
+    reader = FeedReader(client, batch_window=0.01)
+
+    async def run() -> list[FeedValue | BaseException]:
+        return await asyncio.gather(
+            reader.read(FLR), reader.read(BTC), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert client.calls == [[FLR, BTC]]
+    assert all(isinstance(r, aiohttp.ClientConnectionError) for r in results)
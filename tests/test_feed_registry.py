@@ -0,0 +1,59 @@
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+
+from flare_ai_social.ftso import FeedRegistry, FeedValue, FtsoClient, encode_feed_id
+
+
+class FakeFtsoClient(FtsoClient):
+    """FTSO client resolving every feed but SGB/USD to an index"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.index_calls: list[list[int]] = []
+
+    async def get_feed_index(self, feed_id: bytes) -> int:
+        if feed_id == encode_feed_id("SGB/USD"):
+            raise ValueError(feed_id)
+        return feed_id[1]
+
+    async def get_feeds_by_index(
+        self, indices: Sequence[int], feed_ids: Sequence[bytes]
+    ) -> list[FeedValue]:
+        self.index_calls.append(list(indices))
+        return [FeedValue(feed_id, 1, 2, 3) for feed_id in feed_ids]
+
+
+def test_encode_feed_id() -> None:
+    """Test symbols are encoded as category byte plus zero-padded name"""
+    feed_id = encode_feed_id("FLR/USD")
+
+    assert len(feed_id) == 21  # noqa: PLR2004
+    assert feed_id.hex() == "01464c522f555344" + "00" * 13
+    with pytest.raises(ValueError, match="20 ASCII"):
+        encode_feed_id("X" * 21)
+
+
+def test_lookup_by_symbol_and_hex_id() -> None:
+    """Test feeds are found case-insensitively by symbol or hex ID"""
+    registry = FeedRegistry(FakeFtsoClient(), symbols=["FLR/USD", "BTC/USD"])
+    flr = registry.lookup(" flr/usd ")
+
+    assert flr is not None
+    assert registry.lookup(flr.hex_id.upper().replace("0X", "0x")) == flr
+    assert registry.lookup("DOGE/USD") is None
+
+
+def test_read_all_uses_resolved_indices() -> None:
+    """Test unresolved feeds are skipped and the rest read in one call"""
+    client = FakeFtsoClient()
+    registry = FeedRegistry(client, symbols=["FLR/USD", "SGB/USD", "BTC/USD"])
+
+    async def run() -> list[str]:
+        await registry.refresh()
+        return [feed.symbol for feed, _value in await registry.read_all()]
+
+    assert asyncio.run(run()) == ["FLR/USD", "BTC/USD"]
+    assert len(client.index_calls) == 1
+    assert registry.lookup("SGB/USD").index is None
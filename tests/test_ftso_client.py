@@ -0,0 +1,51 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from flare_ai_social.ftso import FeedValue, FtsoClient
+
+FLR = b"\x01FLR/USD".ljust(21, b"\0")
+BTC = b"\x01BTC/USD".ljust(21, b"\0")
+
+
+class FakeCall:
+    """Contract function call resolving to a fixed result"""
+
+    def __init__(self, result: tuple) -> None:
+        self.result = result
+
+    async def call(self) -> tuple:
+        return self.result
+
+
+class FakeFunctions:
+    """FtsoV2 functions recording the feed IDs they were called with"""
+
+    def __init__(self) -> None:
+        self.calls: list[list[bytes]] = []
+
+    def getFeedsById(self, feed_ids: list[bytes]) -> FakeCall:  # noqa: N802
+        self.calls.append(feed_ids)
+        return FakeCall(([2100, 65000000], [5, 3], 1700000000))
+
+
+def test_feeds_are_read_in_one_call() -> None:
+    """Test a multi-feed read is one contract call labelled in request order"""
+    client = FtsoClient()
+    functions = FakeFunctions()
+    client._contract = SimpleNamespace(functions=functions)  # noqa: SLF001
+
+    values = asyncio.run(client.get_feeds_by_id((FLR, BTC)))
+
+    assert functions.calls == [[FLR, BTC]]
+    assert values == [
+        FeedValue(FLR, 2100, 5, 1700000000),
+        FeedValue(BTC, 65000000, 3, 1700000000),
+    ]
+
+
+def test_reads_require_a_connection() -> None:
+    """Test the contract is unavailable before connect()"""
+    with pytest.raises(RuntimeError):
+        asyncio.run(FtsoClient().get_feeds_by_id([FLR]))
@@ -0,0 +1,49 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+from dune_client.models import ExecutionState
+
+from flare_ai_social.market import TOKEN_PRICES_QUERY_ID, MarketDataCache
+
+
+@dataclass
+class FakeResult:
+    """Latest result of a Dune query"""
+
+    state: ExecutionState
+    rows: list[dict[str, Any]] = field(default_factory=list)
+
+    def get_rows(self) -> list[dict[str, Any]]:
+        return self.rows if self.state == ExecutionState.COMPLETED else []
+
+
+class FakeDuneClient:
+    """Dune client returning queued results"""
+
+    def __init__(self, *results: FakeResult) -> None:
+        self.results = list(results)
+
+    def get_latest_result(self, _query_id: int) -> FakeResult:
+        return self.results.pop(0)
+
+
+def test_incomplete_execution_keeps_previous_snapshot() -> None:
+    """Test a refresh without a completed result does not replace cached rows"""
+    client = FakeDuneClient(
+        FakeResult(ExecutionState.COMPLETED, [{"day": "2025-03-01", "price": 1.0}]),
+        FakeResult(ExecutionState.EXECUTING),
+    )
+    cache = MarketDataCache(ttl=300, client_factory=lambda: client)
+
+    async def run() -> tuple[Any, Any]:
+        first = await cache.get(TOKEN_PRICES_QUERY_ID)
+        with pytest.raises(RuntimeError):
+            await cache._refresh(TOKEN_PRICES_QUERY_ID)  # noqa: SLF001
+        return first, await cache.get(TOKEN_PRICES_QUERY_ID)
+
+    first, current = asyncio.run(run())
+
+    assert current is first
+    assert len(current.table) == 1
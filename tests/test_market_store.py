@@ -0,0 +1,78 @@
+import pytest
+
+from flare_ai_social.market import DatedTable
+
+ROWS = [
+    {"day": "2025-03-02", "symbol": "WFLR", "price": 0.021},
+    {"day": "2025-03-01", "symbol": "USDT", "price": 1.0},
+    {"day": "2025-03-03", "symbol": "FLR", "price": 0.023},
+    {"day": "2025-03-02", "symbol": "FLR", "price": 0.022},
+    {"day": "2025-03-01", "symbol": "FLR", "price": 0.020},
+]
+
+
+@pytest.fixture
+def table() -> DatedTable:
+    """Fixture to provide a table of token prices over three days"""
+    return DatedTable(ROWS, date_column="day")
+
+
+def test_latest_date(table: DatedTable) -> None:
+    """Test the most recent day is tracked"""
+    assert table.latest_date == "2025-03-03"
+    assert table.dates == ("2025-03-01", "2025-03-02", "2025-03-03")
+
+
+def test_rows_for_date_sorted_by_symbol(table: DatedTable) -> None:
+    """Test a day's rows are returned ordered by symbol"""
+    rows = table.rows_for("2025-03-02")
+
+    assert [row["symbol"] for row in rows] == ["FLR", "WFLR"]
+    assert rows[0]["price"] == pytest.approx(0.022)
+
+
+def test_rows_for_missing_date(table: DatedTable) -> None:
+    """Test an unknown day yields no rows"""
+    assert table.rows_for("2025-02-28") == []
+
+
+def test_between(table: DatedTable) -> None:
+    """Test inclusive day ranges, including bounds without data"""
+    recent = table.between("2025-03-02", "2025-03-03")
+    assert list(recent["symbol"]) == ["FLR", "WFLR", "FLR"]
+    first_day = table.between("2025-02-01", "2025-03-01")
+    assert list(first_day["symbol"]) == ["FLR", "USDT"]
+    assert table.between("2025-04-01", "2025-04-30").empty
+
+
+def test_empty_result() -> None:
+    """Test a result without rows or without the date column"""
+    assert DatedTable([], date_column="day").latest_date is None
+    assert len(DatedTable([{"symbol": "FLR"}], date_column="day")) == 0
+
+
+def test_sparse_rows_keep_their_values() -> None:
+    """Test missing keys stay missing and integers are not turned into floats"""
+    rows = [
+        {"day": "2025-03-01", "symbol": "FLR", "holders": 3},
+        {"day": "2025-03-01", "symbol": "SGB", "price": 0.01},
+    ]
+    table = DatedTable(rows, date_column="day")
+
+    assert table.rows_for("2025-03-01") == rows
+    assert table.records() == rows
+    assert isinstance(table.records()[0]["holders"], int)
+
+
+def test_rows_without_a_date_are_dropped() -> None:
+    """Test a null or missing day is neither indexed nor persisted"""
+    rows = [
+        {"day": "2025-03-01", "symbol": "FLR"},
+        {"day": None, "symbol": "SGB"},
+        {"symbol": "XRP"},
+    ]
+    table = DatedTable(rows, date_column="day")
+
+    assert table.dates == ("2025-03-01",)
+    assert table.latest_date == "2025-03-01"
+    assert table.records() == [{"day": "2025-03-01", "symbol": "FLR"}]
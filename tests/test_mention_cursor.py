@@ -0,0 +1,54 @@
+import asyncio
+from pathlib import Path
+
+from flare_ai_social.storage import StateStore
+from flare_ai_social.twitter import MentionCursor
+
+
+def test_cursor_waits_for_oldest_pending_mention(tmp_path: Path) -> None:
+    """Test out-of-order replies advance the cursor only past finished mentions"""
+
+    async def run() -> tuple[list[int | None], list[bool]]:
+        store = StateStore(tmp_path / "state.db")
+        await store.open()
+        cursor = MentionCursor(store)
+        await cursor.load()
+        cursor.skip("@Flare", [5])
+        for tweet_id in (10, 11, 12):
+            cursor.track("@flare", tweet_id)
+        since = [cursor.since_id("@flare")]
+        cursor.done(12)
+        since.append(cursor.since_id("@flare"))
+        cursor.done(10)
+        since.append(cursor.since_id("@flare"))
+        await store.close()
+
+        # A restart picks up the unanswered 11 but not the answered 12
+        store = StateStore(tmp_path / "state.db")
+        await store.open()
+        restarted = MentionCursor(store)
+        await restarted.load()
+        await store.close()
+        since.append(restarted.since_id("@flare"))
+        return since, [restarted.is_new("@flare", i) for i in (10, 11, 12, 13)]
+
+    since, new = asyncio.run(run())
+
+    assert since == [5, 9, 10, 10]
+    assert new == [False, True, False, True]
+
+
+def test_seen_ids_are_bounded() -> None:
+    """Test only the most recently answered IDs are remembered"""
+
+    async def run() -> list[bool]:
+        store = StateStore()
+        await store.open()
+        cursor = MentionCursor(store, max_seen=2)
+        for tweet_id in (30, 20, 10):
+            cursor.track("@flare", tweet_id)
+            cursor.done(tweet_id)
+        await store.close()
+        return [cursor.is_new("@other", i) for i in (10, 20, 30)]
+
+    assert asyncio.run(run()) == [False, False, True]
@@ -0,0 +1,72 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from flare_ai_social.twitter import MentionPipeline
+
+
+async def mentions(*tweet_ids: str) -> AsyncIterator[dict]:
+    """Yield one fetch cycle's mentions"""
+    for tweet_id in tweet_ids:
+        yield {"id_str": tweet_id}
+
+
+def test_burst_is_answered_in_parallel_once() -> None:
+    """Test a burst is generated concurrently and in-flight repeats are dropped"""
+    posted: list[tuple[str, str]] = []
+    running = 0
+    peak = 0
+
+    async def generate(tweet: dict) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            running -= 1
+        return f"re {tweet['id_str']}"
+
+    async def post(tweet: dict, reply: str) -> None:
+        posted.append((tweet["id_str"], reply))
+
+    async def run() -> None:
+        pipeline = MentionPipeline(generate, post, generate_workers=50, queue_size=10)
+        pipeline.start()
+        # The repeat arrives while the first copy is still being generated
+        await pipeline.run(mentions("0", *(str(i) for i in range(100))))
+        await pipeline.drain()
+        await pipeline.stop()
+        metrics = pipeline.metrics()
+        assert metrics.duplicates == 1
+        assert metrics.stages["generate"].processed == 100  # noqa: PLR2004
+        assert metrics.in_flight == 0
+
+    asyncio.run(run())
+
+    # Every generate worker was busy at once
+    assert peak == 50  # noqa: PLR2004
+    assert sorted(posted) == sorted((str(i), f"re {i}") for i in range(100))
+
+
+def test_failed_mention_does_not_stop_the_stage() -> None:
+    """Test a failing generation drops its mention and the rest are posted"""
+    posted: list[str] = []
+
+    async def generate(tweet: dict) -> str:
+        if tweet["id_str"] == "2":
+            raise RuntimeError
+        return "ok"
+
+    async def post(tweet: dict, _reply: str) -> None:
+        posted.append(tweet["id_str"])
+
+    async def run() -> int:
+        pipeline = MentionPipeline(generate, post, generate_workers=1, queue_size=1)
+        pipeline.start()
+        await pipeline.run(mentions("1", "2", "3"))
+        await pipeline.drain()
+        await pipeline.stop()
+        return pipeline.metrics().failed
+
+    assert asyncio.run(run()) == 1
+    assert posted == ["1", "3"]
@@ -0,0 +1,46 @@
+from flare_ai_social.twitter import SearchQuery, demultiplex, plan_queries
+
+
+def test_handles_are_packed_up_to_the_length_limit() -> None:
+    """Test accounts share OR queries without exceeding the limit"""
+    accounts = ["@aa", "@bb", "@cc", "@aa", "@a_very_long_handle"]
+
+    queries = plan_queries(accounts, max_length=14)
+
+    assert queries == [
+        SearchQuery("@aa OR @bb", ("@aa", "@bb")),
+        SearchQuery("@cc", ("@cc",)),
+        SearchQuery("@a_very_long_handle", ("@a_very_long_handle",)),
+    ]
+    assert all(len(q.query) <= 14 for q in queries[:2])  # noqa: PLR2004
+
+
+def test_tweets_are_demultiplexed_to_the_accounts_they_mention() -> None:
+    """Test each tweet is assigned once, to the first covered account it mentions"""
+
+    def tweet(tweet_id: str, *handles: str) -> dict:
+        mentions = [{"screen_name": handle} for handle in handles]
+        return {"id_str": tweet_id, "entities": {"user_mentions": mentions}}
+
+    tweets = [tweet("1", "BB"), tweet("2", "other", "aa", "bb"), tweet("3", "other")]
+
+    demuxed = demultiplex(tweets, ["@aa", "@bb", "@cc"])
+
+    assert {account: [t["id_str"] for t in ts] for account, ts in demuxed.items()} == {
+        "@aa": ["2"],
+        "@bb": ["1"],
+        "@cc": [],
+    }
+
+
+def test_accounts_per_query_are_capped() -> None:
+    """Test a query covers at most max_accounts accounts"""
+    accounts = [f"@u{i}" for i in range(5)]
+
+    queries = plan_queries(accounts, max_length=500, max_accounts=2)
+
+    assert [q.accounts for q in queries] == [
+        ("@u0", "@u1"),
+        ("@u2", "@u3"),
+        ("@u4",),
+    ]
@@ -0,0 +1,66 @@
+import pytest
+
+from flare_ai_social.quota import (
+    SOURCE_API,
+    SOURCE_TELEGRAM,
+    Limit,
+    QuotaExceededError,
+    QuotaManager,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_user_limit_does_not_block_others() -> None:
+    """Test a noisy user is throttled while other users are still served"""
+    clock = FakeClock()
+    quota = QuotaManager(
+        Limit(rate=10, burst=10),
+        user_limit=Limit(rate=0.1, burst=2),
+        clock=clock,
+    )
+
+    admitted = [quota.try_acquire(SOURCE_TELEGRAM, user=1) == 0 for _ in range(3)]
+
+    assert admitted == [True, True, False]
+    assert quota.try_acquire(SOURCE_TELEGRAM, user=2) == 0
+    with pytest.raises(QuotaExceededError) as exc_info:
+        quota.check(SOURCE_TELEGRAM, user=1)
+    assert exc_info.value.limit == "user"
+    assert 9 < exc_info.value.retry_after <= 10  # noqa: PLR2004
+    metrics = quota.metrics().sources[SOURCE_TELEGRAM]
+    assert metrics.throttled == {"user": 2}
+
+
+def test_idle_share_is_borrowed_but_not_drained() -> None:
+    """Test a source borrows unused capacity but leaves reserve for the others"""
+    clock = FakeClock()
+    quota = QuotaManager(
+        Limit(rate=1, burst=8),
+        weights={SOURCE_TELEGRAM: 1, SOURCE_API: 3},
+        clock=clock,
+    )
+
+    telegram = 0
+    while quota.try_acquire(SOURCE_TELEGRAM) == 0:
+        telegram += 1
+    api = 0
+    while quota.try_acquire(SOURCE_API) == 0:
+        api += 1
+
+    # Telegram's own share is 2; it borrows until the global bucket is half empty,
+    # and the API still gets the other half
+    assert telegram == 4  # noqa: PLR2004
+    assert api == 4  # noqa: PLR2004
+    metrics = quota.metrics().sources
+    assert metrics[SOURCE_TELEGRAM].borrowed == 2  # noqa: PLR2004
+    assert metrics[SOURCE_TELEGRAM].throttled == {"share": 1}
+    assert metrics[SOURCE_API].throttled == {"global": 1}
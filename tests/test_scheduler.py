@@ -0,0 +1,140 @@
+import asyncio
+import datetime as dt
+
+import pytest
+from telegram import Chat, Message, Update
+
+from flare_ai_social.telegram import ChatUpdateProcessor
+from flare_ai_social.telegram.scheduler import DropPolicy
+
+
+def make_update(update_id: int, chat_id: int, text: str = "hi") -> Update:
+    """Build a text message update in a chat"""
+    chat = Chat(chat_id, "private" if chat_id > 0 else "group")
+    now = dt.datetime.now(dt.UTC)
+    return Update(update_id, message=Message(update_id, now, chat, text=text))
+
+
+async def settle(processor: ChatUpdateProcessor) -> None:
+    """Wait until every queued update has been handled"""
+    while processor._workers:  # noqa: SLF001
+        await asyncio.gather(*list(processor._workers))  # noqa: SLF001
+
+
+def test_updates_run_in_order_per_chat_and_concurrently_across_chats() -> None:
+    """Test a slow handler delays its own chat but not other chats"""
+    processor = ChatUpdateProcessor()
+    handled: list[int] = []
+
+    async def handle(update_id: int, delay: float = 0) -> None:
+        await asyncio.sleep(delay)
+        handled.append(update_id)
+
+    async def run() -> None:
+        await processor.do_process_update(make_update(1, 10), handle(1, 0.02))
+        await processor.do_process_update(make_update(2, 10), handle(2))
+        await processor.do_process_update(make_update(3, 20), handle(3))
+        await settle(processor)
+
+    asyncio.run(run())
+
+    assert handled == [3, 1, 2]
+    assert processor.metrics().active_chats == 0
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    [("drop_oldest", [1, 3, 4]), ("drop_newest", [1, 2, 3])],
+)
+def test_full_chat_queue_drops_by_policy(
+    policy: DropPolicy, expected: list[int]
+) -> None:
+    """Test a flooded chat keeps a bounded queue, dropping per the policy"""
+    dropped: list[int] = []
+    processor = ChatUpdateProcessor(
+        {"data": 1},
+        max_chat_queue=2,
+        drop_policy=policy,
+        on_drop=lambda update: dropped.append(update.update_id),  # type: ignore[attr-defined]
+    )
+    handled: list[int] = []
+
+    async def run() -> None:
+        release = asyncio.Event()
+
+        async def handle(update_id: int) -> None:
+            if update_id == 1:
+                await release.wait()
+            handled.append(update_id)
+
+        await processor.do_process_update(make_update(1, 10), handle(1))
+        await asyncio.sleep(0)  # Update 1 starts running and leaves the queue
+        for update_id in (2, 3, 4):
+            await processor.do_process_update(
+                make_update(update_id, 10), handle(update_id)
+            )
+        release.set()
+        await settle(processor)
+
+    asyncio.run(run())
+
+    assert handled == expected
+    assert dropped == sorted({1, 2, 3, 4} - set(expected))
+    assert processor.metrics().lanes["data"].dropped == 1
+
+
+def test_saturated_lane_does_not_block_other_lanes() -> None:
+    """Test data lookups run while every generative slot is busy"""
+
+    def classify(update: object) -> str:
+        assert isinstance(update, Update)
+        assert update.message
+        return "data" if update.message.text == "/prices" else "generative"
+
+    processor = ChatUpdateProcessor({"data": 1, "generative": 1}, classify=classify)
+    handled: list[str] = []
+
+    async def run() -> list[str]:
+        release = asyncio.Event()
+
+        async def generate(chat_id: int) -> None:
+            await release.wait()
+            handled.append(f"generative {chat_id}")
+
+        async def lookup() -> None:
+            handled.append("data")
+
+        await processor.do_process_update(make_update(1, 10, "why?"), generate(10))
+        await processor.do_process_update(make_update(2, 20, "how?"), generate(20))
+        await processor.do_process_update(make_update(3, 30, "/prices"), lookup())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        before_release = list(handled)
+        metrics = processor.metrics().lanes["generative"]
+        assert (metrics.running, metrics.queued) == (1, 1)
+        release.set()
+        await settle(processor)
+        return before_release
+
+    assert asyncio.run(run()) == ["data"]
+    assert handled == ["data", "generative 10", "generative 20"]
+
+
+def test_unknown_lane_falls_back_to_default() -> None:
+    """Test an update classified into a missing lane runs in the first lane"""
+    processor = ChatUpdateProcessor(
+        {"data": 1, "generative": 1}, classify=lambda _update: "missing"
+    )
+    handled: list[int] = []
+
+    async def handle() -> None:
+        handled.append(1)
+
+    async def run() -> None:
+        await processor.do_process_update(make_update(1, 10), handle())
+        await settle(processor)
+
+    asyncio.run(run())
+
+    assert handled == [1]
+    assert processor.metrics().lanes["data"].latency.count == 1
@@ -0,0 +1,69 @@
+import asyncio
+
+import google.generativeai as genai
+import pytest
+
+from flare_ai_social.ai import ChatSessionPool, GeminiProvider, ModelResponse
+from flare_ai_social.storage import StateStore
+
+
+class EchoProvider(GeminiProvider):
+    """Gemini provider that answers locally, recording turns in the session"""
+
+    async def asend_session_message(
+        self, chat: genai.ChatSession, msg: str
+    ) -> ModelResponse:
+        chat.history = [
+            *chat.history,
+            {"role": "user", "parts": [msg]},
+            {"role": "model", "parts": [f"{len(chat.history) // 2 + 1}: {msg}"]},
+        ]
+        return ModelResponse(
+            text=chat.history[-1].parts[0].text, raw_response=None, metadata={}
+        )
+
+
+@pytest.fixture
+def provider() -> EchoProvider:
+    """Fixture to provide a provider that never calls the Gemini API"""
+    return EchoProvider(api_key="test", model_name="gemini-1.5-flash")
+
+
+def test_lru_eviction_spills_and_restores(provider: EchoProvider) -> None:
+    """Test evicted sessions resume with their capped history"""
+
+    async def run() -> tuple[list[str], list[str]]:
+        store = StateStore()
+        await store.open()
+        pool = ChatSessionPool(provider, max_sessions=2, max_history=4, store=store)
+        replies = [(await pool.send(1, f"q{i}")).text for i in range(3)]
+        await pool.send(2, "hello")
+        await pool.send(3, "hello")  # Evicts chat 1
+        assert pool.metrics().active == 2  # noqa: PLR2004
+        replies.append((await pool.send(1, "q3")).text)
+        spilled = await store.get("chat_sessions", "2")
+        await store.close()
+        return replies, [content["parts"][0] for content in spilled]
+
+    replies, spilled = asyncio.run(run())
+
+    # Only the last two exchanges survive the cap, so chat 1 resumes at turn 3
+    assert replies == ["1: q0", "2: q1", "3: q2", "3: q3"]
+    assert spilled == ["hello", "1: hello"]
+
+
+def test_idle_sessions_are_evicted(provider: EchoProvider) -> None:
+    """Test sessions idle past the timeout are dropped and reset is forgotten"""
+    now = [0.0]
+    pool = ChatSessionPool(provider, idle_timeout=60, clock=lambda: now[0])
+
+    async def run() -> list[str]:
+        replies = [(await pool.send(1, "a")).text, (await pool.send(1, "b")).text]
+        now[0] = 120
+        replies.append((await pool.send(1, "c")).text)
+        pool.reset(1)
+        replies.append((await pool.send(1, "d")).text)
+        return replies
+
+    assert asyncio.run(run()) == ["1: a", "2: b", "1: c", "1: d"]
+    assert pool.metrics().evicted == 1
@@ -0,0 +1,50 @@
+import asyncio
+from pathlib import Path
+
+from flare_ai_social.storage import StateStore
+
+
+def test_state_survives_reopen(tmp_path: Path) -> None:
+    """Test committed writes are visible to a new store on the same file"""
+
+    async def run() -> tuple[dict[str, int], str]:
+        store = StateStore(tmp_path / "state.db")
+        await store.open()
+        store.set("monitor_chats", "1", 1)
+        store.set("monitor_chats", "-2", -2)
+        store.set("monitor", "last_post_id", "abc")
+        store.delete("monitor_chats", "1")
+        await store.close()
+
+        reopened = StateStore(tmp_path / "state.db")
+        await reopened.open()
+        chats = await reopened.load("monitor_chats")
+        cursor = await reopened.get("monitor", "last_post_id")
+        await reopened.close()
+        return chats, cursor
+
+    chats, cursor = asyncio.run(run())
+
+    assert chats == {"-2": -2}
+    assert cursor == "abc"
+
+
+def test_load_includes_buffered_writes() -> None:
+    """Test reads see writes that have not been flushed yet"""
+
+    async def run() -> tuple[dict[str, int], int | None]:
+        store = StateStore(flush_interval=60)
+        await store.open()
+        store.set("chats", "1", 1)
+        await store.flush()
+        store.delete("chats", "1")
+        store.set("chats", "2", 2)
+        loaded = await store.load("chats")
+        missing = await store.get("chats", "1")
+        await store.close()
+        return loaded, missing
+
+    loaded, missing = asyncio.run(run())
+
+    assert loaded == {"2": 2}
+    assert missing is None
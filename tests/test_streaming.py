@@ -0,0 +1,90 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from telegram.constants import MessageLimit
+
+from flare_ai_social.telegram.streaming import StreamingReplier
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeChat:
+    """Chat with only a type"""
+
+    def __init__(self, chat_type: str) -> None:
+        self.type = chat_type
+
+
+class FakeMessage:
+    """Message recording the replies and edits sent for it"""
+
+    def __init__(self, chat_type: str = "private") -> None:
+        self.chat = FakeChat(chat_type)
+        self.sent: list[FakeMessage] = []
+        self.edits: list[str] = []
+
+    async def reply_text(self, text: str) -> "FakeMessage":
+        reply = FakeMessage(self.chat.type)
+        reply.edits.append(text)
+        self.sent.append(reply)
+        return reply
+
+    async def edit_text(self, text: str) -> None:
+        self.edits.append(text)
+
+
+async def stream(
+    clock: FakeClock, chunks: list[tuple[float, str]]
+) -> AsyncIterator[str]:
+    """Yield chunks, each arriving at its clock time"""
+    for at, chunk in chunks:
+        clock.now = at
+        yield chunk
+
+
+def test_edits_are_throttled_per_chat_type() -> None:
+    """Test edits wait for the interval and the final text is always shown"""
+    chunks = [(0.0, "a"), (0.5, "b"), (1.0, "c"), (1.2, "d"), (2.5, "e"), (2.6, "f")]
+    shown: dict[str, list[str]] = {}
+    for chat_type in ("private", "group"):
+        clock = FakeClock()
+        replier = StreamingReplier(
+            private_edit_interval=1.0, group_edit_interval=2.0, clock=clock
+        )
+        message = FakeMessage(chat_type)
+        full = asyncio.run(
+            replier.deliver(message, stream(clock, chunks))  # type: ignore[arg-type]
+        )
+        assert full == "abcdef"
+        assert len(message.sent) == 1
+        shown[chat_type] = message.sent[0].edits
+
+    assert shown["private"] == ["a", "abc", "abcde", "abcdef"]
+    assert shown["group"] == ["a", "abcde", "abcdef"]
+
+
+def test_long_first_send_is_split() -> None:
+    """Test an opening chunk over the message limit is sent as several messages"""
+    limit = MessageLimit.MAX_TEXT_LENGTH
+    words = ["word"] * limit
+    clock = FakeClock()
+    message = FakeMessage()
+    replier = StreamingReplier(clock=clock)
+
+    full = asyncio.run(
+        replier.deliver(message, stream(clock, [(0.0, " ".join(words))]))  # type: ignore[arg-type]
+    )
+
+    texts = [reply.edits[-1] for reply in message.sent]
+    assert len(texts) > 1
+    assert all(len(text) <= limit for text in texts)
+    assert " ".join(texts).split() == full.split() == words
+    assert replier.metrics().first_chunk.count == 1
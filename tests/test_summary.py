@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+import pytest
+
+from flare_ai_social.telegram import summary
+from flare_ai_social.telegram.summary import SummaryService
+
+
+class FakeModel:
+    """Summarizer upper-casing texts, optionally blocking until released"""
+
+    def __init__(self, *, block: bool = False) -> None:
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def __call__(self, text: str, **_kwargs: int) -> str:
+        self.entered.set()
+        self.release.wait(timeout=5)
+        return text.upper()
+
+
+def test_concurrent_requests_share_one_job(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test requests arriving within the batch window run as one executor job"""
+    monkeypatch.setattr(summary, "_load_model", FakeModel)
+    service = SummaryService(batch_window=0.05)
+
+    async def run() -> list[str]:
+        await service.start()
+        try:
+            return await asyncio.gather(*(service.summarize(t) for t in "abc"))
+        finally:
+            await service.stop()
+
+    assert asyncio.run(run()) == ["A", "B", "C"]
+    metrics = service.metrics()
+    assert (metrics.batches, metrics.batch_size_max) == (1, 3)
+
+
+def test_stop_fails_requests_held_by_the_dispatcher(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a batch waiting for a busy pool is failed by stop(), not left hanging"""
+    model = FakeModel(block=True)
+    monkeypatch.setattr(summary, "_load_model", lambda: model)
+    service = SummaryService(max_workers=1, batch_window=0.01)
+
+    async def run() -> str:
+        await service.start()
+        running = asyncio.create_task(service.summarize("one"))
+        await asyncio.to_thread(model.entered.wait, 5)
+        # The only worker is busy, so the dispatcher holds this one
+        held = asyncio.create_task(service.summarize("two"))
+        await asyncio.sleep(0.05)
+        stopping = asyncio.create_task(service.stop())
+        with pytest.raises(RuntimeError, match="not running"):
+            await asyncio.wait_for(held, timeout=1)
+        model.release.set()
+        await stopping
+        return await running
+
+    assert asyncio.run(run()) == "ONE"
+
+
+def test_text_is_unchanged_without_a_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a model that fails to load leaves replies as they are"""
+
+    def fail() -> None:
+        raise OSError
+
+    monkeypatch.setattr(summary, "_load_model", fail)
+    service = SummaryService()
+
+    async def run() -> str:
+        await service.start()
+        try:
+            return await service.summarize("a long reply")
+        finally:
+            await service.stop()
+
+    assert asyncio.run(run()) == "a long reply"
+    assert service.metrics().batches == 0
@@ -0,0 +1,113 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from flare_ai_social.api.routes.telegram import (
+    SECRET_TOKEN_HEADER,
+    TelegramWebhookRouter,
+)
+from flare_ai_social.telegram import replay
+
+if TYPE_CHECKING:
+    from telegram import Update
+
+SECRET = "s3cret"
+UPDATE = {
+    "update_id": 7,
+    "message": {
+        "message_id": 1,
+        "date": 1740830400,
+        "chat": {"id": -100, "type": "group"},
+        "text": "gm",
+    },
+}
+
+
+class FakeApplication:
+    """Application exposing only what the webhook route uses"""
+
+    def __init__(self, *, running: bool = True) -> None:
+        self.running = running
+        self.bot = None
+        self.update_queue: asyncio.Queue[Update] = asyncio.Queue()
+
+
+def make_app(application: FakeApplication | None) -> FastAPI:
+    """Mount the webhook router in front of an application"""
+    app = FastAPI()
+    router = TelegramWebhookRouter(lambda: application, SECRET)  # type: ignore[arg-type,return-value]
+    app.include_router(router.router)
+    return app
+
+
+@pytest.mark.parametrize("headers", [{}, {SECRET_TOKEN_HEADER: "wrong"}])
+def test_bad_secret_is_forbidden(headers: dict[str, str]) -> None:
+    """Test a missing or wrong secret token is rejected before queueing"""
+    application = FakeApplication()
+    client = TestClient(make_app(application))
+
+    response = client.post("/webhook", json=UPDATE, headers=headers)
+
+    assert response.status_code == 403  # noqa: PLR2004
+    assert application.update_queue.empty()
+
+
+@pytest.mark.parametrize("application", [None, FakeApplication(running=False)])
+def test_stopped_bot_is_unavailable(application: FakeApplication | None) -> None:
+    """Test updates are refused while the bot is not running, so Telegram retries"""
+    client = TestClient(make_app(application))
+
+    response = client.post(
+        "/webhook", json=UPDATE, headers={SECRET_TOKEN_HEADER: SECRET}
+    )
+
+    assert response.status_code == 503  # noqa: PLR2004
+
+
+def test_valid_update_is_queued() -> None:
+    """Test an authenticated update is decoded onto the update queue"""
+    application = FakeApplication()
+    client = TestClient(make_app(application))
+
+    response = client.post(
+        "/webhook", json=UPDATE, headers={SECRET_TOKEN_HEADER: SECRET}
+    )
+
+    assert response.status_code == 200  # noqa: PLR2004
+    update = application.update_queue.get_nowait()
+    assert update.update_id == UPDATE["update_id"]
+    assert update.message
+    assert update.message.text == "gm"
+
+
+def test_replay_posts_recorded_updates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the replay tool posts each recorded update with the secret token"""
+    application = FakeApplication()
+    transport = httpx.ASGITransport(make_app(application))
+    real_client = httpx.AsyncClient
+
+    def client(**kwargs: Any) -> httpx.AsyncClient:
+        return real_client(transport=transport, **kwargs)
+
+    monkeypatch.setattr(replay.httpx, "AsyncClient", client)
+    record = tmp_path / "updates.jsonl"
+    second = UPDATE | {"update_id": 8}
+    record.write_text(f"{json.dumps(UPDATE)}\n\n{json.dumps(second)}\n")
+
+    updates = replay.load_updates(record)
+    statuses, latency = asyncio.run(
+        replay.replay(updates, "http://bot.test/webhook", SECRET)
+    )
+
+    assert statuses == {200: 2}
+    assert latency.snapshot().count == 2  # noqa: PLR2004
+    queued = [application.update_queue.get_nowait().update_id for _ in range(2)]
+    assert queued == [7, 8]